@@ -23,16 +23,23 @@ import redis
 from datetime import datetime, timezone
 
 # For type hints
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-# For deterministic hashing
-import hashlib
+# For grouping pipelined value commands by data type
+from collections import defaultdict
+
+# For collecting the digests of the scanned keys in a packed array
+import array
+
+# For detecting changed and deleted keys without keeping every key hash in state
+from key_digest_store import KeyDigestStore
 
 # For implementing retry logic with exponential backoff
 import time
 
-# Checkpoint after processing every 1000 keys
+# Checkpoint after scanning every 1000 keys, or every tenth of the key digest store if that is larger
 __CHECKPOINT_INTERVAL = 1000
+__CHECKPOINTS_PER_STORE = 10
 
 # Batch size for key scanning
 __BATCH_SIZE = 100
@@ -40,6 +47,9 @@ __BATCH_SIZE = 100
 # DragonflyDB SCAN count parameter for pagination
 __SCAN_COUNT = 100
 
+# Data types reported by TYPE for RedisTimeSeries keys
+__TIMESERIES_TYPES = ("tsdb-type", "timeseries")
+
 # Default DragonflyDB port
 __DEFAULT_DRAGONFLY_PORT = 6379
 
@@ -193,21 +203,15 @@ def close_dragonfly_client(dragonfly_client):
         log.warning(f"Unexpected error closing connection: {e}")
 
 
-def is_timeseries_key(dragonfly_client, key: str) -> bool:
+def is_timeseries_type(key_type: str) -> bool:
     """
-    Check if a key is a TimeSeries key.
+    Check if a data type reported by the TYPE command belongs to a TimeSeries key.
     Args:
-        dragonfly_client: DragonflyDB client instance.
-        key: Key to check.
+        key_type: Data type returned by TYPE.
     Returns:
-        True if the key is a TimeSeries, False otherwise.
+        True if the type is a TimeSeries type, False otherwise.
     """
-    try:
-        key_type = dragonfly_client.type(key)
-        return key_type.lower() in ["tsdb-type", "timeseries"]
-    except redis.ConnectionError as e:
-        log.warning(f"The supplied key is not a timeseries key '{key}': {e}")
-        return False
+    return key_type.lower() in __TIMESERIES_TYPES
 
 
 def get_timeseries_range(
@@ -273,95 +277,144 @@ def sync_timeseries_key(
     return count, max_timestamp
 
 
-def extract_value_by_type(dragonfly_client, key: str, key_type: str) -> Tuple[str, int]:
+def queue_value_command(pipeline, key: str, key_type: str) -> bool:
     """
-    Extract value and size based on data type.
+    Queue the type-specific command that fetches the whole value of a key on a pipeline.
     Args:
-        dragonfly_client: DragonflyDB client instance.
+        pipeline: DragonflyDB pipeline the command is queued on.
         key: Key name.
         key_type: Data type (string, hash, list, set, zset).
     Returns:
-        Tuple of (value, size).
+        True if a command was queued, False if the data type is not supported.
     """
     if key_type == "string":
-        value = dragonfly_client.get(key)
-        size = len(value) if value else 0
-        return value, size
-
+        pipeline.get(key)
     elif key_type == "hash":
-        data = dragonfly_client.hgetall(key)
-        return json.dumps(data), len(data)
-
+        pipeline.hgetall(key)
     elif key_type == "list":
-        data = dragonfly_client.lrange(key, 0, -1)
+        pipeline.lrange(key, 0, -1)
+    elif key_type == "set":
+        pipeline.smembers(key)
+    elif key_type == "zset":
+        pipeline.zrange(key, 0, -1, withscores=True)
+    else:
+        return False
+    return True
+
+
+def format_value_by_type(key_type: str, data) -> Tuple[str, int]:
+    """
+    Convert the reply of a value command into the value and size stored in the destination.
+    Args:
+        key_type: Data type (string, hash, list, set, zset).
+        data: Reply of the command queued by queue_value_command.
+    Returns:
+        Tuple of (value, size).
+    """
+    if key_type == "string":
+        size = len(data) if data else 0
+        return data, size
+
+    elif key_type in ("hash", "list"):
         return json.dumps(data), len(data)
 
     elif key_type == "set":
-        data = list(dragonfly_client.smembers(key))
-        return json.dumps(data), len(data)
+        return json.dumps(list(data)), len(data)
 
     elif key_type == "zset":
-        zset_data = dragonfly_client.zrange(key, 0, -1, withscores=True)
-        zset_list = [[member, score] for member, score in zset_data]
-        return json.dumps(zset_list), len(zset_data)
+        zset_list = [[member, score] for member, score in data]
+        return json.dumps(zset_list), len(data)
 
     else:
         return f"Unsupported type: {key_type}", 0
 
 
-def compute_key_hash(dragonfly_client, key: str) -> str:
+def inspect_keys(dragonfly_client, keys: List[str]) -> List[tuple]:
     """
-    Compute a deterministic hash for a key's value to detect changes for incremental sync.
-    Uses MD5 for deterministic hashing across runs.
+    Collect the type and TTL of every key in a SCAN page with a single pipelined round trip.
+    Per-key failures are returned in place of the reply instead of aborting the whole page.
     Args:
-        dragonfly_client: The DragonflyDB client instance.
-        key: The key to compute hash for.
+        dragonfly_client: DragonflyDB client instance.
+        keys: Keys returned by one SCAN call.
     Returns:
-        Hash string representing the key's current value state.
+        List of (key, key_type, ttl) tuples in SCAN order, where key_type or ttl may be an exception.
     """
-    try:
-        key_type = dragonfly_client.type(key)
-        value, _ = extract_value_by_type(dragonfly_client, key, key_type)
-        hash_input = f"{key_type}:{value}"
-        return hashlib.md5(hash_input.encode("utf-8")).hexdigest()
-    except redis.RedisError as e:
-        log.warning(f"Failed to compute hash for key '{key}': {e}")
-        return ""
+    pipeline = dragonfly_client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.type(key)
+        pipeline.ttl(key)
+    replies = pipeline.execute(raise_on_error=False)
+    return [(key, replies[2 * index], replies[2 * index + 1]) for index, key in enumerate(keys)]
 
 
-def get_key_info(dragonfly_client, key: str) -> dict:
+def fetch_values(dragonfly_client, key_types: Dict[str, str]) -> Dict[str, object]:
     """
-    Get comprehensive information about a key including value, type, TTL, and size.
+    Fetch the values of many keys with a single pipelined round trip.
+    Commands are queued grouped by data type, so that the server runs the same command back to back.
     Args:
-        dragonfly_client: The DragonflyDB client instance.
-        key: The key to get information for.
+        dragonfly_client: DragonflyDB client instance.
+        key_types: Dictionary mapping keys to their data type.
+    Returns:
+        Dictionary mapping keys to a (value, size) tuple, or to the exception raised for that key.
+    """
+    keys_by_type = defaultdict(list)
+    for key, key_type in key_types.items():
+        keys_by_type[key_type].append(key)
+
+    values = {}
+    queued_keys = []
+    pipeline = dragonfly_client.pipeline(transaction=False)
+    for key_type, typed_keys in keys_by_type.items():
+        for key in typed_keys:
+            if queue_value_command(pipeline, key, key_type):
+                queued_keys.append((key, key_type))
+            else:
+                values[key] = format_value_by_type(key_type, None)
+
+    if queued_keys:
+        replies = pipeline.execute(raise_on_error=False)
+        for (key, key_type), reply in zip(queued_keys, replies):
+            if isinstance(reply, Exception):
+                values[key] = reply
+            else:
+                values[key] = format_value_by_type(key_type, reply)
+
+    return values
+
+
+def build_key_record(key: str, key_type: str, ttl: int, value: str, size: int) -> dict:
+    """
+    Build the destination record for a key.
+    Args:
+        key: Key name.
+        key_type: Data type of the key.
+        ttl: Time to live in seconds.
+        value: Value of the key as stored in the destination.
+        size: Size metric of the value.
     Returns:
         Dictionary containing key information.
     """
-    try:
-        key_type = dragonfly_client.type(key)
-        ttl = dragonfly_client.ttl(key)
-        value, size = extract_value_by_type(dragonfly_client, key, key_type)
+    return {
+        "key": key,
+        "value": value,
+        "data_type": key_type,
+        "ttl": ttl,
+        "last_modified": datetime.now(timezone.utc).isoformat(),
+        "size": size,
+    }
 
-        return {
-            "key": key,
-            "value": value,
-            "data_type": key_type,
-            "ttl": ttl,
-            "last_modified": datetime.now(timezone.utc).isoformat(),
-            "size": size,
-        }
 
-    except redis.RedisError as e:
-        log.warning(f"Failed to get info for key '{key}': {e}")
-        return {
-            "key": key,
-            "value": f"Error: {str(e)}",
-            "data_type": "error",
-            "ttl": -2,
-            "last_modified": datetime.now(timezone.utc).isoformat(),
-            "size": 0,
-        }
+def build_error_record(key: str, error: Exception) -> dict:
+    """
+    Build the destination record for a key that could not be read.
+    Args:
+        key: Key name.
+        error: Error raised while reading the key.
+    Returns:
+        Dictionary containing the error in place of the key information.
+    """
+    log.warning(f"Failed to get info for key '{key}': {error}")
+    return build_key_record(key, "error", -2, f"Error: {str(error)}", 0)
 
 
 def scan_keys(
@@ -390,27 +443,40 @@ def process_batch(
     dragonfly_client,
     keys: List[str],
     table_name: str,
-    previous_key_hashes: Dict[str, str],
+    previous_key_digests: KeyDigestStore,
     timeseries_state: Dict[str, int],
-) -> Tuple[int, Dict[str, str], Dict[str, int]]:
+) -> Tuple[int, Dict[str, int], Dict[str, int]]:
     """
     Process a batch of keys and upsert them to the destination.
+    The batch is inspected with two pipelined round trips: one collecting the type and TTL of every key,
+    and one fetching the values of the regular keys, which are used for both change detection and the upsert.
     Detects TimeSeries keys and syncs them incrementally.
-    Only processes regular keys that are new or have changed since last sync.
+    Only upserts regular keys that are new or have changed since last sync.
     Args:
         dragonfly_client: DragonflyDB client instance.
         keys: List of keys to process.
         table_name: Destination table name.
-        previous_key_hashes: Dictionary of key -> hash from previous sync.
+        previous_key_digests: Store of key digests from previous sync.
         timeseries_state: Dictionary mapping TimeSeries keys to their last synced timestamp.
     Returns:
-        Tuple of (number of records processed, updated key hashes, updated timeseries state).
+        Tuple of (number of records processed, key digests of the batch, updated timeseries state).
     """
     batch_row_count = 0
-    current_key_hashes = {}
-
-    for key in keys:
-        if is_timeseries_key(dragonfly_client, key):
+    current_key_digests = {}
+    key_types = {}
+    key_ttls = {}
+
+    for key, key_type, ttl in inspect_keys(dragonfly_client, keys):
+        if isinstance(key_type, Exception) or isinstance(ttl, Exception):
+            error = key_type if isinstance(key_type, Exception) else ttl
+            current_key_digests[key] = KeyDigestStore.ERROR_DIGEST
+
+            # The 'upsert' operation is used to insert or update data in the destination table.
+            # The first argument is the name of the destination table.
+            # The second argument is a dictionary containing the record to be upserted.
+            op.upsert(table=table_name, data=build_error_record(key, error))
+            batch_row_count += 1
+        elif is_timeseries_type(key_type):
             last_ts = timeseries_state.get(key, 0)
             count, max_ts = sync_timeseries_key(dragonfly_client, key, table_name, last_ts)
             batch_row_count += count
@@ -422,52 +488,64 @@ def process_batch(
                 f"Synced {count} data points from TimeSeries key '{key}' (timestamp: {max_ts})"
             )
         else:
-            current_hash = compute_key_hash(dragonfly_client, key)
-            current_key_hashes[key] = current_hash
-            previous_hash = previous_key_hashes.get(key)
+            key_types[key] = key_type
+            key_ttls[key] = ttl
 
-            if current_hash != previous_hash:
-                key_info = get_key_info(dragonfly_client, key)
+    values = fetch_values(dragonfly_client, key_types) if key_types else {}
 
-                # The 'upsert' operation is used to insert or update data in the destination table.
-                # The first argument is the name of the destination table.
-                # The second argument is a dictionary containing the record to be upserted.
-                op.upsert(table=table_name, data=key_info)
-                batch_row_count += 1
+    for key, key_type in key_types.items():
+        value = values[key]
+        previous_digest = previous_key_digests.get(key)
+        if isinstance(value, Exception):
+            current_key_digests[key] = KeyDigestStore.ERROR_DIGEST
+            record = build_error_record(key, value)
+        else:
+            value, size = value
+            current_digest = KeyDigestStore.compute_digest(key_type, value)
+            current_key_digests[key] = current_digest
+            if current_digest == previous_digest:
+                continue
+            record = build_key_record(key, key_type, key_ttls[key], value, size)
+
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The first argument is the name of the destination table.
+        # The second argument is a dictionary containing the record to be upserted.
+        op.upsert(table=table_name, data=record)
+        batch_row_count += 1
 
-                if previous_hash:
-                    log.info(f"Key modified: {key}")
-                else:
-                    log.info(f"New key detected: {key}")
+        if previous_digest is not None:
+            log.info(f"Key modified: {key}")
+        else:
+            log.info(f"New key detected: {key}")
 
-    return batch_row_count, current_key_hashes, timeseries_state
+    return batch_row_count, current_key_digests, timeseries_state
 
 
 def handle_deleted_keys(
-    previous_key_hashes: Dict[str, str], current_key_hashes: Dict[str, str], table_name: str
+    previous_key_digests: KeyDigestStore, current_key_digests: KeyDigestStore, table_name: str
 ) -> int:
     """
     Detect and handle keys that have been deleted from DragonflyDB.
+    Both stores are sorted by key, so the deleted keys are found with a single merge pass.
     Args:
-        previous_key_hashes: Dictionary of key -> hash from previous sync.
-        current_key_hashes: Dictionary of key -> hash from current sync.
+        previous_key_digests: Store of key digests from previous sync.
+        current_key_digests: Store of key digests from current sync.
         table_name: Destination table name.
     Returns:
         Number of deleted keys processed.
     """
     deleted_count = 0
-    deleted_keys = set(previous_key_hashes.keys()) - set(current_key_hashes.keys())
-
-    if deleted_keys:
-        log.info(f"Detected {len(deleted_keys)} deleted keys: {deleted_keys}")
 
-    for key in deleted_keys:
+    for key in previous_key_digests.deleted_keys(current_key_digests):
         # The 'delete' operation removes a record from the destination table.
         # It uses the primary key value to identify which record to delete.
-        op.delete(table=table_name, key=key)
+        op.delete(table=table_name, keys={"key": key})
         log.info(f"Key deleted: {key}")
         deleted_count += 1
 
+    if deleted_count:
+        log.info(f"Detected {deleted_count} deleted keys")
+
     return deleted_count
 
 
@@ -478,12 +556,19 @@ def sync_dragonfly_data(
     batch_size: int,
     cursor: int,
     current_sync_time: str,
-    previous_key_hashes: Dict[str, str],
+    previous_key_digests: KeyDigestStore,
     timeseries_state: Dict[str, int],
-) -> Tuple[int, Dict[str, str], Dict[str, int]]:
+    resumed_key_digests: Optional[KeyDigestStore] = None,
+) -> Tuple[int, KeyDigestStore, Dict[str, int]]:
     """
     Sync DragonflyDB data by scanning and processing keys in batches.
     Supports both regular keys and TimeSeries keys with incremental sync.
+    The digests of the scanned keys are collected in a packed array and sorted into a new store once the scan
+    completes. Checkpoints taken during the scan keep the previous store, so an interrupted sync resumes with
+    the same change detection baseline, along with the digests of the keys scanned so far, so the resumed scan
+    still ends with the digests of every key. Both stores are written on each checkpoint, so the checkpoint
+    interval grows with the size of the previous store, which bounds the state written by a sync to a fixed
+    multiple of the store.
     Args:
         dragonfly_client: DragonflyDB client instance.
         table_name: Destination table name.
@@ -491,15 +576,26 @@ def sync_dragonfly_data(
         batch_size: Number of keys to process per batch.
         cursor: Starting cursor position.
         current_sync_time: Current sync timestamp.
-        previous_key_hashes: Dictionary of key -> hash from previous sync.
+        previous_key_digests: Store of key digests from previous sync.
         timeseries_state: Dictionary mapping TimeSeries keys to their last synced timestamp.
+        resumed_key_digests: Store of the keys scanned before the interruption of a resumed scan, or None.
     Returns:
-        Tuple of (total records processed, updated key hashes, updated timeseries state).
+        Tuple of (total records processed, store of current key digests, updated timeseries state).
     """
     row_count = 0
     batch_count = 0
     total_keys_processed = 0
-    all_current_key_hashes = {}
+    keys_since_checkpoint = 0
+    # A scan resumed from a state without the keys scanned before the interruption cannot detect deleted keys
+    is_partial_scan = cursor != 0 and resumed_key_digests is None
+    if resumed_key_digests is None:
+        resumed_key_digests = KeyDigestStore()
+    scanned_keys = []
+    scanned_digests = array.array("Q")
+    encoded_previous_key_digests = previous_key_digests.encode()
+    checkpoint_interval = max(
+        __CHECKPOINT_INTERVAL, len(previous_key_digests) // __CHECKPOINTS_PER_STORE
+    )
 
     log.info(f"Starting key scan with pattern: {key_pattern}, batch size: {batch_size}")
 
@@ -515,18 +611,32 @@ def sync_dragonfly_data(
                 break
             continue
 
-        batch_row_count, batch_key_hashes, timeseries_state = process_batch(
-            dragonfly_client, keys, table_name, previous_key_hashes, timeseries_state
+        batch_row_count, batch_key_digests, timeseries_state = process_batch(
+            dragonfly_client, keys, table_name, previous_key_digests, timeseries_state
         )
         row_count += batch_row_count
         total_keys_processed += batch_row_count
-        all_current_key_hashes.update(batch_key_hashes)
+        scanned_keys.extend(batch_key_digests.keys())
+        scanned_digests.extend(batch_key_digests.values())
+        keys_since_checkpoint += len(keys)
 
-        # Save the progress by checkpointing the state after every batch. This ensures that the sync process can resume
-        # from the correct position in case of next sync or interruptions, even if no new/modified keys are found.
+        # Save the progress by checkpointing the state every checkpoint_interval scanned keys. This ensures that the
+        # sync process can resume from the correct position in case of next sync or interruptions, even if no
+        # new/modified keys are found.
         # Learn more about how and where to checkpoint by reading our best practices documentation
         # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
-        save_state(cursor, current_sync_time, all_current_key_hashes, timeseries_state)
+        if keys_since_checkpoint >= checkpoint_interval and cursor != 0:
+            scanned_key_digests = resumed_key_digests.merged_with(
+                KeyDigestStore.from_unsorted(scanned_keys, scanned_digests)
+            )
+            save_state(
+                cursor,
+                current_sync_time,
+                encoded_previous_key_digests,
+                timeseries_state,
+                scanned_key_digests=scanned_key_digests.encode(),
+            )
+            keys_since_checkpoint = 0
 
         log.info(
             f"Completed batch {batch_count}: processed {batch_row_count} records, "
@@ -536,11 +646,25 @@ def sync_dragonfly_data(
         if cursor == 0:
             break
 
-    deleted_count = handle_deleted_keys(previous_key_hashes, all_current_key_hashes, table_name)
+    current_key_digests = resumed_key_digests.merged_with(
+        KeyDigestStore.from_unsorted(scanned_keys, scanned_digests)
+    )
+
+    if is_partial_scan:
+        # The state did not hold the keys scanned before the interruption, so they are not in the current store.
+        # Deleted keys are detected on the next full scan instead, and the keys not seen keep their previous digests.
+        log.info("Resumed scan, deleted key detection is deferred to the next full scan")
+        return (
+            total_keys_processed,
+            previous_key_digests.merged_with(current_key_digests),
+            timeseries_state,
+        )
+
+    deleted_count = handle_deleted_keys(previous_key_digests, current_key_digests, table_name)
     if deleted_count > 0:
         log.info(f"Processed {deleted_count} deleted keys")
 
-    return total_keys_processed, all_current_key_hashes, timeseries_state
+    return total_keys_processed, current_key_digests, timeseries_state
 
 
 def update(configuration: dict, state: dict):
@@ -563,23 +687,28 @@ def update(configuration: dict, state: dict):
     batch_size = int(configuration.get("batch_size", __BATCH_SIZE))
 
     cursor = state.get("cursor", 0)
-    previous_key_hashes = state.get("key_hashes", {})
+    previous_key_digests = KeyDigestStore.from_state(state)
+    # Digests of the keys scanned before an interruption, saved by the checkpoints taken during a scan
+    resumed_key_digests = None
+    if cursor != 0 and state.get("scanned_key_digests"):
+        resumed_key_digests = KeyDigestStore.decode(state["scanned_key_digests"])
     timeseries_state = state.get("timeseries_state", {})
     current_sync_time = datetime.now(timezone.utc).isoformat()
 
     try:
-        total_records_processed, current_key_hashes, timeseries_state = sync_dragonfly_data(
+        total_records_processed, current_key_digests, timeseries_state = sync_dragonfly_data(
             dragonfly_client,
             table_name,
             key_pattern,
             batch_size,
             cursor,
             current_sync_time,
-            previous_key_hashes,
+            previous_key_digests,
             timeseries_state,
+            resumed_key_digests,
         )
 
-        save_state(0, current_sync_time, current_key_hashes, timeseries_state)
+        save_state(0, current_sync_time, current_key_digests.encode(), timeseries_state)
 
         log.info(f"Successfully synced {total_records_processed} records from DragonflyDB")
 
@@ -594,22 +723,29 @@ def update(configuration: dict, state: dict):
 
 
 def save_state(
-    cursor: int, sync_time: str, key_hashes: Dict[str, str], timeseries_state: Dict[str, int]
+    cursor: int,
+    sync_time: str,
+    key_digests: dict,
+    timeseries_state: Dict[str, int],
+    scanned_key_digests: Optional[dict] = None,
 ):
     """
-    Save the current state including cursor position, sync time, key hashes, and TimeSeries timestamps.
+    Save the current state including cursor position, sync time, key digests, and TimeSeries timestamps.
     Args:
         cursor: Current cursor position for SCAN.
         sync_time: Current sync timestamp.
-        key_hashes: Dictionary mapping keys to their value hashes for change detection.
+        key_digests: Encoded KeyDigestStore holding the value digests used for change detection.
         timeseries_state: Dictionary mapping TimeSeries keys to their last synced timestamp.
+        scanned_key_digests: Encoded KeyDigestStore of the keys scanned so far, during a scan only.
     """
     new_state = {
         "cursor": cursor,
         "last_sync_time": sync_time,
-        "key_hashes": key_hashes,
+        "key_digests": key_digests,
         "timeseries_state": timeseries_state,
     }
+    if scanned_key_digests is not None:
+        new_state["scanned_key_digests"] = scanned_key_digests
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
     # from the correct position in case of next sync or interruptions.
     # Learn more about how and where to checkpoint by reading our best practices documentation
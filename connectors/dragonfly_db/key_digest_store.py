@@ -0,0 +1,240 @@
+"""Compact change-detection store for the DragonflyDB connector.
+Keeps one fixed-width 64-bit digest per key in a sorted, packed structure instead of a dictionary of hex MD5 strings,
+so that the checkpointed state stays small and deleted keys can be found with a linear merge.
+"""
+
+# For packing the digests into a fixed-width array of unsigned 64-bit integers
+import array
+
+# For encoding the packed store as JSON-compatible strings
+import base64
+
+# For compressing the sorted key names
+import zlib
+
+# For looking up keys with binary search
+import bisect
+
+# For deterministic hashing
+import hashlib
+
+# For serializing the sorted key names
+import json
+
+# For detecting the byte order of the platform
+import sys
+
+# For enabling Logs in your connector code
+from fivetran_connector_sdk import Logging as log
+
+# For type hints
+from typing import Dict, Iterator, List, Optional
+
+
+class KeyDigestStore:
+    """
+    Sorted store of 64-bit value digests, one per key.
+    Keys are kept in sorted order with their digests in an aligned array, so a lookup is a binary search
+    and comparing the stores of two syncs is a single merge of two sorted runs.
+    """
+
+    # Version of the encoded format stored in the connector state
+    _FORMAT_VERSION = 1
+
+    # Digest recorded for keys that could not be read
+    ERROR_DIGEST = 0
+
+    def __init__(self, keys: Optional[List[str]] = None, digests: Optional[array.array] = None):
+        """
+        Args:
+            keys: Key names in sorted order, without duplicates.
+            digests: Digests aligned with keys.
+        """
+        self.keys = keys if keys is not None else []
+        self.digests = digests if digests is not None else array.array("Q")
+
+    def __len__(self):
+        return len(self.keys)
+
+    @staticmethod
+    def compute_digest(key_type: str, value) -> int:
+        """
+        Compute a deterministic 64-bit digest of a key's value to detect changes for incremental sync.
+        The digest is the first 8 bytes of the MD5 hash the connector used to store as a hex string,
+        so hashes from older states can be converted without re-reading the values.
+        Args:
+            key_type: Data type of the key.
+            value: Value of the key as stored in the destination.
+        Returns:
+            The digest as an unsigned 64-bit integer.
+        """
+        hash_input = f"{key_type}:{value}"
+        return int.from_bytes(hashlib.md5(hash_input.encode("utf-8")).digest()[:8], "big")
+
+    @classmethod
+    def from_unsorted(cls, keys: List[str], digests: array.array) -> "KeyDigestStore":
+        """
+        Build a store from keys in scan order. SCAN may return a key more than once; the last digest wins.
+        Args:
+            keys: Key names in scan order.
+            digests: Digests aligned with keys.
+        Returns:
+            The sorted store.
+        """
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        sorted_keys = []
+        sorted_digests = array.array("Q")
+        for index in order:
+            if sorted_keys and sorted_keys[-1] == keys[index]:
+                sorted_digests[-1] = digests[index]
+            else:
+                sorted_keys.append(keys[index])
+                sorted_digests.append(digests[index])
+        return cls(sorted_keys, sorted_digests)
+
+    @classmethod
+    def from_hex_hashes(cls, key_hashes: Dict[str, str]) -> "KeyDigestStore":
+        """
+        Convert the key -> hex MD5 dictionary stored by earlier versions of the connector.
+        Args:
+            key_hashes: Dictionary of key -> hex MD5 hash.
+        Returns:
+            The equivalent store.
+        """
+        keys = sorted(key_hashes)
+        digests = array.array(
+            "Q", (int(key_hashes[key][:16], 16) if key_hashes[key] else 0 for key in keys)
+        )
+        return cls(keys, digests)
+
+    @classmethod
+    def from_state(cls, state: dict) -> "KeyDigestStore":
+        """
+        Load the store from the connector state.
+        A store that fails its summary check is discarded, which makes the next sync upsert every key.
+        Args:
+            state: The connector state.
+        Returns:
+            The store, empty on the first sync.
+        """
+        if "key_hashes" in state:
+            log.info("Converting key hashes from the previous state format")
+            return cls.from_hex_hashes(state["key_hashes"])
+
+        encoded = state.get("key_digests")
+        if not encoded:
+            return cls()
+
+        store = cls.decode(encoded)
+        if store is None:
+            log.warning("Key digest store could not be loaded, all keys will be re-synced")
+            return cls()
+        return store
+
+    @classmethod
+    def decode(cls, encoded: dict) -> Optional["KeyDigestStore"]:
+        """
+        Decode a store encoded with encode().
+        Args:
+            encoded: Dictionary holding the compressed key names, the packed digests, and a summary of the store.
+        Returns:
+            The store, or None if its format version is unknown or it does not match its summary.
+        """
+        if encoded.get("version") != cls._FORMAT_VERSION:
+            log.warning(f"Ignoring key digest store with unknown version {encoded.get('version')}")
+            return None
+
+        keys = json.loads(zlib.decompress(base64.b64decode(encoded["keys"])).decode("utf-8"))
+        digests = array.array("Q")
+        digests.frombytes(base64.b64decode(encoded["digests"]))
+        if sys.byteorder != "little":
+            digests.byteswap()
+
+        store = cls(keys, digests)
+        if store.summary() != encoded.get("summary"):
+            log.warning("Key digest store does not match its summary")
+            return None
+        return store
+
+    def encode(self) -> dict:
+        """
+        Encode the store for the connector state.
+        Returns:
+            Dictionary holding the compressed key names, the packed digests, and a summary of the store.
+        """
+        digests = array.array("Q", self.digests)
+        if sys.byteorder != "little":
+            digests.byteswap()
+        keys = json.dumps(self.keys, separators=(",", ":")).encode("utf-8")
+        return {
+            "version": self._FORMAT_VERSION,
+            "keys": base64.b64encode(zlib.compress(keys)).decode("ascii"),
+            "digests": base64.b64encode(digests.tobytes()).decode("ascii"),
+            "summary": self.summary(),
+        }
+
+    def summary(self) -> dict:
+        """
+        Summarize the store with its key count and an order-independent checksum of its digests.
+        Returns:
+            Dictionary with the key count and checksum.
+        """
+        checksum = 0
+        for digest in self.digests:
+            checksum ^= digest
+        return {"key_count": len(self.keys), "checksum": f"{checksum:016x}"}
+
+    def get(self, key: str) -> Optional[int]:
+        """
+        Look up the digest of a key.
+        Args:
+            key: Key name.
+        Returns:
+            The digest, or None if the key is not in the store.
+        """
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self.digests[index]
+        return None
+
+    def deleted_keys(self, current: "KeyDigestStore") -> Iterator[str]:
+        """
+        Find the keys of this store that are missing from a newer store by merging the two sorted runs.
+        Args:
+            current: Store built from the current sync.
+        Yields:
+            Key names present in this store only, in sorted order.
+        """
+        current_index = 0
+        current_count = len(current.keys)
+        for key in self.keys:
+            while current_index < current_count and current.keys[current_index] < key:
+                current_index += 1
+            if current_index == current_count or current.keys[current_index] != key:
+                yield key
+
+    def merged_with(self, newer: "KeyDigestStore") -> "KeyDigestStore":
+        """
+        Merge this store with a newer one, keeping the newer digest for keys present in both.
+        Args:
+            newer: Store whose digests take precedence.
+        Returns:
+            The merged store.
+        """
+        keys = []
+        digests = array.array("Q")
+        index, newer_index = 0, 0
+        while index < len(self.keys) or newer_index < len(newer.keys):
+            if newer_index == len(newer.keys) or (
+                index < len(self.keys) and self.keys[index] < newer.keys[newer_index]
+            ):
+                keys.append(self.keys[index])
+                digests.append(self.digests[index])
+                index += 1
+            else:
+                if index < len(self.keys) and self.keys[index] == newer.keys[newer_index]:
+                    index += 1
+                keys.append(newer.keys[newer_index])
+                digests.append(newer.digests[newer_index])
+                newer_index += 1
+        return KeyDigestStore(keys, digests)
@@ -30,10 +30,22 @@ from decimal import Decimal
 # ASNCLP names this table CD<source_table>, so EMPLOYEE → CDEMPLOYEE.
 __CD_TABLE = "CDEMPLOYEE"
 
-# Number of CD rows to process before writing an intermediate checkpoint.
+# Number of source rows to process before writing an intermediate checkpoint during the initial load.
 # Checkpointing regularly prevents re-processing large batches on retry.
 __CHECKPOINT_INTERVAL = 500
 
+# Default number of CD rows read per change window during incremental syncs.
+# Each window ends on a commit boundary and is followed by a checkpoint.
+__DEFAULT_CDC_WINDOW_SIZE = 5000
+
+# Default maximum number of primary keys held in memory when coalescing changes within a window.
+# Past this limit, the pending changes are emitted early and coalescing starts again.
+__DEFAULT_COALESCE_MAX_KEYS = 100000
+
+# Parameter marker for IBMSNAP_COMMITSEQ and IBMSNAP_INTENTSEQ values.
+# The cast gives the marker the column's bit data type, so the comparison can use the CD table index.
+__BIT_DATA_PARAMETER = "CAST(? AS VARCHAR(16) FOR BIT DATA)"
+
 
 def schema(configuration: dict):
     """
@@ -104,6 +116,32 @@ def validate_configuration(configuration: dict):
             f"Configuration value for 'port' must be between 1 and 65535, got: {port_number}"
         )
 
+    # cdc_window_size and coalesce_max_keys are optional; if provided, they must be positive integers.
+    for key in ("cdc_window_size", "coalesce_max_keys"):
+        if key not in configuration:
+            continue
+        try:
+            value = int(configuration[key])
+        except (ValueError, TypeError):
+            raise ValueError(
+                f"Configuration value for '{key}' must be an integer, got: '{configuration[key]}'"
+            )
+        if value < 1:
+            raise ValueError(f"Configuration value for '{key}' must be at least 1, got: {value}")
+
+
+def get_coalesce_max_keys(configuration: dict) -> int:
+    """
+    Read the change coalescing settings from the configuration.
+    Args:
+        configuration: a dictionary that holds the configuration settings for the connector.
+    Returns:
+        int: Maximum number of keys held for coalescing within a change window, or 0 if coalescing is disabled.
+    """
+    if str(configuration.get("coalesce_changes", "false")).strip().lower() != "true":
+        return 0
+    return int(configuration.get("coalesce_max_keys", __DEFAULT_COALESCE_MAX_KEYS))
+
 
 def create_connection_string(configuration: dict) -> str:
     """
@@ -280,66 +318,199 @@ def perform_initial_load(connection, schema_name: str, cd_schema: str) -> tuple:
     return commit_sequence_high_water_mark, intent_sequence_high_water_mark
 
 
-def process_cdc_changes(
-    connection, cd_schema: str, last_commit_sequence: str, last_intent_sequence: str
-) -> tuple:
+def to_bit_data(sequence_hex: str) -> bytes:
     """
-    Read all rows from the ASN Change Data table with a CDC position greater than
-    (last_commit_sequence, last_intent_sequence) and apply them to the destination.
+    Convert a hex string held in state back to the binary value stored in the CD table.
+    IBMSNAP_COMMITSEQ and IBMSNAP_INTENTSEQ are FOR BIT DATA columns, so they are bound as binary
+    parameters and compared directly against the column. Comparing HEX(column) against a string
+    would wrap the column in a function and prevent Db2 from using the CD table index.
+    Args:
+        sequence_hex: Hex string of a COMMITSEQ or INTENTSEQ value.
+    Returns:
+        bytes: The binary sequence value.
+    """
+    return bytes.fromhex(sequence_hex)
 
-    asncap writes one row to this CD table for every INSERT/UPDATE/DELETE it reads
-    from the Db2 transaction log — the connector never queries EMPLOYEE directly.
 
-    The cursor is a composite of (IBMSNAP_COMMITSEQ, IBMSNAP_INTENTSEQ). Both values
-    are required because multiple rows within the same transaction share the same
-    IBMSNAP_COMMITSEQ; using COMMITSEQ alone would re-process or skip rows when
-    resuming from a mid-commit checkpoint.
+def build_cursor_predicate(last_commit_sequence: str, last_intent_sequence: str) -> tuple:
+    """
+    Build the WHERE predicate selecting CD rows strictly after the (COMMITSEQ, INTENTSEQ) cursor.
+    The leading IBMSNAP_COMMITSEQ >= ? term gives Db2 an index start key; the OR term then excludes
+    the rows of the last commit that were already processed.
+    Args:
+        last_commit_sequence: Hex string of the last processed COMMITSEQ, or "0" to start from the beginning.
+        last_intent_sequence: Hex string of the last processed INTENTSEQ within that commit.
+    Returns:
+        tuple: (predicate_sql, parameters) for use with ibm_db.prepare() and ibm_db.execute().
+    """
+    if last_commit_sequence == "0":
+        return "1=1", ()
+
+    commit_sequence = to_bit_data(last_commit_sequence)
+    predicate = (
+        f"IBMSNAP_COMMITSEQ >= {__BIT_DATA_PARAMETER} "
+        f"AND (IBMSNAP_COMMITSEQ > {__BIT_DATA_PARAMETER} "
+        f"OR IBMSNAP_INTENTSEQ > {__BIT_DATA_PARAMETER})"
+    )
+    return predicate, (commit_sequence, commit_sequence, to_bit_data(last_intent_sequence))
+
+
+def execute_query(connection, query: str, parameters: tuple):
+    """
+    Prepare and execute a parameterised query.
+    Args:
+        connection: A connection object to the IBM Db2 database.
+        query: SQL text with parameter markers.
+        parameters: Values bound to the parameter markers, in order.
+    Returns:
+        statement: The executed statement, ready to fetch from.
+    Raises:
+        RuntimeError: if the statement cannot be prepared or executed.
+    """
+    statement = ibm_db.prepare(connection, query)
+    if not statement or not ibm_db.execute(statement, parameters):
+        raise RuntimeError(f"Failed to execute query: {ibm_db.stmt_errormsg()}")
+    return statement
+
+
+def get_window_end(
+    connection,
+    cd_schema: str,
+    last_commit_sequence: str,
+    last_intent_sequence: str,
+    sync_end_commit_sequence: str,
+    window_size: int,
+):
+    """
+    Find the last COMMITSEQ of the next change window.
+    The window covers the next window_size CD rows after the cursor, read in index order, and is then
+    extended to the end of the last commit it touches, so that a transaction is never split across windows.
+    Args:
+        connection: A connection object to the IBM Db2 database.
+        cd_schema: The Db2 schema that owns the ASN Change Data (CD) table.
+        last_commit_sequence: Hex string of the last processed COMMITSEQ.
+        last_intent_sequence: Hex string of the last processed INTENTSEQ within that commit.
+        sync_end_commit_sequence: Hex string of the last COMMITSEQ this sync processes.
+        window_size: Number of CD rows per window.
+    Returns:
+        str: Hex string of the window's last COMMITSEQ, or None if there are no more changes.
+    """
+    cursor_predicate, cursor_parameters = build_cursor_predicate(
+        last_commit_sequence, last_intent_sequence
+    )
+    query = (
+        f"SELECT HEX(MAX(IBMSNAP_COMMITSEQ)) AS COMMITSEQ_HEX FROM ("
+        f"SELECT IBMSNAP_COMMITSEQ FROM {cd_schema}.{__CD_TABLE} "
+        f"WHERE {cursor_predicate} AND IBMSNAP_COMMITSEQ <= {__BIT_DATA_PARAMETER} "
+        f"ORDER BY IBMSNAP_COMMITSEQ, IBMSNAP_INTENTSEQ "
+        f"FETCH FIRST {int(window_size)} ROWS ONLY) AS WINDOW_ROWS"
+    )
+    statement = execute_query(
+        connection, query, cursor_parameters + (to_bit_data(sync_end_commit_sequence),)
+    )
+    result_row = ibm_db.fetch_tuple(statement)
+    if not result_row or not result_row[0]:
+        return None
+    return str(result_row[0]).strip()
+
+
+def emit_change(change_operation: str, record: dict):
+    """
+    Apply one change to the destination.
 
     IBMSNAP_OPERATION values written by asncap:
       'I' – row was inserted  → op.upsert()
       'U' – row was updated   → op.upsert()  (new-image values)
       'D' – row was deleted   → op.delete()
 
+    Args:
+        change_operation: The IBMSNAP_OPERATION value of the change.
+        record: The normalised source-table record carried by the CD row.
+    """
+    if change_operation in ("I", "U"):
+        # INSERT or UPDATE: asncap wrote new-image values from the transaction log.
+        # Per-row detail is logged at fine level to avoid flooding logs on high-volume streams.
+        log.debug(
+            f"  LOG EVENT [{change_operation}] id={record.get('id')} — sourced from Db2 transaction log via asncap"
+        )
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The first argument is the name of the destination table.
+        # The second argument is a dictionary containing the record to be upserted.
+        op.upsert("employee", record)
+    elif change_operation == "D":
+        # DELETE: the CD row still carries the key so we know which row to remove.
+        # Per-row detail is logged at fine level to avoid flooding logs on high-volume streams.
+        log.debug(
+            f"  LOG EVENT [D] id={record.get('id')} — sourced from Db2 transaction log via asncap"
+        )
+        # The 'delete' operation is used to delete data in the destination table.
+        # The first argument is the name of the destination table.
+        # The second argument is a dictionary containing the record to be deleted.
+        op.delete("employee", {"id": record["id"]})
+
+
+def flush_pending_changes(pending_changes: dict) -> int:
+    """
+    Emit the coalesced changes in the order of their last operation and clear them.
+    Args:
+        pending_changes: Dictionary mapping primary keys to their last (change_operation, record).
+    Returns:
+        int: Number of operations emitted.
+    """
+    for change_operation, record in pending_changes.values():
+        emit_change(change_operation, record)
+    emitted_count = len(pending_changes)
+    pending_changes.clear()
+    return emitted_count
+
+
+def apply_cdc_window(
+    connection,
+    cd_schema: str,
+    last_commit_sequence: str,
+    last_intent_sequence: str,
+    window_end_commit_sequence: str,
+    coalesce_max_keys: int = 0,
+) -> tuple:
+    """
+    Read the CD rows of one change window in commit order and apply them to the destination.
+
+    When coalescing is enabled, only the last operation per primary key within the window is
+    emitted, because each CD row carries the full row image. Pending changes are held in memory
+    for at most coalesce_max_keys keys; past that limit they are emitted early and coalescing
+    starts again, which keeps the final destination state correct. All pending changes are
+    emitted before the window returns, so the checkpoint that follows still marks a position
+    up to which every change has been applied.
+
     Args:
         connection: A connection object to the IBM Db2 database.
         cd_schema: The Db2 schema that owns the ASN Change Data (CD) table.
         last_commit_sequence: Hex string of the last processed COMMITSEQ.
         last_intent_sequence: Hex string of the last processed INTENTSEQ within that commit.
-            IBMSNAP_INTENTSEQ is VARCHAR FOR BIT DATA and is always handled as a hex string.
+        window_end_commit_sequence: Hex string of the last COMMITSEQ included in the window.
+        coalesce_max_keys: Maximum number of keys held for coalescing, or 0 to emit every change.
     Returns:
-        tuple: (new_commit_sequence, new_intent_sequence) high-water mark after processing.
+        tuple: (new_commit_sequence, new_intent_sequence, row_count, emitted_count) after processing the window.
     """
-    # If no prior cursor exists, start from the very beginning of the CD table.
-    # Otherwise resume strictly after the last processed (COMMITSEQ, INTENTSEQ) pair so
-    # that rows within the same transaction are never skipped or re-applied on restart.
-    if last_commit_sequence == "0":
-        where_clause = "1=1"
-    else:
-        where_clause = (
-            f"(HEX(IBMSNAP_COMMITSEQ) > '{last_commit_sequence}' "
-            f"OR (HEX(IBMSNAP_COMMITSEQ) = '{last_commit_sequence}' "
-            f"AND HEX(IBMSNAP_INTENTSEQ) > '{last_intent_sequence}'))"
-        )
-
+    cursor_predicate, cursor_parameters = build_cursor_predicate(
+        last_commit_sequence, last_intent_sequence
+    )
     query = (
         f"SELECT IBMSNAP_OPERATION, HEX(IBMSNAP_COMMITSEQ) AS COMMITSEQ_HEX, HEX(IBMSNAP_INTENTSEQ) AS INTENTSEQ_HEX, "
         f"ID, FIRST_NAME, LAST_NAME, EMAIL, DEPARTMENT, CAST(SALARY AS DOUBLE) AS SALARY "
         f"FROM {cd_schema}.{__CD_TABLE} "
-        f"WHERE {where_clause} "
+        f"WHERE {cursor_predicate} AND IBMSNAP_COMMITSEQ <= {__BIT_DATA_PARAMETER} "
         f"ORDER BY IBMSNAP_COMMITSEQ, IBMSNAP_INTENTSEQ"
     )
-    log.info(
-        f"Incremental sync: reading from {cd_schema}.{__CD_TABLE} "
-        f"(populated by asncap from Db2 transaction log). "
-        f"Cursor = ({last_commit_sequence}, {last_intent_sequence})"
+    statement = execute_query(
+        connection, query, cursor_parameters + (to_bit_data(window_end_commit_sequence),)
     )
-    statement = ibm_db.exec_immediate(connection, query)
-    if not statement:
-        raise RuntimeError("Failed to query CD table.")
 
     current_commit_sequence = last_commit_sequence
     current_intent_sequence = last_intent_sequence  # hex string, same type as last_intent_sequence
     row_count = 0
+    emitted_count = 0
+    pending_changes = {} if coalesce_max_keys > 0 else None
 
     while True:
         database_row = ibm_db.fetch_assoc(statement)
@@ -359,66 +530,131 @@ def process_cdc_changes(
             }
         )
 
-        if change_operation in ("I", "U"):
-            # INSERT or UPDATE: asncap wrote new-image values from the transaction log.
-            # Per-row detail is logged at fine level to avoid flooding logs on high-volume streams.
-            log.debug(
-                f"  LOG EVENT [{change_operation}] id={record.get('id')} — sourced from Db2 transaction log via asncap"
-            )
-            # The 'upsert' operation is used to insert or update data in the destination table.
-            # The first argument is the name of the destination table.
-            # The second argument is a dictionary containing the record to be upserted.
-            op.upsert("employee", record)
-        elif change_operation == "D":
-            # DELETE: the CD row still carries the key so we know which row to remove.
-            # Per-row detail is logged at fine level to avoid flooding logs on high-volume streams.
-            log.debug(
-                f"  LOG EVENT [D] id={record.get('id')} — sourced from Db2 transaction log via asncap"
-            )
-            # The 'delete' operation is used to delete data in the destination table.
-            # The first argument is the name of the destination table.
-            # The second argument is a dictionary containing the record to be deleted.
-            op.delete("employee", {"id": record["id"]})
-        else:
+        if change_operation not in ("I", "U", "D"):
             log.warning(f"Unrecognised ASN operation '{change_operation}'; skipping row.")
+        elif pending_changes is None:
+            emit_change(change_operation, record)
+            emitted_count += 1
+        else:
+            # Only the last operation per key is kept. The key is re-inserted so that pending changes
+            # stay ordered by the position of their last operation.
+            pending_changes.pop(record["id"], None)
+            pending_changes[record["id"]] = (change_operation, record)
+            if len(pending_changes) >= coalesce_max_keys:
+                emitted_count += flush_pending_changes(pending_changes)
 
         row_count += 1
 
-        if row_count % __CHECKPOINT_INTERVAL == 0:
-            log.info(
-                f"CDC progress: {row_count} log event(s) processed so far. "
-                f"Current cursor = ({current_commit_sequence}, {current_intent_sequence})"
-            )
-            # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
-            # from the correct position in case of next sync or interruptions.
-            # You should checkpoint even if you are not using incremental sync, as it tells Fivetran it is safe to write to destination.
-            # For large datasets, checkpoint regularly (e.g., every N records) not only at the end.
-            # Learn more about how and where to checkpoint by reading our best practices documentation
-            # (https://fivetran.com/docs/connector-sdk/best-practices#optimizingperformancewhenhandlinglargedatasets).
-            op.checkpoint(
-                {
-                    "last_commit_sequence": current_commit_sequence,
-                    "last_intent_sequence": current_intent_sequence,
-                    "initial_load_complete": True,
-                }
-            )
+    # Emit the remaining coalesced changes before the caller checkpoints the end of the window
+    if pending_changes:
+        emitted_count += flush_pending_changes(pending_changes)
+
+    return current_commit_sequence, current_intent_sequence, row_count, emitted_count
+
 
+def process_cdc_changes(
+    connection,
+    cd_schema: str,
+    last_commit_sequence: str,
+    last_intent_sequence: str,
+    window_size: int = __DEFAULT_CDC_WINDOW_SIZE,
+    coalesce_max_keys: int = 0,
+) -> tuple:
+    """
+    Read all rows from the ASN Change Data table with a CDC position greater than
+    (last_commit_sequence, last_intent_sequence) and apply them to the destination.
+
+    asncap writes one row to this CD table for every INSERT/UPDATE/DELETE it reads
+    from the Db2 transaction log — the connector never queries EMPLOYEE directly.
+
+    The cursor is a composite of (IBMSNAP_COMMITSEQ, IBMSNAP_INTENTSEQ). Both values
+    are required because multiple rows within the same transaction share the same
+    IBMSNAP_COMMITSEQ; using COMMITSEQ alone would re-process or skip rows when
+    resuming from a mid-commit checkpoint.
+
+    Changes are read in bounded windows of about window_size rows, ending on a commit
+    boundary, and the cursor is checkpointed after each window. The sync stops at the
+    CD table's high-water mark captured when it started, so changes written while it
+    runs are left for the next sync instead of extending it indefinitely.
+
+    Args:
+        connection: A connection object to the IBM Db2 database.
+        cd_schema: The Db2 schema that owns the ASN Change Data (CD) table.
+        last_commit_sequence: Hex string of the last processed COMMITSEQ.
+        last_intent_sequence: Hex string of the last processed INTENTSEQ within that commit.
+            IBMSNAP_INTENTSEQ is VARCHAR FOR BIT DATA and is always handled as a hex string.
+        window_size: Number of CD rows to read per window before checkpointing.
+        coalesce_max_keys: Maximum number of keys held for coalescing changes within a window,
+            or 0 to emit every change.
+    Returns:
+        tuple: (new_commit_sequence, new_intent_sequence) high-water mark after processing.
+    """
     log.info(
-        f"CDC sync complete: {row_count} log event(s) applied from {cd_schema}.{__CD_TABLE}. "
-        f"New cursor = ({current_commit_sequence}, {current_intent_sequence})"
+        f"Incremental sync: reading from {cd_schema}.{__CD_TABLE} "
+        f"(populated by asncap from Db2 transaction log). "
+        f"Cursor = ({last_commit_sequence}, {last_intent_sequence})"
     )
-    # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
-    # from the correct position in case of next sync or interruptions.
-    # You should checkpoint even if you are not using incremental sync, as it tells Fivetran it is safe to write to destination.
-    # For large datasets, checkpoint regularly (e.g., every N records) not only at the end.
-    # Learn more about how and where to checkpoint by reading our best practices documentation
-    # (https://fivetran.com/docs/connector-sdk/best-practices#optimizingperformancewhenhandlinglargedatasets).
-    op.checkpoint(
-        {
-            "last_commit_sequence": current_commit_sequence,
-            "last_intent_sequence": current_intent_sequence,
-            "initial_load_complete": True,
-        }
+    sync_end_commit_sequence, _ = get_current_cdc_position(connection, cd_schema)
+    if sync_end_commit_sequence == "0":
+        log.info(f"{cd_schema}.{__CD_TABLE} is empty; no changes to apply.")
+        return last_commit_sequence, last_intent_sequence
+
+    current_commit_sequence = last_commit_sequence
+    current_intent_sequence = last_intent_sequence
+    row_count = 0
+    emitted_count = 0
+    window_count = 0
+
+    while True:
+        window_end_commit_sequence = get_window_end(
+            connection,
+            cd_schema,
+            current_commit_sequence,
+            current_intent_sequence,
+            sync_end_commit_sequence,
+            window_size,
+        )
+        if window_end_commit_sequence is None:
+            break
+
+        (
+            current_commit_sequence,
+            current_intent_sequence,
+            window_row_count,
+            window_emitted_count,
+        ) = apply_cdc_window(
+            connection,
+            cd_schema,
+            current_commit_sequence,
+            current_intent_sequence,
+            window_end_commit_sequence,
+            coalesce_max_keys,
+        )
+        row_count += window_row_count
+        emitted_count += window_emitted_count
+        window_count += 1
+
+        log.info(
+            f"CDC progress: window {window_count} applied {window_row_count} log event(s) "
+            f"as {window_emitted_count} operation(s), {row_count} so far. Current cursor = ({current_commit_sequence}, {current_intent_sequence})"
+        )
+        # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
+        # from the correct position in case of next sync or interruptions.
+        # You should checkpoint even if you are not using incremental sync, as it tells Fivetran it is safe to write to destination.
+        # For large datasets, checkpoint regularly (e.g., every N records) not only at the end.
+        # Learn more about how and where to checkpoint by reading our best practices documentation
+        # (https://fivetran.com/docs/connector-sdk/best-practices#optimizingperformancewhenhandlinglargedatasets).
+        op.checkpoint(
+            {
+                "last_commit_sequence": current_commit_sequence,
+                "last_intent_sequence": current_intent_sequence,
+                "initial_load_complete": True,
+            }
+        )
+
+    log.info(
+        f"CDC sync complete: {row_count} log event(s) applied from {cd_schema}.{__CD_TABLE} "
+        f"as {emitted_count} operation(s) in {window_count} window(s). New cursor = ({current_commit_sequence}, {current_intent_sequence})"
     )
     return current_commit_sequence, current_intent_sequence
 
@@ -476,6 +712,8 @@ def update(configuration: dict, state: dict):
                 cd_schema,
                 last_commit_sequence,
                 last_intent_sequence,
+                int(configuration.get("cdc_window_size", __DEFAULT_CDC_WINDOW_SIZE)),
+                get_coalesce_max_keys(configuration),
             )
             new_state = {
                 "last_commit_sequence": last_commit_sequence,
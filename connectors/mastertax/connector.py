@@ -20,6 +20,13 @@ import csv
 import uuid
 import zipfile
 import tempfile
+import threading
+from queue import Queue, Full
+from concurrent.futures import ThreadPoolExecutor
+
+# For parsing the tab-delimited extract files in batches
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 # Import required classes from fivetran_connector_sdk.
 # For supporting Connector operations like Update() and Schema()
@@ -31,7 +38,14 @@ from fivetran_connector_sdk import Logging as log
 # For supporting Data operations like Upsert(), Update(), Delete() and checkpoint()
 from fivetran_connector_sdk import Operations as op
 
-from constants import column_names, data_extracts
+from constants import (
+    column_names,
+    data_extracts,
+    DOWNLOAD_CHUNK_SIZE_BYTES,
+    READ_BLOCK_SIZE_BYTES,
+    MAX_FILE_WORKERS,
+    BUFFERED_BATCHES,
+)
 
 CERT_PATH = "SSL.crt"
 KEY_PATH = "SSL_auth.key"
@@ -39,6 +53,8 @@ KEY_PATH = "SSL_auth.key"
 RETRY_WAIT_SECONDS = 300
 MAX_RETRIES = 3
 MAX_STATUS_ATTEMPTS = 10
+QUEUE_POLL_SECONDS = 1
+FALLBACK_BATCH_ROWS = 10000
 
 
 def schema(configuration: dict):
@@ -76,7 +92,7 @@ def update(configuration: dict, state: dict):
 def sync_items(headers: dict, extract: dict):
     """
     For the specified extract, submit a request, then download the file once it is ready.
-    Once the file is downloaded, call the upsert_rows() function to send the rows to Fivetran.
+    Once the file is downloaded, call the upsert_files() function to send the rows of the layout files to Fivetran.
     :param headers: authentication headers for API
     :param extract: dictionary defining the extract to pull from MasterTax
     :return:
@@ -132,32 +148,158 @@ def sync_items(headers: dict, extract: dict):
         )
 
         matching_files = [
-            filename for filename in os.listdir(extract_path) if layout_name in filename
+            os.path.join(extract_path, filename)
+            for filename in os.listdir(extract_path)
+            if layout_name in filename
         ]
 
-        for file in matching_files:
-            full_path = os.path.join(extract_path, file)
-            log.debug(f"processing {full_path}")
-            upsert_rows(full_path, layout_name)
+        upsert_files(matching_files, layout_name)
 
     op.checkpoint({})
 
 
-def upsert_rows(filename: str, layout_name: str):
+def read_extract_batches(filename: str, layout_column_names: list):
     """
-    Gets column names for current layout and zips to each row, then upserts
+    Parses a tab-delimited extract file with the Arrow CSV reader, one block at a time.
+    The file has no header, so the layout column names are supplied, and every column is read as a string
+    exactly as the csv module would return it.
     :param filename: name of file to process
-    :param layout_name: name of layout to get column names for
-    :return:
+    :param layout_column_names: column names of the layout, in file order
+    :return: generator of pyarrow RecordBatches
     """
-
-    layout_column_names = column_names[layout_name]
-    log.debug(f"upserting rows for {filename}")
+    reader = pa_csv.open_csv(
+        filename,
+        read_options=pa_csv.ReadOptions(
+            column_names=layout_column_names, block_size=READ_BLOCK_SIZE_BYTES, encoding="utf8"
+        ),
+        parse_options=pa_csv.ParseOptions(delimiter="\t"),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in layout_column_names},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    for batch in reader:
+        if batch.num_rows:
+            yield batch
+
+
+def read_extract_rows(filename: str, layout_column_names: list):
+    """
+    Reads an extract file row by row with the csv module, in lists of rows.
+    Used for files the Arrow reader rejects, e.g. rows with more or fewer columns than the layout,
+    which are zipped to the column names as before.
+    :param filename: name of file to process
+    :param layout_column_names: column names of the layout, in file order
+    :return: generator of lists of row dictionaries
+    """
+    rows = []
     with open(filename, "r", newline="", encoding="utf-8") as file:
         reader = csv.reader(file, delimiter="\t")  # Tab-delimited
 
         for row in reader:
-            op.upsert(table=layout_name, data=dict(zip(layout_column_names, row)))
+            rows.append(dict(zip(layout_column_names, row)))
+            if len(rows) >= FALLBACK_BATCH_ROWS:
+                yield rows
+                rows = []
+    if rows:
+        yield rows
+
+
+def read_extract_file(filename: str, layout_column_names: list):
+    """
+    Reads an extract file in batches, falling back to the csv module if the Arrow reader rejects the file.
+    If the Arrow reader fails part way, the file is read again from the start; upserts are idempotent,
+    so the rows that were already emitted are simply upserted again.
+    :param filename: name of file to process
+    :param layout_column_names: column names of the layout, in file order
+    :return: generator of RecordBatches or lists of row dictionaries
+    """
+    try:
+        yield from read_extract_batches(filename, layout_column_names)
+    except pa.ArrowInvalid as e:
+        log.warning(f"falling back to row by row parsing for {filename}: {e}")
+        yield from read_extract_rows(filename, layout_column_names)
+
+
+def upsert_batch(layout_name: str, batch):
+    """
+    Upserts a batch of rows
+    A RecordBatch is converted one column at a time and the rows are assembled by zipping the columns,
+    which is much faster than converting it row by row with to_pylist().
+    :param layout_name: name of the layout, used as the table name
+    :param batch: a RecordBatch, or a list of row dictionaries
+    :return: number of rows upserted
+    """
+    if isinstance(batch, pa.RecordBatch):
+        columns = [column.to_numpy(zero_copy_only=False).tolist() for column in batch.columns]
+        rows = (dict(zip(batch.schema.names, values)) for values in zip(*columns))
+    else:
+        rows = batch
+
+    row_count = 0
+    for row in rows:
+        op.upsert(table=layout_name, data=row)
+        row_count += 1
+    return row_count
+
+
+def upsert_files(filenames: list, layout_name: str):
+    """
+    Parses several extract files concurrently and upserts their rows from the calling thread.
+    Each worker thread parses one file and hands its batches over through a shared bounded queue,
+    so at most BUFFERED_BATCHES parsed batches are held in memory, whatever the number or size of the files.
+    The files are independent, so batches are upserted in the order they are parsed.
+    :param filenames: names of files to process
+    :param layout_name: name of layout to get column names for
+    :return:
+    """
+    layout_column_names = column_names[layout_name]
+    batch_queue = Queue(maxsize=BUFFERED_BATCHES)
+    stop_event = threading.Event()
+    end_of_file = object()
+
+    def put(item):
+        # Wait while the queue is full, unless the consumer has stopped
+        while not stop_event.is_set():
+            try:
+                batch_queue.put(item, timeout=QUEUE_POLL_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    def read_file(filename):
+        try:
+            log.debug(f"processing {filename}")
+            for batch in read_extract_file(filename, layout_column_names):
+                if not put(batch):
+                    return
+            put(end_of_file)
+        except Exception as e:
+            # Hand the exception over to the consumer, which re-raises it
+            put(e)
+
+    executor = ThreadPoolExecutor(max_workers=MAX_FILE_WORKERS)
+    try:
+        for filename in filenames:
+            executor.submit(read_file, filename)
+
+        remaining_files = len(filenames)
+        row_count = 0
+        while remaining_files:
+            item = batch_queue.get()
+            if item is end_of_file:
+                remaining_files -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                row_count += upsert_batch(layout_name, item)
+        log.info(f"upserted {row_count} rows from {len(filenames)} files for {layout_name}")
+    finally:
+        # Stop any readers still running and discard files that have not been started
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def submit_process(url: str, headers: dict, payload: dict):
@@ -228,7 +370,7 @@ def download_file(url: str, headers: dict, output_path: str):
     response.raise_for_status()
 
     with open(output_path, "wb") as file:
-        for chunk in response.iter_content(chunk_size=1024):
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
             file.write(chunk)
 
     log.info(f"ZIP file downloaded successfully to {output_path}")
@@ -5,6 +5,7 @@ data_extracts: A list of dictionaries in the format specified by MasterTax.
 column_names: A dictionary of key-value pairs.
     Keys are layout names from data extracts (e.g. tagValues from {"tagCode": "LAYOUT_NAME", "tagValues": ["EXTRACT_01"]})
     Values are lists of column names in the same order as defined in the data extracts.
+Tuning constants for downloading and reading the extract files.
 """
 
 data_extracts = [
@@ -26,3 +27,16 @@ data_extracts = [
 ]
 
 column_names = {"EXTRACT_01": ["ID", "COLUMN_01", "COLUMN_02", "COLUMN_03"]}
+
+# Size of each chunk written to disk while downloading an extract ZIP file
+DOWNLOAD_CHUNK_SIZE_BYTES = 8 * 1024 * 1024
+
+# Size of each block parsed by the Arrow CSV reader; each block becomes one upsert batch.
+# Small blocks keep the Python objects of a batch in the CPU cache and out of the older GC generations
+READ_BLOCK_SIZE_BYTES = 1024 * 1024
+
+# Number of extracted files parsed at the same time
+MAX_FILE_WORKERS = 4
+
+# Number of parsed batches waiting to be upserted, across all files
+BUFFERED_BATCHES = 8
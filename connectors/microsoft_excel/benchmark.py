@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Microsoft Excel Reader Benchmark
+Compares the pandas, python-calamine, and openpyxl readers of the connector with the parallel production mode.
+
+The benchmark generates local workbooks and replaces op.upsert with a counting sink, so the timings only include
+parsing the workbook and building the records that would be passed to op.upsert. No AWS access or Fivetran
+environment is required.
+The three single-sheet readers are run on a workbook with one sheet of --rows rows. The production mode is run on
+the same workbook, and on a workbook with the same rows split over --sheets sheets, which it parses in parallel.
+
+Usage:
+    python benchmark.py --rows 1000000 --sheets 4 --workers 4
+"""
+
+# For parsing command line arguments
+import argparse
+
+# For generating the workbooks
+import os
+import tempfile
+from datetime import datetime, timedelta
+from openpyxl import Workbook
+
+# For measuring the elapsed time
+import time
+
+# The connector module under benchmark
+import connector
+
+# The fivetran debug harness normally sets the log level, which the production mode needs for its log messages
+from fivetran_connector_sdk import Logging
+
+if Logging.LOG_LEVEL is None:
+    Logging.LOG_LEVEL = Logging.Level.WARNING
+
+
+class CountingOperations:
+    """
+    Stand-in for fivetran_connector_sdk.Operations that only counts the records it receives.
+    """
+
+    def __init__(self):
+        self.upsert_count = 0
+
+    def upsert(self, table, data):
+        self.upsert_count += 1
+
+    def checkpoint(self, state):
+        pass
+
+
+def generate_workbook(row_count: int, sheet_count: int) -> str:
+    """
+    Generate a workbook with the columns expected by the connector, with the rows split evenly over the sheets.
+    Args:
+        row_count: Total number of data rows to write
+        sheet_count: Number of sheets
+    Returns:
+        str: Path to the generated workbook
+    """
+    workbook = Workbook(write_only=True)
+    rows_per_sheet = row_count // sheet_count
+    start_time = datetime(2024, 1, 1)
+    for sheet_index in range(sheet_count):
+        sheet = workbook.create_sheet(f"Sheet{sheet_index + 1}")
+        sheet.append(["id", "name", "amount", "quantity", "timestamp"])
+        first_row = sheet_index * rows_per_sheet
+        for index in range(first_row, first_row + rows_per_sheet):
+            sheet.append(
+                [
+                    f"id_{index}",
+                    f"name_{index % 1000}",
+                    index * 0.25,
+                    index % 100,
+                    start_time + timedelta(seconds=index),
+                ]
+            )
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as temp_file:
+        file_path = temp_file.name
+    workbook.save(file_path)
+    return file_path
+
+
+def run_benchmark(name: str, upsert_function, *args) -> float:
+    """
+    Run one upsert function against the counting sink and print its throughput.
+    Args:
+        name: Label printed in the results
+        upsert_function: Function with the (temp_filename, state, ...) signature
+        args: Arguments passed to upsert_function after the state
+    Returns:
+        float: Elapsed time in seconds
+    """
+    operations = CountingOperations()
+    connector.op = operations
+    start_time = time.perf_counter()
+    upsert_function(args[0], {}, *args[1:])
+    elapsed = time.perf_counter() - start_time
+    rows_per_second = operations.upsert_count / elapsed if elapsed else 0
+    print(
+        f"{name:<40} {operations.upsert_count:>12,} rows {elapsed:>9.2f}s {rows_per_second:>12,.0f} rows/s"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Excel readers")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of data rows")
+    parser.add_argument("--sheets", type=int, default=4, help="Sheets of the multi-sheet workbook")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Worker processes of production mode"
+    )
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per production batch")
+    parser.add_argument(
+        "--skip-pandas", action="store_true", help="Skip the slow pandas default engine"
+    )
+    arguments = parser.parse_args()
+
+    print(f"Generating workbooks with {arguments.rows:,} rows...")
+    single_sheet_path = generate_workbook(arguments.rows, 1)
+    multi_sheet_path = generate_workbook(arguments.rows, arguments.sheets)
+    try:
+        if not arguments.skip_pandas:
+            run_benchmark("pandas (1 sheet)", connector.upsert_using_pandas, single_sheet_path)
+        run_benchmark("calamine (1 sheet)", connector.upsert_using_calamine, single_sheet_path)
+        run_benchmark("openpyxl (1 sheet)", connector.upsert_using_openpyxl, single_sheet_path)
+        for engine in ("openpyxl", "calamine"):
+            run_benchmark(
+                f"production {engine} (1 sheet)",
+                connector.upsert_sheets_in_parallel,
+                single_sheet_path,
+                engine,
+                1,
+                arguments.batch_size,
+            )
+            run_benchmark(
+                f"production {engine} ({arguments.sheets} sheets, {arguments.workers} workers)",
+                connector.upsert_sheets_in_parallel,
+                multi_sheet_path,
+                engine,
+                arguments.workers,
+                arguments.batch_size,
+            )
+    finally:
+        os.remove(single_sheet_path)
+        os.remove(multi_sheet_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,19 @@ from openpyxl import load_workbook  # This is used to process the Excel file usi
 import json
 import os
 import tempfile  # This is used to create a temporary file
+import multiprocessing  # This is used to parse the sheets in parallel worker processes
+from concurrent.futures import ProcessPoolExecutor
+import queue
+
+# Sheet parsing code that runs in the worker processes of the production mode
+import sheet_reader
+
+# Default number of sheets parsed at the same time in production mode
+__DEFAULT_MAX_WORKERS = 4
+# Default number of rows sent from a worker process to the connector process at a time
+__DEFAULT_BATCH_SIZE = 5000
+# Default engine used by the worker processes to parse the sheets
+__DEFAULT_ENGINE = "openpyxl"
 
 
 def create_s3_client(configuration: dict):
@@ -180,6 +193,188 @@ def upsert_using_openpyxl(temp_filename, state):
     wb.close()
 
 
+def upsert_sheets_in_parallel(
+    temp_filename,
+    state,
+    engine=__DEFAULT_ENGINE,
+    max_workers=__DEFAULT_MAX_WORKERS,
+    batch_size=__DEFAULT_BATCH_SIZE,
+    sheet_names=None,
+):
+    """
+    Process every sheet of the Excel file in parallel worker processes and upsert the rows in batches.
+    This is the production mode of the connector. Parsing XLSX files is CPU-bound, so the sheets are parsed by up to
+    max_workers worker processes (see sheet_reader.py), each one streaming a single sheet.
+    The workers send rows to this process in batches through a bounded queue, so memory use does not depend on the
+    size of the file, and only this process calls op.upsert and op.checkpoint.
+    The column names of each sheet are built once from its header row, and date and time columns are detected once
+    per sheet by the worker, so the rows only need to be zipped with the cached headers here.
+    Each sheet is upserted into its own table named after the sheet, e.g. excel_sheet_orders for a sheet "Orders",
+    with the worksheet row number of each row in the _row_number column.
+    Args:
+        temp_filename: The path to the temporary file containing the Excel data.
+        state:  a dictionary containing the state checkpointed during the prior sync.
+        engine: "openpyxl" to stream each sheet, or "calamine" to load each sheet at once, which is faster.
+        max_workers: number of sheets parsed at the same time.
+        batch_size: number of rows per batch.
+        sheet_names: the sheets to sync, in the order of the configuration, or None to sync every sheet.
+    """
+    workbook_sheet_names = sheet_reader.list_sheet_names(temp_filename)
+    if sheet_names:
+        missing_sheet_names = [name for name in sheet_names if name not in workbook_sheet_names]
+        if missing_sheet_names:
+            raise ValueError(f"Sheets not found in the workbook: {', '.join(missing_sheet_names)}")
+    else:
+        sheet_names = workbook_sheet_names
+    log.info(
+        f"Processing {len(sheet_names)} sheets with {engine} in up to {max_workers} worker processes"
+    )
+
+    # Use the spawn start method, because forking a process that runs gRPC threads is not safe
+    context = multiprocessing.get_context("spawn")
+    batch_queue = context.Queue(maxsize=max_workers * 2)
+    stop_event = context.Event()
+
+    table_names = get_sheet_table_names(sheet_names)
+    headers_by_table = {}
+    row_counts = {}
+    executor = ProcessPoolExecutor(
+        max_workers=min(max_workers, len(sheet_names)) or 1,
+        mp_context=context,
+        initializer=sheet_reader.init_worker,
+        initargs=(batch_queue, stop_event),
+    )
+    futures = []
+    try:
+        for sheet_name, table_name in zip(sheet_names, table_names):
+            headers_by_table[table_name] = None
+            futures.append(
+                executor.submit(
+                    sheet_reader.read_sheet,
+                    temp_filename,
+                    sheet_name,
+                    table_name,
+                    engine,
+                    batch_size,
+                )
+            )
+
+        remaining_sheets = len(futures)
+        while remaining_sheets:
+            try:
+                message_type, table_name, payload = batch_queue.get(timeout=1)
+            except queue.Empty:
+                # A worker process that died, e.g. after running out of memory, never sends its "done" message
+                for future in futures:
+                    if future.done() and future.exception() is not None:
+                        raise RuntimeError(f"Worker process failed: {future.exception()}")
+                continue
+            if message_type == "header":
+                headers_by_table[table_name] = payload
+            elif message_type == "rows":
+                headers = headers_by_table[table_name]
+                for values in payload:
+                    # The 'upsert' operation is used to insert or update the record in the destination table.
+                    op.upsert(table=table_name, data=dict(zip(headers, values)))
+            elif message_type == "done":
+                remaining_sheets -= 1
+                row_counts[table_name] = payload
+                log.info(f"Upserted {payload} rows into {table_name}")
+            elif message_type == "error":
+                raise RuntimeError(f"Error reading the sheet for table {table_name}: {payload}")
+    finally:
+        # Stop any workers still running and discard sheets that have not been started
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Keep reading the queue until the workers have finished, because a worker cannot finish
+        # while the feeder thread of its queue is blocked writing a batch nobody reads
+        while not all(future.done() for future in futures):
+            try:
+                batch_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        executor.shutdown(wait=True)
+
+    log.info(f"Upserted {sum(row_counts.values())} rows from {len(row_counts)} sheets")
+
+    # Save the progress by checkpointing the state.
+    op.checkpoint(state)
+
+
+def get_sheet_table_name(sheet_name, used_table_names):
+    """
+    Build the destination table name of a sheet.
+    Sheets whose names normalize to the same table name get a numeric suffix.
+    Args:
+        sheet_name: name of the sheet
+        used_table_names: table names already assigned to other sheets
+    Returns:
+        The table name
+    """
+    base_name = "excel_sheet_" + sheet_reader.normalize_name(sheet_name, "unnamed")
+    table_name = base_name
+    suffix = 2
+    while table_name in used_table_names:
+        table_name = f"{base_name}_{suffix}"
+        suffix += 1
+    return table_name
+
+
+def get_sheet_table_names(sheet_names):
+    """
+    Build the destination table names of the sheets that are synced, in the same order in every sync,
+    so that the tables declared by the schema function match the tables the sheets are upserted into.
+    Args:
+        sheet_names: names of the sheets
+    Returns:
+        One table name per sheet
+    """
+    table_names = []
+    for sheet_name in sheet_names:
+        table_names.append(get_sheet_table_name(sheet_name, table_names))
+    return table_names
+
+
+def get_configured_sheet_names(configuration: dict):
+    """
+    Read the optional list of sheets to sync in production mode from the configuration.
+    Args:
+        configuration: a dictionary that holds the configuration settings for the connector.
+    Returns:
+        The comma-separated sheet names of the sheet_names setting, or an empty list if it is not set.
+    """
+    sheet_names = configuration.get("sheet_names") or ""
+    return [name.strip() for name in sheet_names.split(",") if name.strip()]
+
+
+def get_production_settings(configuration: dict):
+    """
+    Read the optional production mode settings from the configuration.
+    Args:
+        configuration: a dictionary that holds the configuration settings for the connector.
+    Returns:
+        The engine, the maximum number of worker processes, and the batch size.
+    """
+    engine = configuration.get("engine") or __DEFAULT_ENGINE
+    if engine not in ("openpyxl", "calamine"):
+        raise ValueError(f"engine must be 'openpyxl' or 'calamine', got {engine!r}")
+
+    settings = []
+    for key, default in (
+        ("max_workers", __DEFAULT_MAX_WORKERS),
+        ("batch_size", __DEFAULT_BATCH_SIZE),
+    ):
+        value = configuration.get(key)
+        try:
+            value = int(value) if value not in (None, "") else default
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} must be a positive integer, got {value!r}")
+        if value < 1:
+            raise ValueError(f"{key} must be a positive integer, got {value}")
+        settings.append(value)
+    return engine, settings[0], settings[1]
+
+
 def schema(configuration: dict):
     """
     Define the schema function which lets you configure the schema your connector delivers.
@@ -201,7 +396,7 @@ def schema(configuration: dict):
         if key not in configuration:
             raise ValueError(f"Missing required configuration key: {key}")
 
-    return [
+    tables = [
         {
             "table": "excel_data_pandas",  # Name of the table
             "primary_key": ["id"],  # Primary key(s) of the table
@@ -231,6 +426,19 @@ def schema(configuration: dict):
         },
     ]
 
+    # In production mode, the tables of the configured sheets are keyed by the worksheet row number
+    if str(configuration.get("production_mode", "")).lower() == "true":
+        for table_name in get_sheet_table_names(get_configured_sheet_names(configuration)):
+            tables.append(
+                {
+                    "table": table_name,
+                    "primary_key": [sheet_reader.ROW_NUMBER_COLUMN],
+                    "columns": {sheet_reader.ROW_NUMBER_COLUMN: "INT"},
+                    # Columns not defined in schema will be inferred
+                }
+            )
+    return tables
+
 
 def update(configuration: dict, state: dict):
     """
@@ -255,6 +463,15 @@ def update(configuration: dict, state: dict):
     temp_filename = download_excel_file(s3_client, bucket_name, file_key)
 
     try:
+        # In production mode, every sheet is parsed in parallel worker processes and upserted into its own table
+        if str(configuration.get("production_mode", "")).lower() == "true":
+            engine, max_workers, batch_size = get_production_settings(configuration)
+            sheet_names = get_configured_sheet_names(configuration)
+            upsert_sheets_in_parallel(
+                temp_filename, state, engine, max_workers, batch_size, sheet_names
+            )
+            return
+
         # There are three different ways to sync data from Excel file
         # Any of the three methods can be used to sync data from the Excel file
         # - python-calamine is recommended for the best balance of speed and memory efficiency
@@ -0,0 +1,264 @@
+"""
+Sheet reader for the production mode of the Microsoft Excel connector.
+Each worksheet is parsed in its own worker process, because parsing XLSX files is CPU-bound and a single Python
+process can only parse one sheet at a time. The workers send the parsed rows to the connector process in batches
+through a bounded queue, and the connector process emits them with op.upsert.
+This module does not import the Connector SDK, so the worker processes start quickly and never emit records.
+"""
+
+# For the queue and stop event shared with the worker processes
+import queue
+
+# For normalizing sheet and column names
+import re
+
+# For converting Excel dates and times
+from datetime import date, datetime, time
+
+# For type hints
+from typing import Callable, List, Optional, Tuple
+
+# For streaming the rows of a sheet without loading the whole workbook
+from openpyxl import load_workbook
+
+# For reading a whole sheet quickly with the Rust-backed calamine engine
+from python_calamine import CalamineWorkbook
+
+# Seconds a worker waits on a full queue before checking whether the connector process has stopped
+_POLL_INTERVAL_SECONDS = 1
+
+# Column holding the worksheet row number of each row, which is the primary key of the sheet tables.
+# Normalized header names never start with an underscore, so it cannot collide with a sheet column.
+ROW_NUMBER_COLUMN = "_row_number"
+
+# Queue and stop event of the current worker process, set by init_worker
+_batch_queue = None
+_stop_event = None
+
+
+def init_worker(batch_queue, stop_event):
+    """
+    Initialize a worker process with the queue and stop event shared with the connector process.
+    Args:
+        batch_queue: multiprocessing queue the parsed batches are sent through
+        stop_event: multiprocessing event set by the connector process when it stops consuming
+    """
+    global _batch_queue, _stop_event
+    _batch_queue = batch_queue
+    _stop_event = stop_event
+    # Do not wait for unread batches to be written to the queue when the worker process exits,
+    # because the connector process stops reading the queue once it stops consuming
+    _batch_queue.cancel_join_thread()
+
+
+def list_sheet_names(file_path: str) -> List[str]:
+    """
+    List the worksheets of a workbook without reading their cells.
+    Args:
+        file_path: path to the Excel file
+    Returns:
+        The sheet names, in workbook order
+    """
+    workbook = CalamineWorkbook.from_path(file_path)
+    try:
+        return list(workbook.sheet_names)
+    finally:
+        workbook.close()
+
+
+def normalize_name(name, fallback: str) -> str:
+    """
+    Normalize a sheet or column name to lowercase letters, digits, and underscores.
+    Args:
+        name: the name to normalize, which may be None or a number for header cells
+        fallback: name to use when nothing is left after normalizing
+    Returns:
+        The normalized name
+    """
+    normalized = re.sub(r"[^0-9a-zA-Z]+", "_", str(name) if name is not None else "").strip("_")
+    return normalized.lower() or fallback
+
+
+def build_headers(header_row) -> List[str]:
+    """
+    Build the column names of a sheet from its header row.
+    Empty header cells are named after their position and duplicate names get a numeric suffix,
+    so that no column overwrites another one in the upserted records.
+    Args:
+        header_row: values of the first row of the sheet
+    Returns:
+        One unique column name per header cell
+    """
+    headers = []
+    seen = set()
+    for index, value in enumerate(header_row):
+        name = normalize_name(value, f"column_{index + 1}")
+        candidate = name
+        suffix = 2
+        while candidate in seen:
+            candidate = f"{name}_{suffix}"
+            suffix += 1
+        seen.add(candidate)
+        headers.append(candidate)
+    return headers
+
+
+def _to_iso_format(value):
+    """
+    Convert a date, datetime, or time cell to an ISO 8601 string.
+    Values of another type in the same column are returned unchanged.
+    """
+    try:
+        return value.isoformat()
+    except AttributeError:
+        return value
+
+
+class SheetTypeCache:
+    """
+    Per-sheet cache of column converters.
+    The converter of a column is inferred once, from its first non-empty value, instead of checking the type
+    of every cell of every row. Only the columns that need a conversion, such as date and time columns,
+    are visited for the remaining rows.
+    """
+
+    def __init__(self, column_count: int):
+        """
+        Args:
+            column_count: number of columns of the sheet
+        """
+        self._pending_columns = set(range(column_count))
+        self._converters: List[Tuple[int, Callable]] = []
+
+    @staticmethod
+    def infer_converter(value) -> Optional[Callable]:
+        """
+        Pick the converter of a column from one of its values.
+        Args:
+            value: a non-empty cell value
+        Returns:
+            The converter, or None if the value can be upserted as it is
+        """
+        if isinstance(value, (datetime, date, time)):
+            return _to_iso_format
+        return None
+
+    def _infer(self, row: list):
+        for index in list(self._pending_columns):
+            value = row[index]
+            if value is None or value == "":
+                continue
+            self._pending_columns.discard(index)
+            converter = self.infer_converter(value)
+            if converter is not None:
+                self._converters.append((index, converter))
+
+    def convert(self, row: list) -> list:
+        """
+        Convert the values of a row in place.
+        Args:
+            row: cell values of the row, one per column
+        Returns:
+            The converted row
+        """
+        if self._pending_columns:
+            self._infer(row)
+        for index, converter in self._converters:
+            value = row[index]
+            if value is not None:
+                row[index] = converter(value)
+        return row
+
+
+def iter_sheet_rows(file_path: str, sheet_name: str, engine: str):
+    """
+    Iterate over the rows of a sheet.
+    The openpyxl engine streams the sheet in read-only mode, so memory does not depend on the size of the sheet.
+    The calamine engine is several times faster, but loads the whole sheet into the memory of the worker.
+    Args:
+        file_path: path to the Excel file
+        sheet_name: name of the sheet to read
+        engine: "openpyxl" or "calamine"
+    Yields:
+        The cell values of each row
+    """
+    if engine == "calamine":
+        workbook = CalamineWorkbook.from_path(file_path)
+        try:
+            yield from workbook.get_sheet_by_name(sheet_name).iter_rows()
+        finally:
+            workbook.close()
+    elif engine == "openpyxl":
+        workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+        try:
+            yield from workbook[sheet_name].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f"Unsupported engine: {engine}")
+
+
+def _put(message) -> bool:
+    # Wait while the queue is full, unless the connector process has stopped consuming
+    while not _stop_event.is_set():
+        try:
+            _batch_queue.put(message, timeout=_POLL_INTERVAL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def read_sheet(file_path: str, sheet_name: str, table_name: str, engine: str, batch_size: int):
+    """
+    Parse one sheet in a worker process and send it to the connector process.
+    The messages are ("header", table_name, headers), then ("rows", table_name, rows) for every batch of rows,
+    and finally ("done", table_name, row_count), or ("error", table_name, message) if the sheet cannot be read.
+    Rows are sent as lists of values aligned with the headers, which are cheaper to pass between processes
+    than dictionaries. The last header is ROW_NUMBER_COLUMN, and the last value of each row is its worksheet
+    row number, counting the header row as row 1. Completely empty rows are skipped.
+    Args:
+        file_path: path to the Excel file
+        sheet_name: name of the sheet to read
+        table_name: destination table of the sheet
+        engine: "openpyxl" or "calamine"
+        batch_size: number of rows per batch
+    """
+    try:
+        rows = iter_sheet_rows(file_path, sheet_name, engine)
+        header_row = next(rows, None)
+        if header_row is None:
+            _put(("done", table_name, 0))
+            return
+
+        headers = build_headers(header_row)
+        column_count = len(headers)
+        type_cache = SheetTypeCache(column_count)
+        if not _put(("header", table_name, headers + [ROW_NUMBER_COLUMN])):
+            return
+
+        row_count = 0
+        batch = []
+        # Both engines yield every row from the first row of the worksheet, including empty ones
+        for row_number, row in enumerate(rows, start=2):
+            values = list(row[:column_count])
+            if len(values) < column_count:
+                values.extend([None] * (column_count - len(values)))
+            if all(value is None or value == "" for value in values):
+                continue
+            values = type_cache.convert(values)
+            values.append(row_number)
+            batch.append(values)
+            if len(batch) >= batch_size:
+                if not _put(("rows", table_name, batch)):
+                    return
+                row_count += len(batch)
+                batch = []
+
+        if batch:
+            if not _put(("rows", table_name, batch)):
+                return
+            row_count += len(batch)
+        _put(("done", table_name, row_count))
+    except Exception as e:
+        _put(("error", table_name, f"{type(e).__name__}: {e}"))
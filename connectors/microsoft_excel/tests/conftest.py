@@ -0,0 +1,32 @@
+"""Shared pytest fixtures for the Microsoft Excel connector tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fivetran_connector_sdk import Logging as _sdk_logging  # noqa: E402
+
+if _sdk_logging.LOG_LEVEL is None:
+    _sdk_logging.LOG_LEVEL = _sdk_logging.Level.INFO
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """
+    Workbook with two sheets of 2,000 rows each. A batch of 500 rows is larger than the pipe buffer of the
+    queue between the processes, so the feeder threads of the workers block while the queue is not read.
+    """
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name in ("a", "b"):
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(["id", "value"])
+        for row_id in range(2000):
+            sheet.append([row_id, f"{sheet_name}-{row_id}-" + "x" * 200])
+    path = tmp_path / "workbook.xlsx"
+    workbook.save(path)
+    return str(path)
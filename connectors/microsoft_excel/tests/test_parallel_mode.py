@@ -0,0 +1,102 @@
+"""Tests for the error paths of the parallel production mode (upsert_sheets_in_parallel)."""
+
+import threading
+
+import pytest
+
+import connector
+import sheet_reader
+
+# Seconds after which a sync that has not returned is considered hung
+_SYNC_TIMEOUT_SECONDS = 30
+
+
+def run_sync(workbook_path, sheet_names=None):
+    """Run upsert_sheets_in_parallel in a thread and return the exception it raised, failing if it hangs."""
+    outcome = {}
+
+    def target():
+        try:
+            connector.upsert_sheets_in_parallel(
+                workbook_path,
+                {},
+                engine="openpyxl",
+                max_workers=3,
+                batch_size=500,
+                sheet_names=sheet_names,
+            )
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(_SYNC_TIMEOUT_SECONDS)
+    assert not thread.is_alive(), "upsert_sheets_in_parallel did not return"
+    return outcome.get("error")
+
+
+@pytest.fixture
+def upserts(monkeypatch):
+    records = []
+    monkeypatch.setattr(connector.op, "upsert", lambda table, data: records.append((table, data)))
+    monkeypatch.setattr(connector.op, "checkpoint", lambda state: None)
+    return records
+
+
+def test_parallel_mode_upserts_every_row(workbook_path, upserts):
+    assert run_sync(workbook_path) is None
+    assert len(upserts) == 4000
+    assert {table for table, _ in upserts} == {"excel_sheet_a", "excel_sheet_b"}
+
+
+def test_rows_are_upserted_with_their_worksheet_row_number(workbook_path, upserts):
+    assert run_sync(workbook_path) is None
+    for table, record in upserts:
+        assert record["_row_number"] == record["id"] + 2
+
+
+def test_configured_sheets_are_synced_and_keyed_by_row_number(workbook_path, upserts):
+    configuration = {
+        "aws_access_key_id": "key",
+        "aws_secret_access_key": "secret",
+        "region_name": "region",
+        "bucket_name": "bucket",
+        "file_name": "workbook.xlsx",
+        "production_mode": "true",
+        "sheet_names": "b",
+    }
+
+    assert run_sync(workbook_path, connector.get_configured_sheet_names(configuration)) is None
+
+    assert {table for table, _ in upserts} == {"excel_sheet_b"}
+    sheet_table = connector.schema(configuration)[-1]
+    assert sheet_table["table"] == "excel_sheet_b"
+    assert sheet_table["primary_key"] == ["_row_number"]
+
+
+def test_missing_configured_sheet_stops_the_sync_with_an_error(workbook_path, upserts):
+    error = run_sync(workbook_path, ["a", "missing"])
+
+    assert isinstance(error, ValueError)
+    assert "missing" in str(error)
+
+
+def test_failing_sheet_stops_the_sync_with_an_error(workbook_path, upserts, monkeypatch):
+    # The worker reading "bad" fails because the sheet does not exist, while "a" and "b" are still streaming
+    monkeypatch.setattr(sheet_reader, "list_sheet_names", lambda file_path: ["a", "b", "bad"])
+
+    error = run_sync(workbook_path)
+
+    assert isinstance(error, RuntimeError)
+    assert "excel_sheet_bad" in str(error)
+
+
+def test_failing_upsert_stops_the_sync_with_an_error(workbook_path, monkeypatch):
+    def failing_upsert(table, data):
+        raise ValueError("upsert failed")
+
+    monkeypatch.setattr(connector.op, "upsert", failing_upsert)
+
+    error = run_sync(workbook_path)
+
+    assert isinstance(error, ValueError)
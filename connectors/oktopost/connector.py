@@ -8,8 +8,8 @@ and the Best Practices documentation (https://fivetran.com/docs/connectors/conne
 # For reading CSV files
 import csv
 
-# For reading and writing files
-import io
+# For buffering downloaded exports on disk
+import tempfile
 
 # For handling regular expressions
 import re
@@ -24,7 +24,7 @@ import zipfile
 from datetime import datetime, timezone
 
 # For type hints
-from typing import Dict, List, Any
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple
 
 # For handling URLs
 from urllib.parse import urlparse
@@ -49,6 +49,7 @@ __BASE_URL = "https://api.oktopost.com/v2"
 __API_TIMEOUT_SECONDS = 30
 __MAX_RETRIES = 3
 __RETRY_DELAY_SECONDS = 1  # Base delay for exponential backoff
+__DOWNLOAD_CHUNK_SIZE_BYTES = 1024 * 1024  # Size of each chunk read from the export download
 
 
 def validate_configuration(configuration: dict):
@@ -127,14 +128,19 @@ def _handle_http_error(attempt: int, error: requests.exceptions.HTTPError) -> No
 
 
 def make_api_request_with_retry(
-    url: str, headers: Dict[str, str], auth: tuple = None
+    url: str, headers: Dict[str, str], auth: tuple = None, stream: bool = False
 ) -> requests.Response:
-    """Make API request with exponential backoff retry logic."""
+    """
+    Make API request with exponential backoff retry logic.
+    With stream=True only the headers are read, and the body must be consumed with iter_content().
+    """
     for attempt in range(__MAX_RETRIES + 1):
         try:
             _handle_retry_delay(attempt)
 
-            response = requests.get(url, headers=headers, auth=auth, timeout=__API_TIMEOUT_SECONDS)
+            response = requests.get(
+                url, headers=headers, auth=auth, timeout=__API_TIMEOUT_SECONDS, stream=stream
+            )
 
             # Check if we should retry based on status code
             if _should_retry_status_code(response.status_code):
@@ -160,23 +166,67 @@ def make_api_request_with_retry(
     raise RuntimeError(f"Request failed after {__MAX_RETRIES + 1} attempts")
 
 
-def extract_csv_from_zip(zip_content: bytes) -> List[Dict[str, Any]]:
+def download_export_file(file_url: str) -> Tuple[IO[bytes], str]:
     """
-    Extract CSV files from a ZIP archive.
+    Download an export file in chunks into a temporary file on disk, so memory use does not depend on the export size.
+    A real file is used rather than a SpooledTemporaryFile, which zipfile cannot read before Python 3.11.
+    The download is retried from the start if the connection drops while the body is being read.
 
     Returns:
-        List of dictionaries with keys "filename" and "content" for each CSV file found in the archive.
+        Tuple of the binary file object positioned at the start of the downloaded file, which the caller must close,
+        and the filename of the final URL after redirects.
+    """
+    for attempt in range(__MAX_RETRIES + 1):
+        file_response = make_api_request_with_retry(file_url, {}, stream=True)
+        export_file = tempfile.TemporaryFile()
+        try:
+            with file_response:
+                for chunk in file_response.iter_content(chunk_size=__DOWNLOAD_CHUNK_SIZE_BYTES):
+                    export_file.write(chunk)
+            export_file.seek(0)
+            return export_file, urlparse(file_response.url).path.split("/")[-1]
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ConnectionError,
+        ) as e:
+            export_file.close()
+            _handle_retryable_error(attempt, e)
+            _handle_retry_delay(attempt + 1)
+        except Exception:
+            export_file.close()
+            raise
+
+    raise RuntimeError(f"Download failed after {__MAX_RETRIES + 1} attempts")
+
+
+def iter_text_lines(binary_stream: IO[bytes]) -> Iterator[str]:
+    """
+    Decode a binary stream line by line as UTF-8, keeping the line endings as csv expects.
+    Splitting on the newline byte is safe for UTF-8, where it never occurs inside a multibyte character.
+    """
+    for line in binary_stream:
+        yield line.decode("utf-8")
+
+
+def extract_csv_from_zip(zip_source: IO[bytes]) -> Iterator[Tuple[str, Iterator[str]]]:
+    """
+    Open the CSV files of a ZIP archive as streams of lines, one member at a time.
+    Each member is decompressed while it is read, so it is never held in memory as a whole.
+
+    Args:
+        zip_source: Seekable binary file object containing the ZIP archive.
+
+    Yields:
+        Tuples of the member filename and an iterator over the decoded lines of its content.
+        The member is closed when the generator moves on to the next one.
     """
     try:
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zip_file:
-            return [
-                {
-                    "filename": file_info.filename,
-                    "content": zip_file.read(file_info.filename).decode("utf-8"),
-                }
-                for file_info in zip_file.filelist
-                if file_info.filename.lower().endswith(".csv") and not file_info.is_dir()
-            ]
+        with zipfile.ZipFile(zip_source) as zip_file:
+            for file_info in zip_file.infolist():
+                if not file_info.filename.lower().endswith(".csv") or file_info.is_dir():
+                    continue
+                with zip_file.open(file_info) as member:
+                    yield file_info.filename, iter_text_lines(member)
     except Exception as e:
         log.error("Error extracting ZIP file", e)
         raise
@@ -196,38 +246,64 @@ def normalize_table_name(filename: str) -> str:
     )
 
 
-def process_csv_data(csv_content: str, filename: str, export_id: str) -> List[Dict[str, Any]]:
+def normalize_column_name(column: str) -> str:
+    """Normalize a CSV header to a column name."""
+    return column.strip().replace(" ", "_").replace('"', "").lower()
+
+
+def process_csv_data(
+    csv_lines: Iterable[str], filename: str, export_id: str
+) -> Iterator[Dict[str, Any]]:
     """
-    Process CSV content and return rows for upserting.
+    Parse CSV rows incrementally from a stream of lines.
 
     Args:
-        csv_content: CSV data as string.
+        csv_lines: Lines of CSV data.
         filename: Original filename for tracking.
         export_id: Export identifier.
 
-    Returns:
-        List of dictionaries with normalized column names and added export_id/source_filename fields.
+    Yields:
+        Dictionaries with normalized column names and added export_id/source_filename fields.
     """
     try:
-        return [
-            {
+        reader = csv.DictReader(csv_lines)
+        # Normalize the header once instead of renaming the keys of every row
+        if reader.fieldnames:
+            reader.fieldnames = [normalize_column_name(column) for column in reader.fieldnames]
+        for row in reader:
+            yield {
                 **{
-                    key.strip()
-                    .replace(" ", "_")
-                    .replace('"', "")
-                    .lower(): value.strip() if isinstance(value, str) else value
+                    key: value.strip() if isinstance(value, str) else value
                     for key, value in row.items()
                 },
                 "export_id": export_id,
                 "source_filename": filename,
             }
-            for row in csv.DictReader(io.StringIO(csv_content))
-        ]
     except Exception as e:
         log.error(f"Error processing CSV content from {filename}", e)
         raise
 
 
+def upsert_csv_rows(
+    csv_lines: Iterable[str], table_name: str, original_filename: str, export_id: str
+) -> int:
+    """
+    Upsert CSV rows as they are parsed.
+
+    Returns:
+        Number of rows upserted.
+    """
+    row_count = 0
+    for row in process_csv_data(csv_lines, original_filename, export_id):
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The op.upsert method is called with two arguments:
+        # - The first argument is the name of the table to upsert the data into.
+        # - The second argument is a dictionary containing the data to be upserted,
+        op.upsert(table=table_name, data=row)
+        row_count += 1
+    return row_count
+
+
 def _get_exports_to_process(
     configuration: Dict[str, str],
     base_url: str,
@@ -307,43 +383,31 @@ def _process_export_metadata(
     return {"export_id": export_id, "file_url": file_url, "source_filename": source_filename}
 
 
-def _process_zip_file(file_response: requests.Response, export_id: str) -> None:
-    """Process a ZIP file by extracting and processing CSV files."""
-    original_filename = urlparse(file_response.url).path.split("/")[-1]
-
+def _process_zip_file(export_file: IO[bytes], original_filename: str, export_id: str) -> None:
+    """Process a ZIP file by streaming the CSV files it contains."""
     log.info(f"File {original_filename} is a ZIP archive, extracting CSV files")
-    csv_files = extract_csv_from_zip(file_response.content)
-
-    if not csv_files:
-        log.warning(f"No CSV files found in ZIP archive {original_filename}")
-        return
-
-    for csv_file in csv_files:
-        table_name = normalize_table_name(original_filename)
-        log.info(f"Processing CSV data from {csv_file['filename']} into table: {table_name}")
+    table_name = normalize_table_name(original_filename)
+    csv_file_count = 0
 
-        rows = process_csv_data(csv_file["content"], original_filename, export_id)
+    for csv_filename, csv_lines in extract_csv_from_zip(export_file):
+        csv_file_count += 1
+        log.info(f"Processing CSV data from {csv_filename} into table: {table_name}")
+        row_count = upsert_csv_rows(csv_lines, table_name, original_filename, export_id)
+        log.info(f"Processed {row_count} rows for table {table_name} from {csv_filename}")
 
-        for row in rows:
-            # The 'upsert' operation is used to insert or update data in the destination table.
-            # The op.upsert method is called with two arguments:
-            # - The first argument is the name of the table to upsert the data into.
-            # - The second argument is a dictionary containing the data to be upserted,
-            op.upsert(table=table_name, data=row)
-        log.info(f"Processed {len(rows)} rows for table {table_name} from {csv_file['filename']}")
+    if not csv_file_count:
+        log.warning(f"No CSV files found in ZIP archive {original_filename}")
 
 
-def _process_csv_file(file_response: requests.Response, export_id: str) -> None:
-    """Process a single CSV file."""
-    original_filename = urlparse(file_response.url).path.split("/")[-1]
+def _process_csv_file(export_file: IO[bytes], original_filename: str, export_id: str) -> None:
+    """Process a single CSV file by streaming its rows."""
     table_name = normalize_table_name(original_filename)
     log.info(f"Processing CSV data into table: {table_name}")
 
-    rows = process_csv_data(file_response.text, original_filename, export_id)
-
-    for row in rows:
-        op.upsert(table=table_name, data=row)
-    log.info(f"Processed {len(rows)} rows for table {table_name}")
+    row_count = upsert_csv_rows(
+        iter_text_lines(export_file), table_name, original_filename, export_id
+    )
+    log.info(f"Processed {row_count} rows for table {table_name}")
 
 
 def _process_export_file(export_info: Dict[str, Any]) -> None:
@@ -357,13 +421,13 @@ def _process_export_file(export_info: Dict[str, Any]) -> None:
     log.info(f"Downloading file for export {export_id}")
 
     try:
-        file_response = make_api_request_with_retry(file_url, {})
-        original_filename = urlparse(file_url).path.split("/")[-1]
-
-        if original_filename.lower().endswith(".zip"):
-            _process_zip_file(file_response, export_id)
-        else:
-            _process_csv_file(file_response, export_id)
+        requested_filename = urlparse(file_url).path.split("/")[-1]
+        export_file, original_filename = download_export_file(file_url)
+        with export_file:
+            if requested_filename.lower().endswith(".zip"):
+                _process_zip_file(export_file, original_filename, export_id)
+            else:
+                _process_csv_file(export_file, original_filename, export_id)
 
     except Exception as e:
         log.error(f"Error processing file for export {export_id}", e)
@@ -19,9 +19,27 @@ import base64
 # For generating series IDs from metric names and labels
 import hashlib
 
+# For storing the digests of emitted series as a packed array of 64-bit integers
+from array import array
+
+# For detecting the byte order of the platform
+import sys
+
+# For compressing the packed digests of emitted series
+import zlib
+
 # For retry delays and backoff logic
 import time
 
+# For keeping the range queries in flight in the order their results are upserted
+from collections import deque
+
+# For running the range queries of several metrics and time windows concurrently
+from concurrent.futures import ThreadPoolExecutor
+
+# For binding the arguments of the range queries run by the worker threads
+from functools import partial
+
 # Import required classes from fivetran_connector_sdk
 from fivetran_connector_sdk import Connector
 
@@ -34,8 +52,8 @@ from fivetran_connector_sdk import Operations as op
 # For making HTTP requests to Prometheus API (provided by SDK runtime)
 import requests
 
-# Batch size for checkpointing during large metric syncs
-__CHECKPOINT_BATCH_SIZE = 1000
+# For building remote read requests and decoding streamed remote read responses
+import remote_read
 
 # Query step duration for range queries (15 seconds)
 __QUERY_STEP_SECONDS = 15
@@ -52,6 +70,33 @@ __REQUEST_TIMEOUT_SECONDS = 30
 # Default lookback period in hours for initial sync
 __DEFAULT_LOOKBACK_HOURS = 24
 
+# Prometheus rejects range queries returning more than this many points per series
+__MAX_POINTS_PER_SERIES = 11000
+
+# Maximum number of samples (series times points per series) requested by a single range query
+__MAX_SAMPLES_PER_QUERY = 250000
+
+# Default number of range queries run concurrently
+__DEFAULT_MAX_CONCURRENT_QUERIES = 4
+
+# Range queries submitted ahead of the thread upserting their results, per worker
+__IN_FLIGHT_PER_WORKER = 2
+
+# Query engines: JSON range queries, or raw samples streamed as XOR encoded chunks by the remote read API
+__QUERY_ENGINE_QUERY_RANGE = "query_range"
+__QUERY_ENGINE_REMOTE_READ = "remote_read"
+
+# Size of the byte chunks read from a streamed remote read response
+__REMOTE_READ_CHUNK_BYTES = 64 * 1024
+
+# Output modes: one denormalized time_series table, or a series table and a samples table
+__OUTPUT_MODE_TIME_SERIES = "time_series"
+__OUTPUT_MODE_NORMALIZED = "normalized"
+
+
+class QueryTooLargeError(RuntimeError):
+    """Raised when Prometheus rejects a range query because it would return too many points or samples."""
+
 
 def validate_configuration(configuration: dict) -> None:
     """
@@ -85,6 +130,33 @@ def validate_configuration(configuration: dict) -> None:
         except ValueError:
             raise ValueError(f"lookback_hours must be a valid integer, got: {lookback_hours_str}")
 
+    output_mode = configuration.get("output_mode", __OUTPUT_MODE_TIME_SERIES)
+    valid_output_modes = [__OUTPUT_MODE_TIME_SERIES, __OUTPUT_MODE_NORMALIZED]
+    if output_mode not in valid_output_modes:
+        raise ValueError(
+            f"Invalid output_mode: {output_mode}. Valid values: {', '.join(valid_output_modes)}"
+        )
+
+    query_engine = configuration.get("query_engine", __QUERY_ENGINE_QUERY_RANGE)
+    valid_query_engines = [__QUERY_ENGINE_QUERY_RANGE, __QUERY_ENGINE_REMOTE_READ]
+    if query_engine not in valid_query_engines:
+        raise ValueError(
+            f"Invalid query_engine: {query_engine}. Valid values: {', '.join(valid_query_engines)}"
+        )
+
+    if "max_concurrent_queries" in configuration:
+        max_concurrent_queries_str = configuration["max_concurrent_queries"]
+        try:
+            max_concurrent_queries = int(max_concurrent_queries_str)
+        except ValueError:
+            raise ValueError(
+                f"max_concurrent_queries must be a valid integer, got: {max_concurrent_queries_str}"
+            )
+        if max_concurrent_queries <= 0:
+            raise ValueError(
+                f"max_concurrent_queries must be a positive integer, got: {max_concurrent_queries}"
+            )
+
 
 def schema(configuration: dict) -> list[dict[str, Any]]:
     """
@@ -94,16 +166,41 @@ def schema(configuration: dict) -> list[dict[str, Any]]:
     Args:
         configuration: a dictionary that holds the configuration settings for the connector.
     """
-    return [
-        {
-            "table": "metrics",
-            "primary_key": ["metric_name"],
-            "columns": {
-                "metric_name": "STRING",
-                "metric_type": "STRING",
-                "help_text": "STRING",
-            },
+    metrics_table = {
+        "table": "metrics",
+        "primary_key": ["metric_name"],
+        "columns": {
+            "metric_name": "STRING",
+            "metric_type": "STRING",
+            "help_text": "STRING",
         },
+    }
+
+    if configuration.get("output_mode") == __OUTPUT_MODE_NORMALIZED:
+        return [
+            metrics_table,
+            {
+                "table": "series",
+                "primary_key": ["series_id"],
+                "columns": {
+                    "series_id": "STRING",
+                    "metric_name": "STRING",
+                    "labels": "JSON",
+                },
+            },
+            {
+                "table": "samples",
+                "primary_key": ["series_id", "timestamp"],
+                "columns": {
+                    "series_id": "STRING",
+                    "timestamp": "UTC_DATETIME",
+                    "value": "DOUBLE",
+                },
+            },
+        ]
+
+    return [
+        metrics_table,
         {
             "table": "time_series",
             "primary_key": ["series_id", "timestamp"],
@@ -189,11 +286,20 @@ def handle_response_status(response, attempt: int) -> dict:
     Returns:
         JSON response as dictionary if successful.
     Raises:
+        QueryTooLargeError: If Prometheus rejects the query as too large.
         RuntimeError: If response indicates failure.
     """
     if response.status_code == 200:
         return response.json()
 
+    # Prometheus answers 400 when a range query exceeds the points per series limit
+    # and 422 when it would load too many samples, so the query window has to be split
+    if response.status_code in [400, 422] and (
+        "exceeded maximum resolution" in response.text or "too many samples" in response.text
+    ):
+        log.warning(f"Query rejected as too large: {response.text}")
+        raise QueryTooLargeError(f"Query rejected as too large: {response.text}")
+
     if response.status_code in [429, 500, 502, 503, 504]:
         error_message = f"Request failed with status {response.status_code}"
         handle_retry_with_backoff(attempt, error_message)
@@ -307,6 +413,49 @@ def generate_series_id(metric_name: str, labels: dict) -> str:
     return hashlib.md5(series_str.encode()).hexdigest()
 
 
+def get_series_digest(series_id: str) -> int:
+    """
+    Get the 64-bit digest of a series identifier, used to remember which series have been emitted.
+    Args:
+        series_id: Series identifier generated by generate_series_id.
+    Returns:
+        The first 8 bytes of the series identifier as an unsigned integer.
+    """
+    return int(series_id[:16], 16)
+
+
+def pack_series_digests(series_digests: set[int]) -> str:
+    """
+    Pack the digests of emitted series into a compact string for the state.
+    The digests are sorted, stored as a little-endian uint64 array, compressed with zlib, and encoded with base64.
+    Args:
+        series_digests: Digests of the emitted series.
+    Returns:
+        The packed digests.
+    """
+    packed = array("Q", sorted(series_digests))
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(zlib.compress(packed.tobytes())).decode("ascii")
+
+
+def unpack_series_digests(packed_digests: str) -> set[int]:
+    """
+    Unpack the digests of emitted series packed by pack_series_digests.
+    Args:
+        packed_digests: The packed digests, empty if no series has been emitted.
+    Returns:
+        Digests of the emitted series.
+    """
+    if not packed_digests:
+        return set()
+    digests = array("Q")
+    digests.frombytes(zlib.decompress(base64.b64decode(packed_digests)))
+    if sys.byteorder != "little":
+        digests.byteswap()
+    return set(digests)
+
+
 def parse_timestamp_to_datetime(timestamp_float: float) -> datetime:
     """
     Convert Prometheus Unix timestamp to datetime object.
@@ -345,7 +494,9 @@ def fetch_time_series_data(
         "step": f"{__QUERY_STEP_SECONDS}s",
     }
 
-    log.info(f"Fetching time-series data for query: {query}")
+    log.debug(
+        f"Fetching time-series data for query: {query} from {start_time.isoformat()} to {end_time.isoformat()}"
+    )
 
     response_data = make_api_request(url, headers, params)
 
@@ -356,10 +507,228 @@ def fetch_time_series_data(
     result_data = response_data.get("data", {})
     results = result_data.get("result", [])
 
-    log.info(f"Fetched {len(results)} time-series for query: {query}")
+    log.debug(f"Fetched {len(results)} time-series for query: {query}")
     return results
 
 
+def plan_time_windows(
+    start_time: datetime, end_time: datetime, points_per_window: int
+) -> list[tuple[datetime, datetime]]:
+    """
+    Split a time range into consecutive windows of range query evaluation timestamps.
+    The windows follow the step grid of a single range query over the whole time range, and each window
+    starts one step after the previous one ends, so no timestamp is queried twice.
+    Args:
+        start_time: Start datetime of the time range.
+        end_time: End datetime of the time range.
+        points_per_window: Maximum number of evaluation timestamps per window.
+    Returns:
+        List of (window_start, window_end) tuples in timestamp order.
+    """
+    step = timedelta(seconds=__QUERY_STEP_SECONDS)
+    window_length = step * (points_per_window - 1)
+
+    windows = []
+    window_start = start_time
+    while window_start <= end_time:
+        window_end = min(window_start + window_length, end_time)
+        windows.append((window_start, window_end))
+        window_start = window_end + step
+    return windows
+
+
+def count_window_points(start_time: datetime, end_time: datetime) -> int:
+    """
+    Count the evaluation timestamps of a range query window.
+    Args:
+        start_time: Start datetime of the window.
+        end_time: End datetime of the window.
+    Returns:
+        Number of evaluation timestamps in the window.
+    """
+    return int((end_time - start_time).total_seconds() // __QUERY_STEP_SECONDS) + 1
+
+
+def get_points_per_query(series_count: int) -> int:
+    """
+    Determine how many evaluation timestamps a range query may span for a metric, so that the query stays
+    below the points per series limit of Prometheus and below the samples per query budget.
+    Args:
+        series_count: Number of series of the metric seen in the previous window, 0 if unknown.
+    Returns:
+        Number of evaluation timestamps per range query.
+    """
+    points_per_query = __MAX_SAMPLES_PER_QUERY // max(1, series_count)
+    return max(1, min(__MAX_POINTS_PER_SERIES, points_per_query))
+
+
+def fetch_time_series_window(
+    prometheus_url: str,
+    headers: dict,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> tuple[list[dict], int]:
+    """
+    Fetch a window of time-series data, splitting it in halves while Prometheus rejects it as too large.
+    Runs in a worker thread and does not upsert or checkpoint.
+    Args:
+        prometheus_url: Base URL of Prometheus server.
+        headers: Authentication headers.
+        query: PromQL query string.
+        start_time: Start datetime of the window.
+        end_time: End datetime of the window.
+    Returns:
+        Tuple of the time-series results in timestamp order, where a series split across halves appears
+        once per half, and the largest number of series returned by a single range query.
+    """
+    try:
+        results = fetch_time_series_data(prometheus_url, headers, query, start_time, end_time)
+        return results, len(results)
+    except QueryTooLargeError:
+        points = count_window_points(start_time, end_time)
+        if points <= 1:
+            raise
+
+    log.info(
+        f"Splitting {points} steps of query {query} from {start_time.isoformat()} into two windows"
+    )
+    results = []
+    series_count = 0
+    for half_start, half_end in plan_time_windows(start_time, end_time, (points + 1) // 2):
+        half_results, half_series_count = fetch_time_series_window(
+            prometheus_url, headers, query, half_start, half_end
+        )
+        results.extend(half_results)
+        series_count = max(series_count, half_series_count)
+    return results, series_count
+
+
+def fetch_remote_read_window(
+    prometheus_url: str,
+    headers: dict,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> tuple[list[dict], int]:
+    """
+    Fetch the raw samples of a metric in a window through the streamed remote read API.
+    The response is decoded frame by frame as it arrives, so neither the response nor a JSON document is held
+    in memory. The decoded samples of the whole window are accumulated before they are returned for upserting,
+    so memory grows with the window size, and with the scrape frequency of the metric. Raw samples are read up to the start of the next window, one step after end_time, so that
+    samples between two range query evaluation timestamps are not skipped. Runs in a worker thread.
+    Args:
+        prometheus_url: Base URL of Prometheus server.
+        headers: Authentication headers.
+        query: Name of the metric.
+        start_time: Start datetime of the window.
+        end_time: End datetime of the window.
+    Returns:
+        Tuple of the time-series results in the format of range query results, with timestamps in seconds and
+        float values, and the number of series.
+    Raises:
+        RuntimeError: If the request fails after all retries or Prometheus does not stream the response.
+    """
+    url = build_prometheus_url(prometheus_url, "/api/v1/read")
+    start_ms = int(start_time.timestamp() * 1000)
+    end_ms = int(end_time.timestamp() * 1000) + __QUERY_STEP_SECONDS * 1000 - 1
+    body = remote_read.build_read_request(query, start_ms, end_ms)
+    request_headers = {**headers, **remote_read.REQUEST_HEADERS}
+
+    log.debug(f"Reading raw samples for metric: {query} from {start_time.isoformat()}")
+
+    for attempt in range(__MAX_RETRIES):
+        try:
+            with requests.post(
+                url,
+                headers=request_headers,
+                data=body,
+                stream=True,
+                timeout=__REQUEST_TIMEOUT_SECONDS,
+            ) as response:
+                if response.status_code in [429, 500, 502, 503, 504]:
+                    error_message = f"Remote read failed with status {response.status_code}"
+                    handle_retry_with_backoff(attempt, error_message)
+                    continue
+
+                if response.status_code != 200:
+                    log.error(
+                        f"Remote read failed with status {response.status_code}: {response.text}"
+                    )
+                    raise RuntimeError(
+                        f"Remote read failed with status {response.status_code}: {response.text}"
+                    )
+
+                content_type = response.headers.get("Content-Type")
+                if not remote_read.is_streamed_response(content_type):
+                    log.error(f"Remote read response is not streamed: {content_type}")
+                    raise RuntimeError(
+                        f"Remote read response is not streamed ({content_type}), "
+                        "streamed remote read requires Prometheus 2.13 or later"
+                    )
+
+                results = []
+                skipped_chunks = 0
+                byte_chunks = response.iter_content(chunk_size=__REMOTE_READ_CHUNK_BYTES)
+                for labels, samples, series_skipped_chunks in remote_read.iter_series(
+                    byte_chunks, start_ms, end_ms
+                ):
+                    skipped_chunks += series_skipped_chunks
+                    values = [(timestamp / 1000, value) for timestamp, value in samples]
+                    # A series with many chunks is split across consecutive frames
+                    if results and results[-1]["metric"] == labels:
+                        results[-1]["values"].extend(values)
+                    else:
+                        results.append({"metric": labels, "values": values})
+
+                if skipped_chunks:
+                    log.warning(
+                        f"Skipped {skipped_chunks} chunks of metric {query} without float samples"
+                    )
+                return results, len(results)
+
+        except requests.Timeout:
+            handle_retry_with_backoff(attempt, "Request timeout")
+
+        except requests.RequestException as e:
+            log.error(f"Request failed: {str(e)}")
+            raise RuntimeError(f"Request failed: {str(e)}")
+
+    raise RuntimeError("Failed to complete API request")
+
+
+def run_queries_in_order(executor: ThreadPoolExecutor, queries: list, max_in_flight: int):
+    """
+    Run range queries in a pool of worker threads and yield their results in the order of the queries.
+    At most max_in_flight queries are submitted at a time, so only a bounded number of results is held in memory.
+    Args:
+        executor: Thread pool running the queries.
+        queries: List of (metric_name, query function without arguments) tuples.
+        max_in_flight: Maximum number of queries submitted ahead of the caller.
+    Yields:
+        Tuples of metric name and the result of its query function.
+    """
+    pending = iter(queries)
+    in_flight = deque()
+    try:
+        for metric_name, query in pending:
+            in_flight.append((metric_name, executor.submit(query)))
+            if len(in_flight) >= max_in_flight:
+                break
+
+        while in_flight:
+            metric_name, future = in_flight.popleft()
+            result = future.result()
+            next_query = next(pending, None)
+            if next_query is not None:
+                in_flight.append((next_query[0], executor.submit(next_query[1])))
+            yield metric_name, result
+    finally:
+        # Do not start the remaining queries if upserting failed
+        for _, future in in_flight:
+            future.cancel()
+
+
 def process_and_upsert_time_series_result(result: dict) -> int:
     """
     Process a single time-series result and upsert data points directly.
@@ -392,6 +761,52 @@ def process_and_upsert_time_series_result(result: dict) -> int:
     return data_points_count
 
 
+def process_and_upsert_series_samples(result: dict, emitted_series: set[int]) -> int:
+    """
+    Process a single time-series result into the normalized series and samples tables.
+    The series row holding the metric name and labels is upserted only if the series has not been emitted
+    before, in this sync or a previous one, and each data point is upserted as a slim sample row.
+    Args:
+        result: Time-series result dictionary from Prometheus.
+        emitted_series: Digests of the series emitted so far, updated with the series of the result.
+    Returns:
+        Number of data points upserted.
+    """
+    metric_labels = result.get("metric", {})
+    metric_name = metric_labels.pop("__name__", "unknown")
+    values = result.get("values", [])
+
+    series_id = generate_series_id(metric_name, metric_labels)
+
+    series_digest = get_series_digest(series_id)
+    if series_digest not in emitted_series:
+        series_record = {
+            "series_id": series_id,
+            "metric_name": metric_name,
+            "labels": metric_labels,
+        }
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The first argument is the name of the destination table.
+        # The second argument is a dictionary containing the record to be upserted.
+        op.upsert(table="series", data=series_record)
+        emitted_series.add(series_digest)
+
+    data_points_count = 0
+    for timestamp_float, value_str in values:
+        sample = {
+            "series_id": series_id,
+            "timestamp": parse_timestamp_to_datetime(timestamp_float),
+            "value": float(value_str),
+        }
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The first argument is the name of the destination table.
+        # The second argument is a dictionary containing the record to be upserted.
+        op.upsert(table="samples", data=sample)
+        data_points_count += 1
+
+    return data_points_count
+
+
 def get_sync_time_range(state: dict, configuration: dict) -> tuple[datetime, datetime]:
     """
     Determine the time range for syncing based on state and configuration.
@@ -425,9 +840,16 @@ def sync_time_series_for_metrics(
     start_time: datetime,
     end_time: datetime,
     state: dict,
+    max_concurrent_queries: int = __DEFAULT_MAX_CONCURRENT_QUERIES,
+    output_mode: str = __OUTPUT_MODE_TIME_SERIES,
+    query_engine: str = __QUERY_ENGINE_QUERY_RANGE,
 ) -> None:
     """
     Sync time-series data for specified metrics.
+    The time range is split into windows of at most __MAX_POINTS_PER_SERIES steps, which are synced in timestamp
+    order and checkpointed once all metrics are synced up to the end of the window. Within a window, each metric
+    is split further into range queries of at most __MAX_SAMPLES_PER_QUERY samples, based on the number of series
+    it returned in the previous window, and the queries of all metrics run concurrently.
     Args:
         prometheus_url: Base URL of Prometheus server.
         headers: Authentication headers.
@@ -435,45 +857,83 @@ def sync_time_series_for_metrics(
         start_time: Start datetime for range query.
         end_time: End datetime for range query.
         state: State dictionary for checkpointing.
+        max_concurrent_queries: Maximum number of range queries run concurrently.
+        output_mode: Either time_series, to upsert data points with their labels into the time_series table, or
+            normalized, to upsert each series once into the series table and data points into the samples table.
+        query_engine: Either query_range, to evaluate the metrics at each step with JSON range queries, or
+            remote_read, to read the raw samples of the metrics through the streamed remote read API.
     """
     log.info(f"Starting sync of time-series data for {len(metric_names)} metrics")
 
-    total_data_points = 0
-    metrics_synced = 0
-
-    for metric_name in metric_names:
-        query = f"{metric_name}"
-
-        results = fetch_time_series_data(prometheus_url, headers, query, start_time, end_time)
-
-        batch_data_points = 0
-
-        for result in results:
-            # Process and upsert data points directly without creating intermediate lists
-            num_data_points = process_and_upsert_time_series_result(result)
-            batch_data_points += num_data_points
-
-            if batch_data_points >= __CHECKPOINT_BATCH_SIZE:
-                total_data_points += batch_data_points
-                state["last_sync_timestamp"] = end_time.isoformat()
-                # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
-                # from the correct position in case of next sync or interruptions.
-                # Learn more about how and where to checkpoint by reading our best practices documentation
-                # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
-                op.checkpoint(state)
-
-                log.info(f"Checkpointed {total_data_points} data points")
-                batch_data_points = 0
+    step = timedelta(seconds=__QUERY_STEP_SECONDS)
+    windows = plan_time_windows(start_time, end_time, __MAX_POINTS_PER_SERIES)
+    max_in_flight = max_concurrent_queries * __IN_FLIGHT_PER_WORKER
+    if query_engine == __QUERY_ENGINE_REMOTE_READ:
+        fetch_window = fetch_remote_read_window
+    else:
+        fetch_window = fetch_time_series_window
 
-        if batch_data_points:
-            state["last_sync_timestamp"] = end_time.isoformat()
+    total_data_points = 0
+    series_counts = {}
+
+    # In normalized mode, the digests of the series upserted in previous syncs are kept in the state,
+    # so that each series row is upserted only once
+    emitted_series = None
+    if output_mode == __OUTPUT_MODE_NORMALIZED:
+        emitted_series = unpack_series_digests(state.get("emitted_series", ""))
+        log.info(f"Loaded {len(emitted_series)} series emitted in previous syncs")
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_queries) as executor:
+        for window_number, (window_start, window_end) in enumerate(windows, start=1):
+            queries = []
+            for metric_name in metric_names:
+                points_per_query = get_points_per_query(series_counts.get(metric_name, 0))
+                for query_start, query_end in plan_time_windows(
+                    window_start, window_end, points_per_query
+                ):
+                    query = partial(
+                        fetch_window,
+                        prometheus_url,
+                        headers,
+                        metric_name,
+                        query_start,
+                        query_end,
+                    )
+                    queries.append((metric_name, query))
+
+            window_data_points = 0
+            window_series_counts = {}
+            for metric_name, (results, series_count) in run_queries_in_order(
+                executor, queries, max_in_flight
+            ):
+                window_series_counts[metric_name] = max(
+                    window_series_counts.get(metric_name, 0), series_count
+                )
+                for result in results:
+                    # Process and upsert data points directly without creating intermediate lists
+                    if emitted_series is None:
+                        window_data_points += process_and_upsert_time_series_result(result)
+                    else:
+                        window_data_points += process_and_upsert_series_samples(
+                            result, emitted_series
+                        )
+            series_counts = window_series_counts
+            total_data_points += window_data_points
+
+            # The next sync resumes at the first step after this window
+            state["last_sync_timestamp"] = min(window_end + step, end_time).isoformat()
+            if emitted_series is not None:
+                state["emitted_series"] = pack_series_digests(emitted_series)
+            # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
+            # from the correct position in case of next sync or interruptions.
+            # Learn more about how and where to checkpoint by reading our best practices documentation
+            # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
             op.checkpoint(state)
-            total_data_points += batch_data_points
-            log.info(f"Completed Checkpointed {total_data_points} data points")
-        metrics_synced += 1
 
-        if metrics_synced % 10 == 0:
-            log.info(f"Synced {metrics_synced}/{len(metric_names)} metrics")
+            log.info(
+                f"Synced window {window_number}/{len(windows)} up to {window_end.isoformat()} "
+                f"with {window_data_points} data points in {len(queries)} range queries"
+            )
 
     state["last_sync_timestamp"] = end_time.isoformat()
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
@@ -483,7 +943,7 @@ def sync_time_series_for_metrics(
     op.checkpoint(state)
 
     log.info(
-        f"Completed sync of {metrics_synced} metrics with {total_data_points} total data points"
+        f"Completed sync of {len(metric_names)} metrics with {total_data_points} total data points"
     )
 
 
@@ -518,8 +978,20 @@ def update(configuration: dict, state: dict) -> None:
         log.info(f"Filtered to {len(filtered_metrics)} metrics based on configuration filter")
         metric_names = filtered_metrics
 
+    max_concurrent_queries = int(
+        configuration.get("max_concurrent_queries", __DEFAULT_MAX_CONCURRENT_QUERIES)
+    )
+
     sync_time_series_for_metrics(
-        prometheus_url, headers, metric_names, start_time, end_time, state
+        prometheus_url,
+        headers,
+        metric_names,
+        start_time,
+        end_time,
+        state,
+        max_concurrent_queries,
+        configuration.get("output_mode", __OUTPUT_MODE_TIME_SERIES),
+        configuration.get("query_engine", __QUERY_ENGINE_QUERY_RANGE),
     )
 
     log.info("Prometheus connector sync completed successfully")
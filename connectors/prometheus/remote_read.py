@@ -0,0 +1,408 @@
+"""Prometheus remote read client helpers for the Prometheus connector.
+Builds remote read requests and decodes streamed remote read responses, the
+STREAMED_XOR_CHUNKS response type of the /api/v1/read endpoint, without protobuf or snappy dependencies.
+See the remote read API documentation (https://prometheus.io/docs/prometheus/latest/querying/remote_read_api/)
+for details of the protocol.
+"""
+
+# For converting the 64-bit patterns of XOR encoded values to floats
+import struct
+
+# For type hints in function signatures
+from typing import Iterable, Iterator
+
+# Headers of a remote read request, whose body is a snappy compressed ReadRequest protobuf message
+REQUEST_HEADERS = {
+    "Content-Encoding": "snappy",
+    "Content-Type": "application/x-protobuf",
+    "X-Prometheus-Remote-Read-Version": "0.1.0",
+}
+
+# Content type of a streamed remote read response, a stream of ChunkedReadResponse frames
+STREAMED_CONTENT_TYPE = "application/x-streamed-protobuf; proto=prometheus.ChunkedReadResponse"
+
+# ReadRequest.ResponseType value asking Prometheus to stream XOR encoded chunks
+_STREAMED_XOR_CHUNKS = 1
+
+# Chunk.Encoding value of XOR encoded float samples
+_CHUNK_ENCODING_XOR = 1
+
+# Protobuf wire types
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_FIXED64 = 1
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+_WIRE_TYPE_FIXED32 = 5
+
+# Bit pattern of the NaN value Prometheus writes as a staleness marker, which is not a real sample
+_STALE_NAN_BITS = 0x7FF0000000000002
+
+
+def encode_uvarint(value: int) -> bytes:
+    """
+    Encode an unsigned integer as a protobuf varint.
+    Args:
+        value: Unsigned integer, negative int64 values must be passed as their 64-bit two's complement.
+    Returns:
+        The varint bytes.
+    """
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_uvarint(data, position: int) -> tuple[int, int]:
+    """
+    Decode a protobuf varint.
+    Args:
+        data: Bytes holding the varint.
+        position: Offset of the varint in data.
+    Returns:
+        Tuple of the decoded value and the offset following the varint.
+    Raises:
+        IndexError: If data ends before the varint does.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_field(field_number: int, value: bytes) -> bytes:
+    """
+    Encode a length-delimited protobuf field.
+    Args:
+        field_number: Number of the field in the message.
+        value: Encoded message, string, or packed repeated field.
+    Returns:
+        The encoded field.
+    """
+    return b"".join(
+        [
+            encode_uvarint((field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED),
+            encode_uvarint(len(value)),
+            value,
+        ]
+    )
+
+
+def encode_varint_field(field_number: int, value: int) -> bytes:
+    """
+    Encode a varint protobuf field, such as an int64 or enum.
+    Args:
+        field_number: Number of the field in the message.
+        value: Field value.
+    Returns:
+        The encoded field.
+    """
+    return encode_uvarint((field_number << 3) | _WIRE_TYPE_VARINT) + encode_uvarint(
+        value & 0xFFFFFFFFFFFFFFFF
+    )
+
+
+def iter_fields(data) -> Iterator[tuple[int, int | memoryview]]:
+    """
+    Iterate over the fields of a protobuf message.
+    Args:
+        data: Encoded message.
+    Yields:
+        Tuples of field number and value, an integer for varint fields and a memoryview for
+        length-delimited fields. Fixed width fields are skipped, as none are used by remote read.
+    """
+    data = memoryview(data)
+    position = 0
+    while position < len(data):
+        key, position = decode_uvarint(data, position)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == _WIRE_TYPE_VARINT:
+            value, position = decode_uvarint(data, position)
+            yield field_number, value
+        elif wire_type == _WIRE_TYPE_LENGTH_DELIMITED:
+            length, position = decode_uvarint(data, position)
+            yield field_number, data[position : position + length]
+            position += length
+        elif wire_type == _WIRE_TYPE_FIXED64:
+            position += 8
+        elif wire_type == _WIRE_TYPE_FIXED32:
+            position += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+
+
+def to_int64(value: int) -> int:
+    """
+    Interpret a decoded varint as a signed int64 field value.
+    Args:
+        value: Decoded varint.
+    Returns:
+        The signed value.
+    """
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def snappy_encode_literals(data: bytes) -> bytes:
+    """
+    Wrap data in the snappy block format using only literal elements, without compressing it.
+    Remote read requests must be snappy encoded. They are only a few bytes long, so compressing them
+    is not worth a dependency on a snappy library.
+    Args:
+        data: Uncompressed bytes.
+    Returns:
+        A valid snappy block holding data.
+    """
+    encoded = bytearray(encode_uvarint(len(data)))
+    for offset in range(0, len(data), 65536):
+        literal = data[offset : offset + 65536]
+        length = len(literal) - 1
+        if length < 60:
+            encoded.append(length << 2)
+        elif length < 256:
+            encoded.append(60 << 2)
+            encoded.append(length)
+        else:
+            encoded.append(61 << 2)
+            encoded += length.to_bytes(2, "little")
+        encoded += literal
+    return bytes(encoded)
+
+
+def build_read_request(metric_name: str, start_ms: int, end_ms: int) -> bytes:
+    """
+    Build the body of a remote read request for all series of a metric.
+    Args:
+        metric_name: Name of the metric, matched exactly against the __name__ label.
+        start_ms: Start of the time range in Unix milliseconds, inclusive.
+        end_ms: End of the time range in Unix milliseconds, inclusive.
+    Returns:
+        Snappy encoded ReadRequest protobuf message accepting only streamed XOR chunks.
+    """
+    # LabelMatcher with the default EQ type, so only name and value are set
+    matcher = encode_field(2, b"__name__") + encode_field(3, metric_name.encode())
+    query = b"".join(
+        [
+            encode_varint_field(1, start_ms),
+            encode_varint_field(2, end_ms),
+            encode_field(3, matcher),
+        ]
+    )
+    read_request = encode_field(1, query) + encode_field(2, encode_uvarint(_STREAMED_XOR_CHUNKS))
+    return snappy_encode_literals(read_request)
+
+
+def is_streamed_response(content_type: str | None) -> bool:
+    """
+    Check that Prometheus answered a remote read request with streamed chunks. Prometheus versions before 2.13
+    ignore the accepted response types and answer with a single snappy compressed message instead.
+    Args:
+        content_type: Content-Type header of the response.
+    Returns:
+        True if the response is a stream of ChunkedReadResponse frames.
+    """
+    return (content_type or "").replace(" ", "") == STREAMED_CONTENT_TYPE.replace(" ", "")
+
+
+def iter_frames(byte_chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split a streamed remote read response into its frames.
+    Each frame is the varint length of the message, the CRC32C checksum of the message as 4 big-endian bytes,
+    and the message. Only the frame being read is buffered. The checksum is not verified, because the standard
+    library has no CRC32C implementation and the transport already detects corrupted data.
+    Args:
+        byte_chunks: Response body as an iterable of byte strings of any size.
+    Yields:
+        The ChunkedReadResponse message of each frame.
+    Raises:
+        RuntimeError: If the response ends in the middle of a frame.
+    """
+    buffer = bytearray()
+    for byte_chunk in byte_chunks:
+        buffer += byte_chunk
+        while buffer:
+            try:
+                length, position = decode_uvarint(buffer, 0)
+            except IndexError:
+                break
+            frame_end = position + 4 + length
+            if len(buffer) < frame_end:
+                break
+            yield bytes(buffer[position + 4 : frame_end])
+            del buffer[:frame_end]
+    if buffer:
+        raise RuntimeError("Remote read response ended in the middle of a frame")
+
+
+class _BitReader:
+    """Reads big-endian bit fields from the bit stream of an XOR chunk."""
+
+    def __init__(self, data: bytes, position: int):
+        self.data = data
+        self.position = position * 8
+
+    def read_bits(self, count: int) -> int:
+        """
+        Read an unsigned integer of count bits.
+        Args:
+            count: Number of bits, at most 64.
+        Returns:
+            The value of the bits.
+        """
+        first_byte = self.position >> 3
+        last_byte = (self.position + count + 7) >> 3
+        if last_byte > len(self.data):
+            raise ValueError("XOR chunk ended before all of its samples were read")
+        window = int.from_bytes(self.data[first_byte:last_byte], "big")
+        unused_bits = (last_byte << 3) - self.position - count
+        self.position += count
+        return (window >> unused_bits) & ((1 << count) - 1)
+
+    def read_bit(self) -> int:
+        """
+        Read a single bit.
+        Returns:
+            0 or 1.
+        """
+        byte = self.data[self.position >> 3]
+        bit = (byte >> (7 - (self.position & 7))) & 1
+        self.position += 1
+        return bit
+
+    def read_uvarint(self) -> int:
+        """
+        Read a varint written byte by byte into the bit stream.
+        Returns:
+            The decoded unsigned value.
+        """
+        value = 0
+        shift = 0
+        while True:
+            byte = self.read_bits(8)
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+
+def decode_xor_chunk(data: bytes) -> Iterator[tuple[int, float]]:
+    """
+    Decode the samples of an XOR encoded chunk, the Gorilla compression used by the Prometheus TSDB.
+    The chunk starts with the number of samples as 2 big-endian bytes. The first sample holds the timestamp as
+    a zigzag varint and the value as 64 bits. The second sample holds the timestamp delta as a varint. Later
+    samples hold the delta of the timestamp delta in a variable number of bits. Each value after the first is
+    XORed with the previous value and only the meaningful bits of the result are stored.
+    Args:
+        data: Chunk data including the sample count header.
+    Yields:
+        Tuples of timestamp in Unix milliseconds and the 64-bit pattern of the value, in timestamp order.
+    Raises:
+        ValueError: If the chunk ends before all of its samples are read.
+    """
+    sample_count = int.from_bytes(data[:2], "big")
+    if sample_count == 0:
+        return
+
+    reader = _BitReader(data, 2)
+    zigzag_timestamp = reader.read_uvarint()
+    timestamp = (zigzag_timestamp >> 1) ^ -(zigzag_timestamp & 1)
+    value_bits = reader.read_bits(64)
+    yield timestamp, value_bits
+
+    timestamp_delta = 0
+    leading_zeros = 0
+    trailing_zeros = 0
+    for sample_index in range(1, sample_count):
+        if sample_index == 1:
+            timestamp_delta = reader.read_uvarint()
+        else:
+            # The number of leading 1 bits, up to 4, selects the bit width of the delta of delta
+            prefix = 0
+            while prefix < 4 and reader.read_bit():
+                prefix += 1
+            if prefix == 4:
+                delta_of_delta = to_int64(reader.read_bits(64))
+            elif prefix:
+                width = (14, 17, 20)[prefix - 1]
+                delta_of_delta = reader.read_bits(width)
+                if delta_of_delta > 1 << (width - 1):
+                    delta_of_delta -= 1 << width
+            else:
+                delta_of_delta = 0
+            timestamp_delta += delta_of_delta
+        timestamp += timestamp_delta
+
+        if reader.read_bit():
+            if reader.read_bit():
+                leading_zeros = reader.read_bits(5)
+                significant_bits = reader.read_bits(6) or 64
+                trailing_zeros = 64 - leading_zeros - significant_bits
+            significant_bits = 64 - leading_zeros - trailing_zeros
+            value_bits ^= reader.read_bits(significant_bits) << trailing_zeros
+        yield timestamp, value_bits
+
+
+def decode_chunked_series(
+    message, start_ms: int, end_ms: int
+) -> tuple[dict, list[tuple[int, float]], int]:
+    """
+    Decode a ChunkedSeries message into its labels and the samples within a time range.
+    Prometheus returns whole chunks, which can hold samples outside the requested time range.
+    Chunks entirely outside the time range are not decoded.
+    Args:
+        message: Encoded ChunkedSeries message.
+        start_ms: Start of the time range in Unix milliseconds, inclusive.
+        end_ms: End of the time range in Unix milliseconds, inclusive.
+    Returns:
+        Tuple of the labels of the series, its samples as (timestamp in Unix milliseconds, value) tuples in
+        timestamp order without staleness markers, and the number of chunks skipped because they do not hold
+        XOR encoded float samples, such as native histogram chunks.
+    """
+    labels = {}
+    timestamps = []
+    value_bits = []
+    skipped_chunks = 0
+    for field_number, value in iter_fields(message):
+        if field_number == 1:
+            label = dict(iter_fields(value))
+            labels[bytes(label.get(1, b"")).decode()] = bytes(label.get(2, b"")).decode()
+        elif field_number == 2:
+            chunk = dict(iter_fields(value))
+            if chunk.get(3, 0) != _CHUNK_ENCODING_XOR:
+                skipped_chunks += 1
+                continue
+            if to_int64(chunk.get(2, 0)) < start_ms or to_int64(chunk.get(1, 0)) > end_ms:
+                continue
+            for timestamp, bits in decode_xor_chunk(bytes(chunk.get(4, b""))):
+                if start_ms <= timestamp <= end_ms and bits != _STALE_NAN_BITS:
+                    timestamps.append(timestamp)
+                    value_bits.append(bits)
+
+    # Reinterpret all 64-bit patterns of the series as floats at once
+    count = len(value_bits)
+    values = struct.unpack(f">{count}d", struct.pack(f">{count}Q", *value_bits))
+    return labels, list(zip(timestamps, values)), skipped_chunks
+
+
+def iter_series(
+    byte_chunks: Iterable[bytes], start_ms: int, end_ms: int
+) -> Iterator[tuple[dict, list[tuple[int, float]], int]]:
+    """
+    Decode a streamed remote read response frame by frame, so that only one frame is held in memory.
+    Prometheus can split the chunks of a series with many samples across consecutive frames.
+    Args:
+        byte_chunks: Response body as an iterable of byte strings of any size.
+        start_ms: Start of the requested time range in Unix milliseconds, inclusive.
+        end_ms: End of the requested time range in Unix milliseconds, inclusive.
+    Yields:
+        Tuples of the labels of a series, its samples within the time range, and the number of skipped chunks,
+        once per frame the series appears in.
+    """
+    for frame in iter_frames(byte_chunks):
+        for field_number, value in iter_fields(frame):
+            if field_number == 1:
+                yield decode_chunked_series(value, start_ms, end_ms)
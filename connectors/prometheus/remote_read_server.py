@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Prometheus Remote Read Stand-in Server
+Serves recorded series from a fixture file through the two Prometheus endpoints the connector uses with the
+remote_read query engine, so that the engine can be run and checked locally without a Prometheus server:
+
+- GET /api/v1/label/__name__/values returns the metric names of the fixture.
+- POST /api/v1/read streams the samples of the requested series as XOR encoded chunks of up to 120 samples,
+  the STREAMED_XOR_CHUNKS response type, with at most --chunks-per-frame chunks per frame.
+
+The fixture holds a list of series, each with its labels and its samples as [timestamp in Unix milliseconds,
+value] pairs. The timestamps are shifted so that the last sample of the fixture lands at the time the server
+starts, so that the default lookback of the connector covers the fixture.
+
+Usage:
+    python remote_read_server.py --fixture fixtures/remote_read_series.json --port 9201
+Then run the connector with "prometheus_url": "http://localhost:9201" and "query_engine": "remote_read".
+"""
+
+# For parsing command line arguments
+import argparse
+
+# For reading the fixture and answering the metric names endpoint
+import json
+
+# For matching regular expression label matchers
+import re
+
+# For converting sample values to their 64-bit patterns
+import struct
+
+# For the time the fixture timestamps are shifted to
+import time
+
+# For serving the endpoints
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The protobuf and snappy helpers shared with the connector
+import remote_read
+
+# Maximum number of samples per chunk, as in the Prometheus TSDB
+SAMPLES_PER_CHUNK = 120
+
+# Lookup table of the CRC32C (Castagnoli) checksum of the frames
+CRC32C_TABLE = []
+for table_index in range(256):
+    crc = table_index
+    for _ in range(8):
+        crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+    CRC32C_TABLE.append(crc)
+
+
+def crc32c(data: bytes) -> int:
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc = CRC32C_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+class BitWriter:
+    """Writes big-endian bit fields, like the bit stream of the Prometheus TSDB."""
+
+    def __init__(self):
+        self.value = 0
+        self.bit_count = 0
+
+    def write_bits(self, value: int, count: int):
+        self.value = (self.value << count) | (value & ((1 << count) - 1))
+        self.bit_count += count
+
+    def write_uvarint(self, value: int):
+        for byte in remote_read.encode_uvarint(value):
+            self.write_bits(byte, 8)
+
+    def to_bytes(self) -> bytes:
+        padding = -self.bit_count % 8
+        return (self.value << padding).to_bytes((self.bit_count + padding) // 8, "big")
+
+
+def fits_bit_range(value: int, width: int) -> bool:
+    return -((1 << (width - 1)) - 1) <= value <= 1 << (width - 1)
+
+
+def encode_xor_chunk(samples: list) -> bytes:
+    """
+    Encode samples as an XOR chunk, following the appender of the Prometheus TSDB.
+    Args:
+        samples: [timestamp in Unix milliseconds, value] pairs in timestamp order, at most SAMPLES_PER_CHUNK.
+    Returns:
+        Chunk data including the sample count header.
+    """
+    writer = BitWriter()
+    previous_timestamp = previous_delta = previous_bits = 0
+    # No previous window yet, as a non-zero XOR never has 64 leading zeros
+    leading_zeros = trailing_zeros = 64
+    for index, (timestamp, value) in enumerate(samples):
+        value_bits = struct.unpack(">Q", struct.pack(">d", value))[0]
+        if index == 0:
+            writer.write_uvarint((timestamp << 1) ^ (timestamp >> 63))
+            writer.write_bits(value_bits, 64)
+        else:
+            delta = timestamp - previous_timestamp
+            if index == 1:
+                writer.write_uvarint(delta)
+            else:
+                delta_of_delta = delta - previous_delta
+                if delta_of_delta == 0:
+                    writer.write_bits(0, 1)
+                elif fits_bit_range(delta_of_delta, 14):
+                    writer.write_bits(0b10, 2)
+                    writer.write_bits(delta_of_delta, 14)
+                elif fits_bit_range(delta_of_delta, 17):
+                    writer.write_bits(0b110, 3)
+                    writer.write_bits(delta_of_delta, 17)
+                elif fits_bit_range(delta_of_delta, 20):
+                    writer.write_bits(0b1110, 4)
+                    writer.write_bits(delta_of_delta, 20)
+                else:
+                    writer.write_bits(0b1111, 4)
+                    writer.write_bits(delta_of_delta, 64)
+            previous_delta = delta
+
+            xor = value_bits ^ previous_bits
+            if xor == 0:
+                writer.write_bits(0, 1)
+            else:
+                writer.write_bits(1, 1)
+                new_leading = min(64 - xor.bit_length(), 31)
+                new_trailing = (xor & -xor).bit_length() - 1
+                # Reuse the previous leading and trailing zero counts if the meaningful bits fit in them
+                if new_leading >= leading_zeros and new_trailing >= trailing_zeros:
+                    writer.write_bits(0, 1)
+                else:
+                    leading_zeros, trailing_zeros = new_leading, new_trailing
+                    writer.write_bits(1, 1)
+                    writer.write_bits(leading_zeros, 5)
+                    writer.write_bits(64 - leading_zeros - trailing_zeros, 6)
+                significant_bits = 64 - leading_zeros - trailing_zeros
+                writer.write_bits(xor >> trailing_zeros, significant_bits)
+        previous_timestamp = timestamp
+        previous_bits = value_bits
+    return len(samples).to_bytes(2, "big") + writer.to_bytes()
+
+
+def snappy_decode_literals(data: bytes) -> bytes:
+    """Decode a snappy block made of literal elements only, as written by the connector."""
+    length, position = remote_read.decode_uvarint(data, 0)
+    decoded = bytearray()
+    while position < len(data):
+        tag = data[position]
+        position += 1
+        if tag & 0x03:
+            raise ValueError("Only literal snappy elements are supported")
+        literal_length = tag >> 2
+        if literal_length >= 60:
+            byte_count = literal_length - 59
+            literal_length = int.from_bytes(data[position : position + byte_count], "little")
+            position += byte_count
+        literal_length += 1
+        decoded += data[position : position + literal_length]
+        position += literal_length
+    if len(decoded) != length:
+        raise ValueError("Snappy block length mismatch")
+    return bytes(decoded)
+
+
+def matches(labels: dict, matchers: list) -> bool:
+    for matcher_type, name, value in matchers:
+        label_value = labels.get(name, "")
+        if matcher_type == 0 and label_value != value:
+            return False
+        if matcher_type == 1 and label_value == value:
+            return False
+        if matcher_type == 2 and not re.fullmatch(value, label_value):
+            return False
+        if matcher_type == 3 and re.fullmatch(value, label_value):
+            return False
+    return True
+
+
+class RemoteReadHandler(BaseHTTPRequestHandler):
+    series = []
+    chunks_per_frame = 4
+
+    def do_GET(self):
+        if not self.path.startswith("/api/v1/label/__name__/values"):
+            self.send_error(404)
+            return
+        names = sorted({series["labels"]["__name__"] for series in self.series})
+        body = json.dumps({"status": "success", "data": names}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != "/api/v1/read":
+            self.send_error(404)
+            return
+        request = snappy_decode_literals(self.rfile.read(int(self.headers["Content-Length"])))
+        fields = list(remote_read.iter_fields(request))
+        accepted_types = set()
+        for number, value in fields:
+            if number == 2 and isinstance(value, int):
+                accepted_types.add(value)
+            elif number == 2:
+                # Packed repeated enum
+                position = 0
+                while position < len(value):
+                    accepted_type, position = remote_read.decode_uvarint(value, position)
+                    accepted_types.add(accepted_type)
+        if 1 not in accepted_types:
+            self.send_error(400, "Only the STREAMED_XOR_CHUNKS response type is supported")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", remote_read.STREAMED_CONTENT_TYPE)
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        queries = [value for number, value in fields if number == 1]
+        for query_index, query in enumerate(queries):
+            query_fields = list(remote_read.iter_fields(query))
+            start_ms = remote_read.to_int64(dict(query_fields).get(1, 0))
+            end_ms = remote_read.to_int64(dict(query_fields).get(2, 0))
+            matchers = []
+            for number, value in query_fields:
+                if number == 3:
+                    matcher = dict(remote_read.iter_fields(value))
+                    matchers.append(
+                        (
+                            matcher.get(1, 0),
+                            bytes(matcher.get(2, b"")).decode(),
+                            bytes(matcher.get(3, b"")).decode(),
+                        )
+                    )
+            for series in self.series:
+                if matches(series["labels"], matchers):
+                    self.write_series(series, start_ms, end_ms, query_index)
+        self.wfile.flush()
+
+    def write_series(self, series: dict, start_ms: int, end_ms: int, query_index: int):
+        # Like Prometheus, return every whole chunk that overlaps the time range
+        samples = series["samples"]
+        chunks = []
+        for offset in range(0, len(samples), SAMPLES_PER_CHUNK):
+            chunk_samples = samples[offset : offset + SAMPLES_PER_CHUNK]
+            if chunk_samples[-1][0] < start_ms or chunk_samples[0][0] > end_ms:
+                continue
+            chunk = [
+                remote_read.encode_varint_field(1, chunk_samples[0][0]),
+                remote_read.encode_varint_field(2, chunk_samples[-1][0]),
+                remote_read.encode_varint_field(3, 1),
+                remote_read.encode_field(4, encode_xor_chunk(chunk_samples)),
+            ]
+            chunks.append(b"".join(chunk))
+        labels = b"".join(
+            remote_read.encode_field(
+                1,
+                b"".join(
+                    [
+                        remote_read.encode_field(1, name.encode()),
+                        remote_read.encode_field(2, value.encode()),
+                    ]
+                ),
+            )
+            for name, value in sorted(series["labels"].items())
+        )
+        for offset in range(0, len(chunks), self.chunks_per_frame):
+            chunked_series = labels + b"".join(
+                remote_read.encode_field(2, chunk)
+                for chunk in chunks[offset : offset + self.chunks_per_frame]
+            )
+            message = remote_read.encode_field(
+                1, chunked_series
+            ) + remote_read.encode_varint_field(2, query_index)
+            frame = [
+                remote_read.encode_uvarint(len(message)),
+                crc32c(message).to_bytes(4, "big"),
+                message,
+            ]
+            self.wfile.write(b"".join(frame))
+
+
+def load_fixture(path: str) -> list:
+    """
+    Load the series of a fixture and shift their timestamps so that the last sample lands at the current time.
+    """
+    with open(path, "r") as f:
+        series_list = json.load(f)["series"]
+    last_timestamp = max(series["samples"][-1][0] for series in series_list)
+    shift = int(time.time() * 1000) - last_timestamp
+    for series in series_list:
+        series["samples"] = [
+            [timestamp + shift, float(value)] for timestamp, value in series["samples"]
+        ]
+    return series_list
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve fixture series through the Prometheus remote read API"
+    )
+    parser.add_argument(
+        "--fixture", default="fixtures/remote_read_series.json", help="Fixture file"
+    )
+    parser.add_argument("--port", type=int, default=9201, help="Port to listen on")
+    parser.add_argument("--chunks-per-frame", type=int, default=4, help="Maximum chunks per frame")
+    arguments = parser.parse_args()
+
+    RemoteReadHandler.series = load_fixture(arguments.fixture)
+    RemoteReadHandler.chunks_per_frame = arguments.chunks_per_frame
+    server = ThreadingHTTPServer(("localhost", arguments.port), RemoteReadHandler)
+    print(f"Serving {len(RemoteReadHandler.series)} series on http://localhost:{arguments.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Shared pytest fixtures for the Prometheus connector tests."""
+
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fivetran_connector_sdk import Logging as _sdk_logging  # noqa: E402
+
+import remote_read_server  # noqa: E402
+
+if _sdk_logging.LOG_LEVEL is None:
+    _sdk_logging.LOG_LEVEL = _sdk_logging.Level.INFO
+
+_FIXTURE_PATH = Path(__file__).parent.parent / "fixtures" / "remote_read_series.json"
+
+
+@pytest.fixture
+def fixture_series():
+    """Series of the remote read fixture, shifted so that the last sample lands at the current time."""
+    return remote_read_server.load_fixture(str(_FIXTURE_PATH))
+
+
+@pytest.fixture
+def start_remote_read_server(fixture_series):
+    """
+    Start the remote read stand-in server on an ephemeral port, serving the fixture series with at most
+    chunks_per_frame chunks per frame. Returns the base URL of the server.
+    """
+    servers = []
+
+    def start(chunks_per_frame):
+        handler = type(
+            "FixtureRemoteReadHandler",
+            (remote_read_server.RemoteReadHandler,),
+            {"series": fixture_series, "chunks_per_frame": chunks_per_frame},
+        )
+        server = ThreadingHTTPServer(("localhost", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://localhost:{server.server_address[1]}"
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
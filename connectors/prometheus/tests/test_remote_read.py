@@ -0,0 +1,92 @@
+"""Tests for the streamed remote read query engine (fetch_remote_read_window) against the stand-in server."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import connector
+
+# Step between range query evaluation timestamps, which remote read windows extend to
+_STEP = timedelta(seconds=15)
+
+
+def get_time_range(fixture_series):
+    """Whole-second time range covering every sample of the fixture."""
+    first_ms = min(series["samples"][0][0] for series in fixture_series)
+    last_ms = max(series["samples"][-1][0] for series in fixture_series)
+    start_time = datetime.fromtimestamp(first_ms // 1000 - 60, tz=timezone.utc)
+    end_time = datetime.fromtimestamp(last_ms // 1000 + 60, tz=timezone.utc)
+    return start_time, end_time
+
+
+def expected_results(fixture_series, metric_name, start_ms, end_ms):
+    """Fixture samples of a metric within [start_ms, end_ms], in the format of range query results."""
+    return [
+        {
+            "metric": series["labels"],
+            "values": [
+                (timestamp / 1000, value)
+                for timestamp, value in series["samples"]
+                if start_ms <= timestamp <= end_ms
+            ],
+        }
+        for series in fixture_series
+        if series["labels"]["__name__"] == metric_name
+    ]
+
+
+def get_metric_names(fixture_series):
+    return sorted({series["labels"]["__name__"] for series in fixture_series})
+
+
+@pytest.mark.parametrize("chunks_per_frame", [1, 4])
+def test_window_returns_fixture_samples(
+    fixture_series, start_remote_read_server, chunks_per_frame
+):
+    # With one chunk per frame, every series of 240 samples is split across two frames
+    prometheus_url = start_remote_read_server(chunks_per_frame)
+    start_time, end_time = get_time_range(fixture_series)
+
+    for metric_name in get_metric_names(fixture_series):
+        results, series_count = connector.fetch_remote_read_window(
+            prometheus_url, {}, metric_name, start_time, end_time
+        )
+
+        expected = expected_results(
+            fixture_series, metric_name, int(start_time.timestamp() * 1000), float("inf")
+        )
+        assert results == expected
+        assert series_count == len(expected)
+        assert all(len(result["values"]) == 240 for result in results)
+
+
+@pytest.mark.parametrize("chunks_per_frame", [1, 4])
+def test_adjacent_windows_return_each_sample_once(
+    fixture_series, start_remote_read_server, chunks_per_frame
+):
+    prometheus_url = start_remote_read_server(chunks_per_frame)
+    start_time, end_time = get_time_range(fixture_series)
+    # Windows of 37 steps end in the middle of chunks and of the gap in the fixture
+    windows = connector.plan_time_windows(start_time, end_time, 37)
+    assert len(windows) > 5
+
+    for metric_name in get_metric_names(fixture_series):
+        merged = {}
+        for window_start, window_end in windows:
+            results, _ = connector.fetch_remote_read_window(
+                prometheus_url, {}, metric_name, window_start, window_end
+            )
+            for result in results:
+                window_start_ms = int(window_start.timestamp() * 1000)
+                window_next_ms = int((window_end + _STEP).timestamp() * 1000)
+                assert all(
+                    window_start_ms <= round(timestamp * 1000) < window_next_ms
+                    for timestamp, _ in result["values"]
+                )
+                key = tuple(sorted(result["metric"].items()))
+                merged.setdefault(key, []).extend(result["values"])
+
+        expected = expected_results(fixture_series, metric_name, 0, float("inf"))
+        assert merged == {
+            tuple(sorted(series["metric"].items())): series["values"] for series in expected
+        }
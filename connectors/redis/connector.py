@@ -23,13 +23,33 @@ import redis
 from datetime import datetime, timezone
 
 # For type hints
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# For building the JSON value of large collections incrementally
+import io
+
+# For grouping pipelined value commands by data type
+from collections import defaultdict
+
+# For tracking the elements of exploded collections in the state with packed 64-bit digests
+from element_digests import (
+    compute_element_digest,
+    decode_element_digests,
+    encode_element_digests,
+    format_element_id,
+    missing_digests,
+    sort_unique,
+)
 
 # Constants for the connector
 __CHECKPOINT_INTERVAL = 1000  # Checkpoint after processing every 1000 keys
 __BATCH_SIZE = 100  # Batch size for key scanning
 __SCAN_COUNT = 100  # Redis SCAN count parameter for pagination
+__COLLECTION_WINDOW_SIZE = (
+    1000  # Number of collection elements fetched per HSCAN/SSCAN/ZSCAN/LRANGE call
+)
 __TIMESERIES_BATCH_SIZE = 1000  # Number of data points to process per batch for TimeSeries
+__TIMESERIES_TYPES = ("tsdb-type", "timeseries")  # Data types reported by TYPE for TimeSeries keys
 __DEFAULT_REDIS_PORT = 6379  # Default Redis port
 __DEFAULT_REDIS_DB = 0  # Default Redis database number
 __SOCKET_TIMEOUT_SEC = 30  # Socket timeout in seconds
@@ -62,8 +82,9 @@ def schema(configuration: dict):
     """
     # Get table name from configuration or use default
     table_name = configuration.get("table_name", "redis_data")
+    element_table = get_element_table(configuration)
 
-    return [
+    tables = [
         {
             "table": table_name,  # Name of the table in the destination, required.
             "primary_key": ["key"],  # Primary key column(s) for the table, required.
@@ -78,6 +99,40 @@ def schema(configuration: dict):
         },
     ]
 
+    # Large collections are exploded into a child table, one row per element, when enabled
+    if element_table:
+        tables.append(
+            {
+                "table": element_table,
+                "primary_key": ["key", "element_id"],
+                "columns": {
+                    "key": "STRING",  # Redis key the element belongs to
+                    "element_id": "STRING",  # List index, or digest of the hash field or member
+                    "member": "STRING",  # Hash field or set/sorted set member (null for lists)
+                    "value": "STRING",  # Hash field value, list element, or set/sorted set member
+                    "score": "DOUBLE",  # Sorted set score (null for other types)
+                },
+            }
+        )
+
+    return tables
+
+
+def get_element_table(configuration: dict) -> Optional[str]:
+    """
+    Get the name of the child table that large collections are exploded into.
+    Args:
+        configuration: a dictionary that holds the configuration settings for the connector.
+    Returns:
+        The child table name, or None if large collections are stored as JSON in the main table.
+    """
+    explode_config = configuration.get("explode_large_collections", "false")
+    if isinstance(explode_config, str):
+        explode_config = explode_config.lower() == "true"
+    if not explode_config:
+        return None
+    return f"{configuration.get('table_name', 'redis_data')}_elements"
+
 
 def build_connection_params(configuration: dict) -> dict:
     """
@@ -156,22 +211,15 @@ def close_redis_client(redis_client: redis.Redis):
         log.warning(f"Error closing Redis connection: {e}")
 
 
-def is_timeseries_key(redis_client: redis.Redis, key: str) -> bool:
+def is_timeseries_type(key_type: str) -> bool:
     """
-    Check if a Redis key is a TimeSeries key.
+    Check if a data type reported by the TYPE command belongs to a TimeSeries key.
     Args:
-        redis_client: Redis client instance.
-        key: Redis key to check.
+        key_type: Data type returned by TYPE.
     Returns:
-        True if the key is a TimeSeries, False otherwise.
+        True if the type is a TimeSeries type, False otherwise.
     """
-    try:
-        key_type = redis_client.type(key)
-        # TimeSeries keys have type "TSDB-TYPE" or "timeseries"
-        return key_type.lower() in ["tsdb-type", "timeseries"]
-    except Exception as e:
-        log.warning(f"The supplied key is not a timeseries key '{key}': {e}")
-        return False
+    return key_type.lower() in __TIMESERIES_TYPES
 
 
 def get_timeseries_range(
@@ -245,80 +293,413 @@ def sync_timeseries_key(
     return count, max_timestamp
 
 
-def extract_value_by_type(redis_client: redis.Redis, key: str, key_type: str) -> Tuple[str, int]:
+def queue_value_command(pipeline, key: str, key_type: str) -> bool:
     """
-    Extract value and size based on Redis data type.
+    Queue the type-specific command that fetches the whole value of a key on a pipeline.
     Args:
-        redis_client: Redis client instance.
+        pipeline: Redis pipeline the command is queued on.
         key: Redis key.
         key_type: Redis data type (string, hash, list, set, zset).
     Returns:
-        Tuple of (value, size).
+        True if a command was queued, False if the data type is not supported.
     """
     if key_type == "string":
-        value = redis_client.get(key)
-        size = len(value) if value else 0
-        return value, size
-
+        pipeline.get(key)
     elif key_type == "hash":
-        data = redis_client.hgetall(key)
-        return json.dumps(data), len(data)
-
+        pipeline.hgetall(key)
     elif key_type == "list":
-        data = redis_client.lrange(key, 0, -1)
+        pipeline.lrange(key, 0, -1)
+    elif key_type == "set":
+        pipeline.smembers(key)
+    elif key_type == "zset":
+        pipeline.zrange(key, 0, -1, withscores=True)
+    else:
+        return False
+    return True
+
+
+def format_value_by_type(key_type: str, data) -> Tuple[str, int]:
+    """
+    Convert the reply of a value command into the value and size stored in the destination.
+    Args:
+        key_type: Redis data type (string, hash, list, set, zset).
+        data: Reply of the command queued by queue_value_command.
+    Returns:
+        Tuple of (value, size).
+    """
+    if key_type == "string":
+        size = len(data) if data else 0
+        return data, size
+
+    elif key_type in ("hash", "list"):
         return json.dumps(data), len(data)
 
     elif key_type == "set":
-        data = list(redis_client.smembers(key))
-        return json.dumps(data), len(data)
+        return json.dumps(list(data)), len(data)
 
     elif key_type == "zset":
-        zset_data = redis_client.zrange(key, 0, -1, withscores=True)
-        # Convert to list of [member, score] pairs for JSON serialization
-        zset_list = [[member, score] for member, score in zset_data]
-        return json.dumps(zset_list), len(zset_data)
+        zset_list = [[member, score] for member, score in data]
+        return json.dumps(zset_list), len(data)
 
     else:
         return f"Unsupported type: {key_type}", 0
 
 
-def get_redis_value_info(redis_client: redis.Redis, key: str) -> Dict[str, Any]:
+def inspect_keys(redis_client: redis.Redis, keys: List[str]) -> List[tuple]:
     """
-    Get comprehensive information about a Redis key including value, type, TTL, and size.
+    Collect the type and TTL of every key in a SCAN page with a single pipelined round trip.
+    Per-key failures are returned in place of the reply instead of aborting the whole page.
     Args:
-        redis_client: The Redis client instance.
-        key: The Redis key to get information for.
+        redis_client: Redis client instance.
+        keys: Keys returned by one SCAN call.
     Returns:
-        Dictionary containing key information.
+        List of (key, key_type, ttl) tuples in SCAN order, where key_type or ttl may be an exception.
     """
-    try:
-        # Get key type and TTL
-        key_type = redis_client.type(key)
-        ttl = redis_client.ttl(key)  # -1 = no expiry, -2 = expired/doesn't exist
+    pipeline = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.type(key)
+        pipeline.ttl(key)
+    replies = pipeline.execute(raise_on_error=False)
+    return [(key, replies[2 * index], replies[2 * index + 1]) for index, key in enumerate(keys)]
 
-        # Extract value and size based on type
-        value, size = extract_value_by_type(redis_client, key, key_type)
 
-        return {
-            "key": key,
-            "value": value,
-            "data_type": key_type,
-            "ttl": ttl,
-            "last_modified": datetime.now(timezone.utc).isoformat(),
-            "size": size,
-        }
+def fetch_values(redis_client: redis.Redis, key_types: Dict[str, str]) -> Dict[str, object]:
+    """
+    Fetch the values of many keys with a single pipelined round trip.
+    Commands are queued grouped by data type, so that the server runs the same command back to back.
+    Args:
+        redis_client: Redis client instance.
+        key_types: Dictionary mapping keys to their data type.
+    Returns:
+        Dictionary mapping keys to a (value, size) tuple, or to the exception raised for that key.
+    """
+    keys_by_type = defaultdict(list)
+    for key, key_type in key_types.items():
+        keys_by_type[key_type].append(key)
+
+    values = {}
+    queued_keys = []
+    pipeline = redis_client.pipeline(transaction=False)
+    for key_type, typed_keys in keys_by_type.items():
+        for key in typed_keys:
+            if queue_value_command(pipeline, key, key_type):
+                queued_keys.append((key, key_type))
+            else:
+                values[key] = format_value_by_type(key_type, None)
+
+    if queued_keys:
+        replies = pipeline.execute(raise_on_error=False)
+        for (key, key_type), reply in zip(queued_keys, replies):
+            if isinstance(reply, Exception):
+                values[key] = reply
+            else:
+                values[key] = format_value_by_type(key_type, reply)
+
+    return values
+
+
+def queue_length_command(pipeline, key: str, key_type: str) -> bool:
+    """
+    Queue the command that returns the number of elements of a collection key on a pipeline.
+    Args:
+        pipeline: Redis pipeline the command is queued on.
+        key: Redis key.
+        key_type: Redis data type (hash, list, set, zset).
+    Returns:
+        True if a command was queued, False if the data type is not a collection.
+    """
+    if key_type == "hash":
+        pipeline.hlen(key)
+    elif key_type == "list":
+        pipeline.llen(key)
+    elif key_type == "set":
+        pipeline.scard(key)
+    elif key_type == "zset":
+        pipeline.zcard(key)
+    else:
+        return False
+    return True
 
-    except Exception as e:
-        log.warning(f"Failed to get info for key '{key}': {e}")
+
+def fetch_collection_lengths(
+    redis_client: redis.Redis, key_types: Dict[str, str]
+) -> Dict[str, int]:
+    """
+    Fetch the number of elements of every collection key with a single pipelined round trip.
+    Args:
+        redis_client: Redis client instance.
+        key_types: Dictionary mapping keys to their data type.
+    Returns:
+        Dictionary mapping collection keys to their number of elements. Keys whose length could not be read are omitted.
+    """
+    queued_keys = []
+    pipeline = redis_client.pipeline(transaction=False)
+    for key, key_type in key_types.items():
+        if queue_length_command(pipeline, key, key_type):
+            queued_keys.append(key)
+
+    if not queued_keys:
+        return {}
+
+    replies = pipeline.execute(raise_on_error=False)
+    return {
+        key: reply for key, reply in zip(queued_keys, replies) if not isinstance(reply, Exception)
+    }
+
+
+def iterate_collection(
+    redis_client: redis.Redis, key: str, key_type: str, window_size: int
+) -> Iterator:
+    """
+    Iterate over the elements of a collection key, fetching at most window_size elements per command.
+    Hashes, sets and sorted sets are read with HSCAN, SSCAN and ZSCAN, lists with consecutive LRANGE windows.
+    Args:
+        redis_client: Redis client instance.
+        key: Redis key.
+        key_type: Redis data type (hash, list, set, zset).
+        window_size: Maximum number of elements fetched per command.
+    Yields:
+        (field, value) tuples for hashes, elements for lists and sets, and (member, score) tuples for sorted sets.
+    """
+    if key_type == "hash":
+        yield from redis_client.hscan_iter(key, count=window_size)
+    elif key_type == "set":
+        yield from redis_client.sscan_iter(key, count=window_size)
+    elif key_type == "zset":
+        yield from redis_client.zscan_iter(key, count=window_size)
+    elif key_type == "list":
+        start = 0
+        while True:
+            window = redis_client.lrange(key, start, start + window_size - 1)
+            yield from window
+            if len(window) < window_size:
+                break
+            start += window_size
+
+
+def encode_element_json(key_type: str, element) -> str:
+    """
+    Encode one collection element the way json.dumps encodes it inside the whole collection.
+    Args:
+        key_type: Redis data type (hash, list, set, zset).
+        element: Element yielded by iterate_collection.
+    Returns:
+        JSON fragment for the element.
+    """
+    if key_type == "hash":
+        field, value = element
+        return f"{json.dumps(field)}: {json.dumps(value)}"
+    if key_type == "zset":
+        member, score = element
+        return json.dumps([member, score])
+    return json.dumps(element)
+
+
+def stream_collection_json(
+    redis_client: redis.Redis, key: str, key_type: str, window_size: int
+) -> Tuple[str, int]:
+    """
+    Build the JSON value of a large collection incrementally, one window of elements at a time.
+    The result is identical to json.dumps of the whole collection, without holding the Redis replies for the whole
+    collection at once. The JSON value itself still grows with the collection, and so does the set of fields and
+    members already seen, as HSCAN, SSCAN and ZSCAN may return an element more than once and repeated ones are skipped.
+    Memory is only bounded by the element window when large collections are exploded into the child table.
+    Args:
+        redis_client: Redis client instance.
+        key: Redis key.
+        key_type: Redis data type (hash, list, set, zset).
+        window_size: Maximum number of elements fetched per command.
+    Returns:
+        Tuple of (value, size).
+    """
+    buffer = io.StringIO()
+    buffer.write("{" if key_type == "hash" else "[")
+    seen_elements = None if key_type == "list" else set()
+    size = 0
+
+    for element in iterate_collection(redis_client, key, key_type, window_size):
+        if seen_elements is not None:
+            identity = element[0] if isinstance(element, tuple) else element
+            if identity in seen_elements:
+                continue
+            seen_elements.add(identity)
+
+        if size:
+            buffer.write(", ")
+        buffer.write(encode_element_json(key_type, element))
+        size += 1
+
+    buffer.write("}" if key_type == "hash" else "]")
+    return buffer.getvalue(), size
+
+
+def build_element_record(key: str, key_type: str, index: int, element) -> dict:
+    """
+    Build the child table record for one collection element.
+    List elements are identified by their index. Hash fields and set or sorted set members are identified by
+    their digest, so that the records of removed elements can be deleted from the digests kept in state.
+    Args:
+        key: Redis key the element belongs to.
+        key_type: Redis data type (hash, list, set, zset).
+        index: Position of the element in the iteration, used as the element ID of list elements.
+        element: Element yielded by iterate_collection.
+    Returns:
+        Dictionary containing the element.
+    """
+    if key_type == "list":
         return {
             "key": key,
-            "value": f"Error: {str(e)}",
-            "data_type": "error",
-            "ttl": -2,
-            "last_modified": datetime.now(timezone.utc).isoformat(),
-            "size": 0,
+            "element_id": str(index),
+            "member": None,
+            "value": element,
+            "score": None,
         }
 
+    if key_type == "hash":
+        member, value = element
+        score = None
+    elif key_type == "zset":
+        member, score = element
+        value = member
+    else:
+        member, value, score = element, element, None
+
+    return {
+        "key": key,
+        "element_id": format_element_id(compute_element_digest(member)),
+        "member": member,
+        "value": value,
+        "score": score,
+    }
+
+
+def upsert_collection_elements(
+    redis_client: redis.Redis, key: str, key_type: str, window_size: int, element_table: str
+) -> dict:
+    """
+    Upsert the elements of a large collection to the child table, one row per element.
+    Only one window of elements is held in memory at a time, along with the 64-bit digest of every hash field
+    or set/sorted set member upserted so far.
+    Args:
+        redis_client: Redis client instance.
+        key: Redis key.
+        key_type: Redis data type (hash, list, set, zset).
+        window_size: Maximum number of elements fetched per command.
+        element_table: Destination child table name.
+    Returns:
+        The exploded collection entry to keep in state: the data type, the number of element records,
+        and for hashes, sets and sorted sets the sorted element digests.
+    """
+    count = 0
+    digests = []
+    for index, element in enumerate(iterate_collection(redis_client, key, key_type, window_size)):
+        record = build_element_record(key, key_type, index, element)
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The op.upsert method is called with two arguments:
+        # - The first argument is the name of the table to upsert the data into.
+        # - The second argument is a dictionary containing the data to be upserted,
+        op.upsert(table=element_table, data=record)
+        count += 1
+        if key_type != "list":
+            digests.append(int(record["element_id"], 16))
+
+    if key_type == "list":
+        return {"data_type": key_type, "count": count}
+    digests = sort_unique(digests)
+    return {"data_type": key_type, "count": len(digests), "digests": digests}
+
+
+def delete_element_record(element_table: str, key: str, element_id: str):
+    """
+    Delete the child table record of one collection element.
+    Args:
+        element_table: Destination child table name.
+        key: Redis key the element belongs to.
+        element_id: Element ID of the record.
+    """
+    # The 'delete' operation removes a record from the destination table.
+    # It uses the primary key value to identify which record to delete.
+    op.delete(table=element_table, keys={"key": key, "element_id": element_id})
+
+
+def delete_stale_elements(
+    key: str, previous: dict, current: Optional[dict], element_table: str
+) -> int:
+    """
+    Delete the child table records of the elements a key held when it was last exploded but no longer holds.
+    List records past the current end of the list are deleted by index. The records of removed hash fields and
+    set or sorted set members are found by merging the digests of the previous sync with the current ones.
+    Args:
+        key: Redis key.
+        previous: Exploded collection entry of the previous sync, with its digests encoded.
+        current: Exploded collection entry built by upsert_collection_elements, or None if the key is no longer
+            exploded, in which case all its records are deleted.
+        element_table: Destination child table name.
+    Returns:
+        Number of element records deleted.
+    """
+    is_same_type = current is not None and current["data_type"] == previous["data_type"]
+    if previous["data_type"] == "list":
+        start_index = current["count"] if is_same_type else 0
+        for index in range(start_index, previous["count"]):
+            delete_element_record(element_table, key, str(index))
+        return max(0, previous["count"] - start_index)
+
+    current_digests = current["digests"] if is_same_type else []
+    deleted_count = 0
+    for digest in missing_digests(decode_element_digests(previous["digests"]), current_digests):
+        delete_element_record(element_table, key, format_element_id(digest))
+        deleted_count += 1
+    return deleted_count
+
+
+def encode_exploded_entry(entry: dict) -> dict:
+    """
+    Encode an exploded collection entry for the connector state.
+    Args:
+        entry: Exploded collection entry built by upsert_collection_elements.
+    Returns:
+        The entry with its digests, if any, packed as a base64 string.
+    """
+    if "digests" not in entry:
+        return entry
+    return {**entry, "digests": encode_element_digests(entry["digests"])}
+
+
+def build_key_record(key: str, key_type: str, ttl: int, value: str, size: int) -> dict:
+    """
+    Build the destination record for a key.
+    Args:
+        key: Redis key.
+        key_type: Data type of the key.
+        ttl: Time to live in seconds.
+        value: Value of the key as stored in the destination.
+        size: Size metric of the value.
+    Returns:
+        Dictionary containing key information.
+    """
+    return {
+        "key": key,
+        "value": value,
+        "data_type": key_type,
+        "ttl": ttl,
+        "last_modified": datetime.now(timezone.utc).isoformat(),
+        "size": size,
+    }
+
+
+def build_error_record(key: str, error: Exception) -> dict:
+    """
+    Build the destination record for a key that could not be read.
+    Args:
+        key: Redis key.
+        error: Error raised while reading the key.
+    Returns:
+        Dictionary containing the error in place of the key information.
+    """
+    log.warning(f"Failed to get info for key '{key}': {error}")
+    return build_key_record(key, "error", -2, f"Error: {str(error)}", 0)
+
 
 def scan_redis_keys(
     redis_client: redis.Redis,
@@ -350,23 +731,47 @@ def process_batch(
     keys: List[str],
     table_name: str,
     timeseries_state: Dict[str, int],
+    window_size: int,
+    element_table: Optional[str],
+    exploded_collections: Dict[str, dict],
 ) -> Tuple[int, Dict[str, int]]:
     """
     Process a batch of Redis keys and upsert them to the destination.
+    The batch is inspected with pipelined round trips instead of several commands per key:
+    one collecting the type and TTL of every key, one collecting the length of the collections,
+    and one fetching the values of the regular keys that fit in a single element window.
+    Collections larger than the window are read incrementally, one window at a time.
     Detects TimeSeries keys and syncs them incrementally.
+    Child table records of the elements removed from an exploded collection since the last sync are deleted,
+    as are all its records once it shrinks back to a JSON value.
     Args:
         redis_client: Redis client instance.
         keys: List of keys to process.
         table_name: Destination table name.
         timeseries_state: Dictionary mapping TimeSeries keys to their last synced timestamp.
+        window_size: Maximum number of collection elements fetched per command.
+        element_table: Child table that large collections are exploded into, or None to store them as JSON.
+        exploded_collections: Dictionary mapping exploded keys to their data type, number of child table
+            records and packed element digests, updated in place.
     Returns:
-        Tuple of (number of records processed, updated timeseries_state).
+        Tuple of (number of records processed in the main table, updated timeseries_state).
     """
     batch_row_count = 0
+    key_types = {}
+    key_ttls = {}
 
-    for key in keys:
-        # Check if this is a TimeSeries key
-        if is_timeseries_key(redis_client, key):
+    # Collect the type and TTL of every key in the batch with one pipelined round trip
+    for key, key_type, ttl in inspect_keys(redis_client, keys):
+        if isinstance(key_type, Exception) or isinstance(ttl, Exception):
+            error = key_type if isinstance(key_type, Exception) else ttl
+
+            # The 'upsert' operation is used to insert or update data in the destination table.
+            # The op.upsert method is called with two arguments:
+            # - The first argument is the name of the table to upsert the data into.
+            # - The second argument is a dictionary containing the data to be upserted,
+            op.upsert(table=table_name, data=build_error_record(key, error))
+            batch_row_count += 1
+        elif is_timeseries_type(key_type):
             # Sync incrementally from last known timestamp
             last_ts = timeseries_state.get(key, 0)
             count, max_ts = sync_timeseries_key(redis_client, key, table_name, last_ts)
@@ -380,15 +785,62 @@ def process_batch(
                 f"Synced {count} data points from TimeSeries key '{key}' (timestamp: {max_ts})"
             )
         else:
-            # Handle regular Redis key-value data
-            key_info = get_redis_value_info(redis_client, key)
+            # Regular Redis key-value data is fetched for the whole batch below
+            key_types[key] = key_type
+            key_ttls[key] = ttl
+
+    # Collections larger than one element window are read incrementally instead of with a single command
+    lengths = fetch_collection_lengths(redis_client, key_types) if key_types else {}
+    large_collections = {key for key, length in lengths.items() if length > window_size}
+    small_key_types = {
+        key: key_type for key, key_type in key_types.items() if key not in large_collections
+    }
 
-            # The 'upsert' operation is used to insert or update data in the destination table.
-            # The op.upsert method is called with two arguments:
-            # - The first argument is the name of the table to upsert the data into.
-            # - The second argument is a dictionary containing the data to be upserted,
-            op.upsert(table=table_name, data=key_info)
-            batch_row_count += 1
+    # Fetch the values of all other regular keys with one more pipelined round trip
+    values = fetch_values(redis_client, small_key_types) if small_key_types else {}
+
+    for key, key_type in key_types.items():
+        if key in large_collections:
+            try:
+                if element_table:
+                    exploded = upsert_collection_elements(
+                        redis_client, key, key_type, window_size, element_table
+                    )
+                    deleted_count = 0
+                    if key in exploded_collections:
+                        # Delete the records of the elements removed since the last sync
+                        deleted_count = delete_stale_elements(
+                            key, exploded_collections[key], exploded, element_table
+                        )
+                    exploded_collections[key] = encode_exploded_entry(exploded)
+                    log.info(
+                        f"Upserted {exploded['count']} and deleted {deleted_count} elements "
+                        f"of key '{key}' in {element_table}"
+                    )
+                    value, size = None, lengths[key]
+                else:
+                    value, size = stream_collection_json(redis_client, key, key_type, window_size)
+            except redis.ResponseError as e:
+                value = e
+        else:
+            value = values[key]
+            if element_table and key in exploded_collections:
+                # The collection shrank to a JSON value, so its child table records are stale
+                delete_stale_elements(key, exploded_collections.pop(key), None, element_table)
+
+        if isinstance(value, Exception):
+            record = build_error_record(key, value)
+        else:
+            if key not in large_collections:
+                value, size = value
+            record = build_key_record(key, key_type, key_ttls[key], value, size)
+
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The op.upsert method is called with two arguments:
+        # - The first argument is the name of the table to upsert the data into.
+        # - The second argument is a dictionary containing the data to be upserted,
+        op.upsert(table=table_name, data=record)
+        batch_row_count += 1
 
     return batch_row_count, timeseries_state
 
@@ -401,6 +853,9 @@ def sync_redis_data(
     cursor: int,
     current_sync_time: str,
     timeseries_state: Dict[str, int],
+    window_size: int,
+    element_table: Optional[str],
+    exploded_collections: Dict[str, dict],
 ) -> Tuple[int, Dict[str, int]]:
     """
     Sync Redis data by scanning and processing keys in batches.
@@ -413,6 +868,10 @@ def sync_redis_data(
         cursor: Starting cursor position.
         current_sync_time: Current sync timestamp.
         timeseries_state: Dictionary mapping TimeSeries keys to their last synced timestamp.
+        window_size: Maximum number of collection elements fetched per command.
+        element_table: Child table that large collections are exploded into, or None to store them as JSON.
+        exploded_collections: Dictionary mapping exploded keys to their data type, number of child table
+            records and packed element digests, updated in place.
     Returns:
         Tuple of (total records processed, updated timeseries_state).
     """
@@ -438,14 +897,20 @@ def sync_redis_data(
 
         # Process each key in the current batch
         batch_row_count, timeseries_state = process_batch(
-            redis_client, keys, table_name, timeseries_state
+            redis_client,
+            keys,
+            table_name,
+            timeseries_state,
+            window_size,
+            element_table,
+            exploded_collections,
         )
         row_count += batch_row_count
         total_keys_processed += batch_row_count
 
         # Checkpoint periodically and at cursor reset
         if row_count % __CHECKPOINT_INTERVAL == 0 or cursor == 0:
-            save_state(cursor, current_sync_time, timeseries_state)
+            save_state(cursor, current_sync_time, timeseries_state, exploded_collections)
 
         log.info(
             f"Completed batch {batch_count}: processed {batch_row_count} records, "
@@ -481,12 +946,16 @@ def update(configuration: dict, state: dict):
     table_name = configuration.get("table_name", "redis_data")
     key_pattern = configuration.get("key_pattern", "*")
     batch_size = int(configuration.get("batch_size", __BATCH_SIZE))
+    window_size = int(configuration.get("collection_window_size", __COLLECTION_WINDOW_SIZE))
+    element_table = get_element_table(configuration)
 
     # Get the state variables for the sync
     # For regular Redis keys: track cursor for resumption using SCAN
     # For TimeSeries keys: track last synced timestamp for incremental sync
     cursor = state.get("cursor", 0)
     timeseries_state = state.get("timeseries_state", {})
+    # For exploded collections: track the child table records to delete the ones of removed elements
+    exploded_collections = state.get("exploded_collections", {})
     current_sync_time = datetime.now(timezone.utc).isoformat()
 
     try:
@@ -499,10 +968,13 @@ def update(configuration: dict, state: dict):
             cursor,
             current_sync_time,
             timeseries_state,
+            window_size,
+            element_table,
+            exploded_collections,
         )
 
         # Final checkpoint - reset cursor to 0 for next scan, but preserve TimeSeries timestamps
-        save_state(0, current_sync_time, timeseries_state)
+        save_state(0, current_sync_time, timeseries_state, exploded_collections)
 
         log.info(f"Successfully synced {total_records_processed} records from Redis")
 
@@ -514,18 +986,26 @@ def update(configuration: dict, state: dict):
         close_redis_client(redis_client)
 
 
-def save_state(cursor: int, sync_time: str, timeseries_state: Dict[str, int]):
+def save_state(
+    cursor: int,
+    sync_time: str,
+    timeseries_state: Dict[str, int],
+    exploded_collections: Dict[str, dict],
+):
     """
-    Save the current state including cursor position, sync time, and TimeSeries timestamps.
+    Save the current state including cursor position, sync time, TimeSeries timestamps and exploded collections.
     Args:
         cursor: Current cursor position for Redis SCAN.
         sync_time: Current sync timestamp.
         timeseries_state: Dictionary mapping TimeSeries keys to their last synced timestamp.
+        exploded_collections: Dictionary mapping exploded keys to their data type, number of child table
+            records and packed element digests.
     """
     new_state = {
         "cursor": cursor,
         "last_sync_time": sync_time,
         "timeseries_state": timeseries_state,
+        "exploded_collections": exploded_collections,
     }
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
     # from the correct position in case of next sync or interruptions.
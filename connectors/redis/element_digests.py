@@ -0,0 +1,104 @@
+"""Packed element digests for the exploded collections of the Redis connector.
+Keeps one 64-bit digest per hash field or set/sorted set member of an exploded key in the connector state,
+so that the child table records of the elements removed from a key can be found and deleted on the next sync.
+The digest is also the element ID of these records, which is what makes a deletion possible from the digest alone.
+"""
+
+# For packing the digests into a fixed-width array of unsigned 64-bit integers
+import array
+
+# For encoding the packed digests as JSON-compatible strings
+import base64
+
+# For deterministic hashing
+import hashlib
+
+# For detecting the byte order of the platform
+import sys
+
+# For type hints
+from typing import Iterable, Iterator
+
+
+def compute_element_digest(member: str) -> int:
+    """
+    Compute a deterministic 64-bit digest of a hash field or set/sorted set member.
+    Args:
+        member: Hash field or set/sorted set member.
+    Returns:
+        The first 8 bytes of the MD5 hash of the member as an unsigned 64-bit integer.
+    """
+    return int.from_bytes(hashlib.md5(member.encode("utf-8")).digest()[:8], "big")
+
+
+def format_element_id(digest: int) -> str:
+    """
+    Format a digest as the element ID of its child table record.
+    Args:
+        digest: Element digest.
+    Returns:
+        The digest as 16 hexadecimal digits.
+    """
+    return f"{digest:016x}"
+
+
+def sort_unique(digests: Iterable[int]) -> array.array:
+    """
+    Sort digests and drop repeated ones, as HSCAN, SSCAN and ZSCAN may return an element more than once.
+    Args:
+        digests: Element digests in scan order.
+    Returns:
+        The sorted digests without duplicates.
+    """
+    unique = array.array("Q")
+    for digest in sorted(digests):
+        if not unique or unique[-1] != digest:
+            unique.append(digest)
+    return unique
+
+
+def encode_element_digests(digests: array.array) -> str:
+    """
+    Encode sorted digests for the connector state.
+    Args:
+        digests: Sorted digests without duplicates.
+    Returns:
+        The little-endian packed digests encoded as base64.
+    """
+    packed = array.array("Q", digests)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def decode_element_digests(encoded: str) -> array.array:
+    """
+    Decode the digests stored in the connector state.
+    Args:
+        encoded: Digests encoded by encode_element_digests.
+    Returns:
+        The sorted digests.
+    """
+    digests = array.array("Q")
+    digests.frombytes(base64.b64decode(encoded))
+    if sys.byteorder != "little":
+        digests.byteswap()
+    return digests
+
+
+def missing_digests(previous: array.array, current: array.array) -> Iterator[int]:
+    """
+    Find the digests of a previous sync that are missing from the current one by merging the two sorted runs.
+    Args:
+        previous: Sorted digests of the previous sync.
+        current: Sorted digests of the current sync.
+    Yields:
+        Digests present in previous only, in sorted order.
+    """
+    current_index = 0
+    current_count = len(current)
+    for digest in previous:
+        while current_index < current_count and current[current_index] < digest:
+            current_index += 1
+        if current_index == current_count or current[current_index] != digest:
+            yield digest
@@ -91,10 +91,16 @@ def update(configuration: dict, state: dict):
     plans = get_table_plans(configuration=configuration)
 
     # Get max parallel workers from configuration
-    # If the value is greater than the number of tables to sync, it will be capped at the number of tables to sync
+    # If the value is greater than the number of tables to sync, the table workers are capped at the number of tables to sync
     # Ensure that you do not set this to a high value. Recommended value is between 2 and 4.
     # Setting a high value may degrade the performance instead of improving it
-    max_parallel_workers = min(int(configuration.get("max_parallel_workers")), len(plans))
+    max_parallel_workers = int(configuration.get("max_parallel_workers"))
+    table_workers = min(max_parallel_workers, len(plans))
+
+    # When chunks of a single table can be synced in parallel, the pool keeps max_parallel_workers connections
+    # so that the chunk workers of a large table can use the connections which are not used by the table workers
+    parallel_chunk_workers = int(configuration.get("parallel_chunk_workers", "1"))
+    pool_size = max_parallel_workers if parallel_chunk_workers > 1 else table_workers
 
     if not plans:
         log.warning(
@@ -102,14 +108,14 @@ def update(configuration: dict, state: dict):
         )
         return
 
-    if max_parallel_workers <= 1:
+    if pool_size <= 1:
         # Run sync sequentially using a single connection
         run_single_worker_sync(plans=plans, configuration=configuration, state=state)
     else:
         # Run sync in parallel using a connection pool
-        pool = _ConnectionPool(configuration=configuration, size=max_parallel_workers)
+        pool = _ConnectionPool(configuration=configuration, size=pool_size)
         try:
-            with ThreadPoolExecutor(max_workers=max_parallel_workers) as executor:
+            with ThreadPoolExecutor(max_workers=table_workers) as executor:
                 # Submit tasks to the executor for each table plan
                 futures = [
                     executor.submit(_run_plan_with_pool, plan, pool, configuration, state)
@@ -15,7 +15,9 @@ from dataclasses import dataclass  # For defining data classes
 from typing import List, Dict, Optional  # For type hinting
 from datetime import date, datetime  # For handling date and time
 import redshift_connector  # Redshift database connector
-from queue import Queue  # For connection pooling
+from queue import Queue, Empty, Full  # For connection pooling and bounded prefetch buffers
+import threading  # For prefetching batches in the background
+from concurrent.futures import ThreadPoolExecutor, as_completed  # For parallel chunk execution
 from table_specs import (
     TABLE_SPECS,
     PREFERRED_TS_COLUMN_NAMES,
@@ -104,6 +106,17 @@ class _ConnectionPool:
         """
         return self._queue.get(timeout=timeout)
 
+    def try_acquire(self):
+        """
+        Acquire a connection from the pool only if one is idle, without waiting.
+        Returns:
+            A Redshift connection object, or None if all connections are in use.
+        """
+        try:
+            return self._queue.get_nowait()
+        except Empty:
+            return None
+
     def release(self, conn):
         """
         Release a connection back to the pool.
@@ -123,6 +136,213 @@ class _ConnectionPool:
                 log.error("Error closing connection", e)
 
 
+class _ChunkConnections:
+    """
+    Connections used by the chunk workers of a single table.
+    The connection held by the table worker is always available to its chunk workers.
+    When a chunk worker starts and that connection is busy, an idle connection is borrowed from the shared pool
+    for the duration of that chunk and returned to the pool right after, so other tables are never starved.
+    If neither is available, the chunk worker waits for the table's own connection.
+    Attributes:
+        connection: Redshift connection held by the table worker
+        pool: _ConnectionPool instance to borrow idle connections from, or None
+    """
+
+    def __init__(self, connection, pool):
+        self._own_connection = Queue(maxsize=1)
+        self._own_connection.put(connection)
+        self._pool = pool
+
+    def acquire(self):
+        """
+        Acquire a connection for a chunk worker.
+        Returns:
+            A tuple of (connection, borrowed) where borrowed is True if the connection belongs to the shared pool.
+        """
+        try:
+            return self._own_connection.get_nowait(), False
+        except Empty:
+            pass
+
+        if self._pool is not None:
+            connection = self._pool.try_acquire()
+            if connection is not None:
+                return connection, True
+
+        return self._own_connection.get(), False
+
+    def release(self, connection, borrowed):
+        """
+        Release a connection acquired by a chunk worker.
+        Args:
+            connection: Redshift connection object
+            borrowed: True if the connection was borrowed from the shared pool
+        """
+        if borrowed:
+            self._pool.release(connection)
+        else:
+            self._own_connection.put(connection)
+
+
+class _ChunkWatermark:
+    """
+    Tracks the bookmark of a table whose chunks complete out of order.
+    The bookmark only advances past a chunk once that chunk and every chunk before it are complete,
+    so a resumed sync never skips rows of a chunk that was still in flight.
+    The chunk plan is kept in state until the last chunk is complete, trimmed to the upper bounds
+    of the chunks that are not complete yet, so the state shrinks as the bookmark advances.
+    Attributes:
+        state: current state dictionary
+        stream: name of the stream (table) being synced
+        replication_key: name of the replication key column
+        bookmark: bookmark value before the first chunk
+        chunk_count: total number of chunks
+        chunk_plan: JSON serializable chunk plan with the upper bounds of all chunks
+    """
+
+    def __init__(self, state, stream, replication_key, bookmark, chunk_count, chunk_plan):
+        self._state = state
+        self._stream = stream
+        self._replication_key = replication_key
+        self._chunk_plan = chunk_plan
+        self._chunk_count = chunk_count
+        self._bookmark = bookmark
+        self._end_bookmarks = [None] * chunk_count
+        self._completed = [False] * chunk_count
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    def remaining_plan(self, chunk_index):
+        """
+        Get the chunk plan to checkpoint while the chunk at chunk_index is the first incomplete chunk.
+        Args:
+            chunk_index: zero-based position of the first incomplete chunk
+        Returns:
+            The chunk plan with the upper bounds from that chunk on, or None if all chunks are complete.
+        """
+        if chunk_index >= self._chunk_count:
+            return None
+        return {**self._chunk_plan, "upper_bounds": self._chunk_plan["upper_bounds"][chunk_index:]}
+
+    def complete(self, chunk_index, end_bookmark):
+        """
+        Mark a chunk as complete and checkpoint if the bookmark advanced.
+        Args:
+            chunk_index: zero-based position of the chunk in replication_key order
+            end_bookmark: bookmark value once the chunk is complete, or None to keep the previous one
+        """
+        with self._lock:
+            self._end_bookmarks[chunk_index] = end_bookmark
+            self._completed[chunk_index] = True
+
+            advanced = False
+            while self._next_index < len(self._completed) and self._completed[self._next_index]:
+                if self._end_bookmarks[self._next_index] is not None:
+                    self._bookmark = self._end_bookmarks[self._next_index]
+                self._next_index += 1
+                advanced = True
+
+            if advanced:
+                _checkpoint(
+                    self._state,
+                    self._stream,
+                    self._replication_key,
+                    self._bookmark,
+                    chunk_plan=self.remaining_plan(self._next_index),
+                )
+
+
+class _BatchPrefetcher:
+    """
+    A background fetcher for a declared server-side cursor.
+    A dedicated thread keeps issuing FETCH statements while the caller is upserting the previous batch,
+    so the network round trip and the Redshift leader node work overlap with local processing.
+    The fetched batches are handed over through a bounded queue, which caps the number of batches held in memory
+    at prefetch_depth + 2: the queued batches, the batch being upserted and the batch fetched but not yet queued.
+    The cursor is only used by the fetcher thread while iteration is in progress.
+    Attributes:
+        cursor: database cursor with the declared server-side cursor
+        table_cursor: name of the declared cursor in the database
+        batch_size: number of rows to fetch per batch
+        prefetch_depth: maximum number of fetched batches waiting to be upserted
+    """
+
+    # Sentinel placed on the queue once the cursor is exhausted
+    _END_OF_CURSOR = object()
+    # Interval in seconds at which a blocked fetcher checks whether the consumer has stopped
+    _POLL_INTERVAL_SECONDS = 1
+
+    def __init__(self, cursor, table_cursor, batch_size, prefetch_depth):
+        self._cursor = cursor
+        self._table_cursor = table_cursor
+        self._batch_size = batch_size
+        self._queue = Queue(maxsize=prefetch_depth)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._fetch_all, name=f"{table_cursor}_prefetcher", daemon=True
+        )
+
+    def _put(self, item):
+        """
+        Put an item on the queue, waiting while the queue is full unless the consumer has stopped.
+        Args:
+            item: batch, exception or end of cursor sentinel to hand over to the consumer
+        Returns:
+            True if the item was queued, False if the consumer stopped before it could be queued.
+        """
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=self._POLL_INTERVAL_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _fetch_all(self):
+        """
+        Fetch batches from the server-side cursor until it is exhausted or the consumer stops.
+        Any exception raised while fetching is handed over to the consumer and re-raised there.
+        """
+        try:
+            column_names = None
+            while not self._stop_event.is_set():
+                self._cursor.execute(f"FETCH {self._batch_size} FROM {self._table_cursor}")
+                rows = self._cursor.fetchall()
+                if not rows:
+                    break
+
+                # Extract column names from cursor.description after first FETCH
+                if column_names is None:
+                    column_names = [desc[0] for desc in self._cursor.description]
+
+                if not self._put((column_names, rows)):
+                    return
+            self._put(self._END_OF_CURSOR)
+        except Exception as e:
+            self._put(e)
+
+    def __iter__(self):
+        """
+        Start the fetcher thread and yield batches in the order they were fetched.
+        The fetcher thread is always stopped and joined before the iteration ends,
+        so the caller can safely use the cursor again afterwards.
+        Yields:
+            A tuple of (column_names, rows) for each fetched batch.
+        """
+        self._thread.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._END_OF_CURSOR:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self._stop_event.set()
+            self._thread.join()
+
+
 def get_table_plans(configuration):
     """
     Get or build the list of table plans for the sync.
@@ -340,37 +560,112 @@ def _declare_cursor(cursor, table_cursor, sql_query, params):
     log.info(f"Successfully declared cursor {table_cursor}")
 
 
-def _find_chunk_upper_bound(connection, plan, replication_key, bookmark, chunk_size):
+def _plan_chunk_bounds(connection, plan, replication_key, bookmark, chunk_size):
     """
-    Find the replication_key value at approximately row chunk_size from the current bookmark.
-    This provides a safe boundary to end the chunk, ensuring all rows with the boundary
-    value are included in the same chunk (no data loss at boundaries).
-
+    Compute the upper bounds of all chunks of a table after the current bookmark in a single query.
+    Rows after the bookmark are numbered in replication_key order, and the replication_key value of every
+    chunk_size-th row becomes a chunk boundary. Each chunk is bounded inclusively by its upper bound,
+    so all rows with the boundary value are included in the same chunk (no data loss at boundaries).
+    Boundaries that repeat because of duplicate replication_key values are returned only once.
     Args:
         connection: Redshift connection object
         plan: TablePlan dataclass instance with sync details
         replication_key: name of the replication key column
         bookmark: current bookmark value (last synced replication_key value)
         chunk_size: target number of rows per chunk
-
     Returns:
-        The replication_key value at the chunk boundary, or None if no more rows exist.
+        List of replication_key values at the chunk boundaries, in ascending order.
     """
     # Build WHERE clause conditionally based on bookmark presence
-    where_clause = f'WHERE "{replication_key}" > %s' if bookmark is not None else ""
+    if bookmark is not None:
+        where_clause = f'WHERE "{replication_key}" > %s'
+        params = [bookmark, chunk_size]
+    else:
+        where_clause = f'WHERE "{replication_key}" IS NOT NULL'
+        params = [chunk_size]
+
     sql = f"""
-        SELECT "{replication_key}"
-        FROM "{plan.schema}"."{plan.table}"
-        {where_clause}
+        SELECT DISTINCT "{replication_key}"
+        FROM (
+            SELECT "{replication_key}", ROW_NUMBER() OVER (ORDER BY "{replication_key}") AS row_number
+            FROM "{plan.schema}"."{plan.table}"
+            {where_clause}
+        ) AS numbered_rows
+        WHERE MOD(row_number, %s) = 0
         ORDER BY "{replication_key}"
-        OFFSET %s LIMIT 1
     """
-    params = [bookmark, chunk_size - 1] if bookmark is not None else [chunk_size - 1]
 
     with connection.cursor() as cursor:
         cursor.execute(sql, params)
-        row = cursor.fetchone()
-        return row[0] if row else None
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _get_chunk_upper_bounds(connection, plan, state, bookmark):
+    """
+    Get the upper bounds of the chunks that remain to be synced for a table.
+    The chunk plan is cached in the state of the table while the table is being synced, so a sync that resumes
+    after an interruption reuses it instead of computing the boundaries again.
+    The cached plan only holds the boundaries after the checkpointed bookmark, and is only reused
+    if it was built for the same replication key and chunk size and checkpointed with the same bookmark.
+    Args:
+        connection: Redshift connection object
+        plan: TablePlan dataclass instance with sync details
+        state: current state dictionary
+        bookmark: current bookmark value (last synced replication_key value)
+    Returns:
+        A tuple of (chunk_plan, upper_bounds) where chunk_plan is the JSON serializable plan to keep in state
+        and upper_bounds is the list of chunk boundaries after the bookmark.
+    """
+    cached_plan = (state.get(plan.stream) or {}).get("chunk_plan")
+    serialized_bookmark = _serialize_bookmark(bookmark)
+
+    is_same_key = cached_plan and cached_plan.get("replication_key") == plan.replication_key
+    is_same_size = is_same_key and cached_plan.get("chunk_size") == CHUNK_SIZE
+    if is_same_size and serialized_bookmark == cached_plan["start_bookmark"]:
+        log.info(f"{plan.stream}: Resuming cached chunk plan from bookmark {bookmark}")
+        return cached_plan, cached_plan["upper_bounds"]
+
+    upper_bounds = _plan_chunk_bounds(
+        connection=connection,
+        plan=plan,
+        replication_key=plan.replication_key,
+        bookmark=bookmark,
+        chunk_size=CHUNK_SIZE,
+    )
+    chunk_plan = {
+        "replication_key": plan.replication_key,
+        "chunk_size": CHUNK_SIZE,
+        "start_bookmark": serialized_bookmark,
+        "upper_bounds": [_serialize_bookmark(upper_bound) for upper_bound in upper_bounds],
+    }
+    return chunk_plan, upper_bounds
+
+
+def _fetch_batches(cursor, table_cursor, batch_size):
+    """
+    Fetch batches from a declared server-side cursor one after another on the calling thread.
+    Args:
+        cursor: database cursor with the declared server-side cursor
+        table_cursor: name of the declared cursor in the database
+        batch_size: number of rows to fetch per batch
+    Yields:
+        A tuple of (column_names, rows) for each fetched batch.
+    """
+    column_names = None
+    while True:
+        # Fetch rows in batches to handle large datasets efficiently
+        cursor.execute(f"FETCH {batch_size} FROM {table_cursor}")
+        rows = cursor.fetchall()
+
+        if not rows:
+            # No more rows to fetch; exit the loop
+            return
+
+        # Extract column names from cursor.description after first FETCH
+        if column_names is None:
+            column_names = [desc[0] for desc in cursor.description]
+
+        yield column_names, rows
 
 
 def fetch_metadata(connection, table_tuples):
@@ -690,7 +985,20 @@ def build_table_plans(connection, configuration):
     return plans
 
 
-def _checkpoint(state, stream, replication_key, bookmark):
+def _serialize_bookmark(bookmark):
+    """
+    Format a replication_key value appropriately for JSON serialization.
+    Args:
+        bookmark: replication_key value, or None
+    Returns:
+        The ISO formatted date or datetime, the string value, or None.
+    """
+    if bookmark is None:
+        return None
+    return bookmark.isoformat() if isinstance(bookmark, (datetime, date)) else str(bookmark)
+
+
+def _checkpoint(state, stream, replication_key, bookmark, chunk_plan=None):
     """
     Update the state dictionary with the latest bookmark for a given stream and replication key.
     This function is called periodically during the sync process to save progress.
@@ -699,14 +1007,15 @@ def _checkpoint(state, stream, replication_key, bookmark):
         stream: name of the stream (table) being synced
         replication_key: name of the replication key column
         bookmark: latest value of the replication key
+        chunk_plan: chunk plan of a table that is partially synced, kept in state so that a resumed sync can reuse it.
+            It is saved with the bookmark as its start_bookmark and should only hold the boundaries after the bookmark.
     """
-    if replication_key and bookmark is not None:
-        # Format the bookmark value appropriately for JSON serialization
-        bookmark = (
-            bookmark.isoformat() if isinstance(bookmark, (datetime, date)) else str(bookmark)
-        )
+    if replication_key:
+        bookmark = _serialize_bookmark(bookmark)
 
     state[stream] = {"bookmark": bookmark, "replication_key": replication_key}
+    if chunk_plan is not None:
+        state[stream]["chunk_plan"] = {**chunk_plan, "start_bookmark": bookmark}
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
     # from the correct position in case of next sync or interruptions.
     # Learn more about how and where to checkpoint by reading our best practices documentation
@@ -714,112 +1023,163 @@ def _checkpoint(state, stream, replication_key, bookmark):
     op.checkpoint(state=state)
 
 
-def sync_table_chunked_cursors(connection, plan, state, bookmark, batch_size):
+def _sync_chunk(
+    chunk_connections,
+    plan,
+    state,
+    chunk_number,
+    lower_bound,
+    upper_bound,
+    batch_size,
+    prefetch_depth,
+    chunk_plan=None,
+):
     """
-    Sync a table using chunked cursors to avoid server side cursor memory limits.
-    This function processes data in chunks by creating smaller cursors based on replication_key ranges.
-    Each chunk is bounded by finding the replication_key value at approximately CHUNK_SIZE rows,
-    ensuring all rows with the boundary value are included in the same chunk (no data loss).
-
+    Sync the rows of a single chunk (lower_bound, upper_bound] using a connection acquired for this chunk.
     Args:
-        connection: Redshift connection object
+        chunk_connections: _ChunkConnections instance to acquire the connection from
         plan: TablePlan dataclass instance with sync details
         state: current state dictionary
-        bookmark: last synced value of the replication key
+        chunk_number: one-based number of the chunk, used for logging and the cursor name
+        lower_bound: exclusive lower bound of the replication_key, or None for no lower bound
+        upper_bound: inclusive upper bound of the replication_key, or None for no upper bound
         batch_size: number of rows to fetch per batch
+        prefetch_depth: number of batches to prefetch in the background, or 0 to disable prefetching
+        chunk_plan: chunk plan to checkpoint every CHECKPOINT_EVERY_ROWS rows within the chunk,
+            or None to leave checkpointing to the chunk watermark
+    Returns:
+        A tuple of (chunk_last_bookmark, chunk_seen) with the last replication_key value and the rows processed.
     """
-    replication_key = plan.replication_key
-    current_bookmark = bookmark
-    total_seen = 0
-    chunk_number = 0
-
-    log.info(f"{plan.stream}: Using chunked cursors with target chunk size of {CHUNK_SIZE} rows")
+    chunk_query, chunk_params = build_select(
+        redshift_schema=plan.schema,
+        table=plan.table,
+        columns=plan.selected_columns,
+        replication_key=plan.replication_key,
+        bookmark=lower_bound,
+        upper_bound=upper_bound,
+    )
 
-    # Process data in chunks until all rows are synced
-    while True:
-        # Find the upper bound for this chunk (replication_key value at ~CHUNK_SIZE rows)
-        upper_bound = _find_chunk_upper_bound(
-            connection=connection,
-            plan=plan,
-            replication_key=replication_key,
-            bookmark=current_bookmark,
-            chunk_size=CHUNK_SIZE,
+    connection, borrowed = chunk_connections.acquire()
+    try:
+        log.info(
+            f"{plan.stream}: Processing chunk {chunk_number} "
+            f"(lower_bound: {lower_bound}, upper_bound: {upper_bound})"
         )
-
-        chunk_number += 1
-
-        # Build query for this chunk
-        # If upper_bound exists, use it to bound the chunk (inclusive)
-        if upper_bound is not None:
-            log.info(
-                f"{plan.stream}: Processing chunk {chunk_number} "
-                f"(bookmark: {current_bookmark}, upper_bound: {upper_bound})"
-            )
-            chunk_query, chunk_params = build_select(
-                redshift_schema=plan.schema,
-                table=plan.table,
-                columns=plan.selected_columns,
-                replication_key=replication_key,
-                bookmark=current_bookmark,
-                upper_bound=upper_bound,
-            )
-        else:
-            # If upper_bound is None, there are fewer than CHUNK_SIZE rows remaining - process all of them
-            log.info(
-                f"{plan.stream}: Processing final chunk {chunk_number} "
-                f"(bookmark: {current_bookmark}, no upper_bound - fetching all remaining rows)"
-            )
-            chunk_query, chunk_params = build_select(
-                redshift_schema=plan.schema,
-                table=plan.table,
-                columns=plan.selected_columns,
-                replication_key=replication_key,
-                bookmark=current_bookmark,
-            )
-
         with connection.cursor() as cursor:
             table_cursor = f"{plan.table}_chunk_{chunk_number}_cursor"
             _declare_cursor(cursor, table_cursor, chunk_query, chunk_params)
-
-            # Upsert records in batches and update state with bookmarks
-            # Column names are extracted from cursor.description after first FETCH
-            state, chunk_last_bookmark, chunk_seen = upsert_record(
+            _, chunk_last_bookmark, chunk_seen = upsert_record(
                 cursor=cursor,
                 plan=plan,
                 state=state,
-                replication_key=replication_key,
-                last_bookmark=current_bookmark,
+                replication_key=plan.replication_key,
+                last_bookmark=lower_bound,
                 batch_size=batch_size,
                 seen=0,
                 table_cursor=table_cursor,
+                prefetch_depth=prefetch_depth,
+                periodic_checkpoint=chunk_plan is not None,
+                chunk_plan=chunk_plan,
             )
             cursor.execute("COMMIT")
+    finally:
+        chunk_connections.release(connection, borrowed)
 
-            total_seen += chunk_seen
+    log.info(f"{plan.stream}: Chunk {chunk_number} complete, {chunk_seen} row(s) processed")
+    return chunk_last_bookmark, chunk_seen
 
-            # Update bookmark based on what was processed
-            if upper_bound is not None:
-                # Use upper_bound as bookmark (safe boundary - all rows with this value processed)
-                current_bookmark = upper_bound
-            else:
-                # Final chunk - use the last bookmark from actual data processed
-                current_bookmark = chunk_last_bookmark
 
-            # Checkpoint after each chunk
-            _checkpoint(state, plan.stream, replication_key, current_bookmark)
+def sync_table_chunked_cursors(
+    connection,
+    plan,
+    state,
+    bookmark,
+    batch_size,
+    prefetch_depth=0,
+    pool=None,
+    parallel_chunk_workers=1,
+):
+    """
+    Sync a table using chunked cursors to avoid server side cursor memory limits.
+    This function processes data in chunks by creating smaller cursors based on replication_key ranges.
+    All chunk boundaries are computed up front in a single query, at approximately every CHUNK_SIZE rows,
+    and the chunk plan is cached in state so that a resumed sync reuses it.
+    Up to parallel_chunk_workers chunks are synced at once, each on its own connection. The table's own connection
+    is always used and idle pool connections are borrowed one chunk at a time.
+    The bookmark is only checkpointed past chunks that are fully complete. When the chunks are synced
+    one after another, the bookmark is also checkpointed every CHECKPOINT_EVERY_ROWS rows within a chunk.
+    Args:
+        connection: Redshift connection object held by the table worker
+        plan: TablePlan dataclass instance with sync details
+        state: current state dictionary
+        bookmark: last synced value of the replication key
+        batch_size: number of rows to fetch per batch
+        prefetch_depth: number of batches to prefetch in the background, or 0 to disable prefetching
+        pool: _ConnectionPool instance to borrow idle connections from, or None
+        parallel_chunk_workers: maximum number of chunks synced at the same time
+    """
+    replication_key = plan.replication_key
+    chunk_plan, upper_bounds = _get_chunk_upper_bounds(
+        connection=connection, plan=plan, state=state, bookmark=bookmark
+    )
+    # The final chunk has no upper bound, so that it includes all rows after the last boundary
+    lower_bounds = [bookmark] + upper_bounds
+    chunk_ranges = list(zip(lower_bounds, upper_bounds + [None]))
 
-            log.info(
-                f"{plan.stream}: Chunk {chunk_number} complete, {chunk_seen} row(s) processed"
-            )
+    log.info(
+        f"{plan.stream}: Using {len(chunk_ranges)} chunk(s) of ~{CHUNK_SIZE} rows "
+        f"with up to {parallel_chunk_workers} parallel chunk worker(s)"
+    )
+
+    watermark = _ChunkWatermark(
+        state=state,
+        stream=plan.stream,
+        replication_key=replication_key,
+        bookmark=bookmark,
+        chunk_count=len(chunk_ranges),
+        chunk_plan=chunk_plan,
+    )
+    chunk_connections = _ChunkConnections(connection=connection, pool=pool)
+
+    def sync_and_complete_chunk(chunk_index, lower_bound, upper_bound):
+        # Every previous chunk is complete when the chunks are synced one after another,
+        # so bookmarks within the chunk are safe to checkpoint
+        in_chunk_plan = (
+            watermark.remaining_plan(chunk_index) if parallel_chunk_workers == 1 else None
+        )
+        chunk_last_bookmark, chunk_seen = _sync_chunk(
+            chunk_connections=chunk_connections,
+            plan=plan,
+            state=state,
+            chunk_number=chunk_index + 1,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            batch_size=batch_size,
+            prefetch_depth=prefetch_depth,
+            chunk_plan=in_chunk_plan,
+        )
+        # Bounded chunks end at their upper bound. The final chunk ends at the last row it processed.
+        end_bookmark = upper_bound if upper_bound is not None else chunk_last_bookmark
+        watermark.complete(chunk_index=chunk_index, end_bookmark=end_bookmark)
+        return chunk_seen
 
-            # Exit conditions:
-            # 1. This was the final chunk (no upper_bound) - we've processed all remaining rows
-            # 2. No rows were processed in this chunk - no more data
-            if upper_bound is None or chunk_seen == 0:
-                break
+    total_seen = 0
+    with ThreadPoolExecutor(max_workers=parallel_chunk_workers) as executor:
+        futures = [
+            executor.submit(sync_and_complete_chunk, chunk_index, lower_bound, upper_bound)
+            for chunk_index, (lower_bound, upper_bound) in enumerate(chunk_ranges)
+        ]
+        try:
+            for future in as_completed(futures):
+                total_seen += future.result()
+        except Exception:
+            # Do not start the remaining chunks once one of them has failed
+            for future in futures:
+                future.cancel()
+            raise
 
     log.info(
-        f"{plan.stream}: Chunked cursor sync complete, {total_seen} row(s) processed in {chunk_number} chunk(s)."
+        f"{plan.stream}: Chunked cursor sync complete, {total_seen} row(s) processed in {len(chunk_ranges)} chunk(s)."
     )
 
 
@@ -832,6 +1192,9 @@ def upsert_record(
     batch_size,
     seen,
     table_cursor,
+    prefetch_depth=0,
+    periodic_checkpoint=True,
+    chunk_plan=None,
 ):
     """
     Upsert records from the cursor into the destination table based on the provided TablePlan.
@@ -839,6 +1202,8 @@ def upsert_record(
     It also updates the state with the latest bookmark for incremental syncs.
     Column names are extracted from cursor.description after the first FETCH, eliminating the need
     for a separate metadata query.
+    If prefetch_depth is greater than 0, the next batches are fetched in the background while the
+    current batch is being upserted, with at most prefetch_depth batches waiting in memory.
     Args:
         cursor: database cursor with executed query
         plan: TablePlan dataclass instance with sync details
@@ -848,24 +1213,24 @@ def upsert_record(
         batch_size: number of rows to fetch per batch
         seen: count of rows processed so far
         table_cursor: name of the declared cursor in the database
+        prefetch_depth: number of batches to prefetch in the background, or 0 to fetch on the calling thread
+        periodic_checkpoint: whether to checkpoint every CHECKPOINT_EVERY_ROWS rows. Parallel chunk workers disable this,
+            because chunk bookmarks are only safe to save once all previous chunks are complete.
+        chunk_plan: chunk plan to keep in state with the periodic checkpoints, or None
     Returns:
         Updated state dictionary, last bookmark value, and total rows seen
     """
-    column_names = None
-
-    while True:
-        # Fetch rows in batches to handle large datasets efficiently
-        cursor.execute(f"FETCH {batch_size} FROM {table_cursor}")
-        rows = cursor.fetchall()
-
-        if not rows:
-            # No more rows to fetch; exit the loop
-            break
-
-        # Extract column names from cursor.description after first FETCH
-        if column_names is None:
-            column_names = [desc[0] for desc in cursor.description]
+    if prefetch_depth > 0:
+        batches = _BatchPrefetcher(
+            cursor=cursor,
+            table_cursor=table_cursor,
+            batch_size=batch_size,
+            prefetch_depth=prefetch_depth,
+        )
+    else:
+        batches = _fetch_batches(cursor=cursor, table_cursor=table_cursor, batch_size=batch_size)
 
+    for column_names, rows in batches:
         for row in rows:
             # Form a record dictionary mapping column names to their corresponding values
             record = dict(zip(column_names, row))
@@ -882,15 +1247,17 @@ def upsert_record(
                 if replication_key_val is not None:
                     last_bookmark = replication_key_val
 
-            if seen % CHECKPOINT_EVERY_ROWS == 0:
+            if periodic_checkpoint and seen % CHECKPOINT_EVERY_ROWS == 0:
                 # Periodically checkpoint the state to save progress
-                _checkpoint(state, plan.stream, replication_key, last_bookmark)
+                _checkpoint(state, plan.stream, replication_key, last_bookmark, chunk_plan)
 
     cursor.execute(f"CLOSE {table_cursor}")
     return state, last_bookmark, seen
 
 
-def sync_table_server_side_cursor(connection, replication_key, plan, state, bookmark, batch_size):
+def sync_table_server_side_cursor(
+    connection, replication_key, plan, state, bookmark, batch_size, prefetch_depth=0
+):
     """
     Sync a single table using server-side cursors.
     This function handles both full and incremental syncs, applying the appropriate logic based on the plan.
@@ -902,6 +1269,7 @@ def sync_table_server_side_cursor(connection, replication_key, plan, state, book
         state: current state dictionary
         bookmark: last synced value of the replication key
         batch_size: number of rows to fetch per batch
+        prefetch_depth: number of batches to prefetch in the background, or 0 to disable prefetching
     """
     # Build the SQL query and parameters for the SELECT statement
     sql_query, params = build_select(
@@ -932,6 +1300,7 @@ def sync_table_server_side_cursor(connection, replication_key, plan, state, book
             batch_size=batch_size,
             seen=seen,
             table_cursor=table_cursor,
+            prefetch_depth=prefetch_depth,
         )
 
         # Commit the transaction
@@ -942,22 +1311,29 @@ def sync_table_server_side_cursor(connection, replication_key, plan, state, book
     log.info(f"{plan.stream}: sync complete, {seen} row(s) processed.")
 
 
-def sync_table(connection, configuration, plan, state):
+def sync_table(connection, configuration, plan, state, pool=None):
     """
     Sync a single table based on the provided TablePlan.
     This function handles both full and incremental syncs, applying the appropriate logic based on the plan.
     It fetches data in batches, upserts records into the destination, and updates the state with bookmarks.
     Supports both standard and chunked cursor processing based on the plan configuration.
+    Chunked tables are synced with parallel chunk workers when parallel_chunk_workers is greater than 1.
     Args:
         connection: Redshift connection object
         configuration: dict with connector configuration
         plan: TablePlan dataclass instance with sync details
         state: current state dictionary
+        pool: _ConnectionPool instance whose idle connections can be borrowed by chunk workers, or None
     """
     replication_key = plan.replication_key
     prev_state = state.get(plan.stream) or {}
     bookmark = prev_state.get("bookmark") if replication_key else None
     batch_size = int(configuration["batch_size"])
+    # Number of batches fetched ahead in the background while the current batch is upserted
+    # Each prefetched batch holds up to batch_size rows in memory. Set to 0 to disable prefetching.
+    prefetch_depth = int(configuration.get("prefetch_depth", "0"))
+    # Maximum number of chunks of a single table synced at the same time
+    parallel_chunk_workers = int(configuration.get("parallel_chunk_workers", "1"))
 
     # Use the appropriate sync method based on whether chunking is enabled for the table
     if plan.use_chunking and replication_key:
@@ -968,6 +1344,9 @@ def sync_table(connection, configuration, plan, state):
             state=state,
             bookmark=bookmark,
             batch_size=batch_size,
+            prefetch_depth=prefetch_depth,
+            pool=pool,
+            parallel_chunk_workers=parallel_chunk_workers,
         )
     else:
         log.info(f"{plan.stream}: Using server-side cursor processing")
@@ -978,6 +1357,7 @@ def sync_table(connection, configuration, plan, state):
             state=state,
             bookmark=bookmark,
             batch_size=batch_size,
+            prefetch_depth=prefetch_depth,
         )
 
 
@@ -998,7 +1378,10 @@ def _run_plan_with_pool(plan, pool, configuration, state):
     connection = pool.acquire()
     try:
         # Sync the table using the acquired connection
-        sync_table(connection=connection, configuration=configuration, plan=plan, state=state)
+        # Idle connections in the pool can be borrowed by the chunk workers of this table
+        sync_table(
+            connection=connection, configuration=configuration, plan=plan, state=state, pool=pool
+        )
         return plan.stream
     finally:
         # Release the connection back to the pool
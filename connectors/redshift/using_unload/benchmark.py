@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+UNLOAD Parquet Reader Benchmark
+Compares reading UNLOAD part files one at a time against the concurrent multi-file reader in S3Client.
+
+Local Parquet files stand in for the UNLOAD output in S3: the S3Client under benchmark is pointed at a
+temporary directory through the PyArrow local filesystem, so no AWS credentials or network access are required.
+The records are converted to upsertable dictionaries without calling op.upsert, either row by row as the connector
+used to, or column by column with _convert_table_types as sync_from_s3 does now.
+Local reads have no network latency, so --latency-ms adds a delay to every row group read to model S3 round trips.
+
+Usage:
+    python benchmark.py --files 16 --rows-per-file 250000 --workers 4 --latency-ms 50
+"""
+
+# For parsing command line arguments
+import argparse
+
+# For creating and cleaning up the temporary directory holding the Parquet files
+import shutil
+import tempfile
+
+# For measuring the elapsed time
+import time
+
+# For the row by row conversion baseline
+from datetime import date, datetime
+
+# For generating the Parquet files
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import fs as pa_fs
+
+# The S3 client and record conversion under benchmark
+from s3_client import S3Client
+from redshift_client import _convert_table_types
+
+# The fivetran debug harness normally sets the log level, which the S3 client needs for its log messages
+from fivetran_connector_sdk import Logging
+
+if Logging.LOG_LEVEL is None:
+    Logging.LOG_LEVEL = Logging.Level.WARNING
+
+
+def generate_parquet_files(directory: str, file_count: int, rows_per_file: int) -> list:
+    """
+    Generate Parquet files shaped like UNLOAD part files.
+    Args:
+        directory: Directory to write the files to
+        file_count: Number of files to generate
+        rows_per_file: Number of rows per file
+    Returns:
+        list: Keys of the generated files, relative to the directory
+    """
+    keys = []
+    for file_index in range(file_count):
+        start = file_index * rows_per_file
+        table = pa.table(
+            {
+                "id": pa.array(range(start, start + rows_per_file), type=pa.int64()),
+                "name": pa.array([f"name_{index}" for index in range(rows_per_file)]),
+                "amount": pa.array([index * 0.5 for index in range(rows_per_file)]),
+                "updated_at": pa.array(
+                    [1_700_000_000_000_000 + index for index in range(rows_per_file)],
+                    type=pa.timestamp("us"),
+                ),
+            }
+        )
+        key = f"{file_index:04d}_part_00.parquet"
+        pq.write_table(
+            table, f"{directory}/{key}", row_group_size=rows_per_file // 4, compression="snappy"
+        )
+        keys.append(key)
+    return keys
+
+
+def create_local_s3_client(directory: str, latency_ms: int) -> S3Client:
+    """
+    Create an S3Client that reads from a local directory instead of an S3 bucket.
+    Args:
+        directory: Directory standing in for the S3 bucket
+        latency_ms: Delay in milliseconds added to every row group read
+    Returns:
+        S3Client: client reading through the PyArrow local filesystem
+    """
+    s3_client = S3Client.__new__(S3Client)
+    s3_client.bucket = directory
+    s3_client.pa_filesystem = pa_fs.LocalFileSystem()
+
+    if latency_ms:
+        read_local_row_groups = s3_client.read_row_groups
+
+        def read_row_groups_with_latency(key):
+            for table in read_local_row_groups(key):
+                time.sleep(latency_ms / 1000)
+                yield table
+
+        s3_client.read_row_groups = read_row_groups_with_latency
+    return s3_client
+
+
+def process_record(record: dict) -> dict:
+    """
+    Baseline: convert a record row by row, building a second dictionary per row.
+    """
+    processed = {}
+    for key, value in record.items():
+        if isinstance(value, (datetime, date)):
+            processed[key] = value.isoformat()
+        elif isinstance(value, bytes):
+            processed[key] = value.decode("utf-8", errors="replace")
+        else:
+            processed[key] = value
+    return processed
+
+
+def read_parquet_file(s3_client: S3Client, key: str):
+    """
+    Read one Parquet file and yield its records one at a time, as the connector used to before it read
+    several files concurrently. Kept here as the sequential reference of the benchmark.
+    """
+    for table in s3_client.read_row_groups(key):
+        yield from table.to_pylist()
+
+
+def read_sequentially(s3_client: S3Client, keys: list) -> int:
+    """
+    Baseline: read the files one at a time and convert the records row by row.
+    """
+    count = 0
+    for key in keys:
+        for record in read_parquet_file(s3_client, key):
+            process_record(record)
+            count += 1
+    return count
+
+
+def read_sequentially_columnar(s3_client: S3Client, keys: list) -> int:
+    """
+    Read the files one at a time and convert each row group column by column.
+    """
+    count = 0
+    for key in keys:
+        for table in s3_client.read_row_groups(key):
+            count += len(_convert_table_types(table).to_pylist())
+    return count
+
+
+def read_concurrently(s3_client: S3Client, keys: list, workers: int) -> int:
+    """
+    Read the files with the concurrent multi-file reader and convert each row group column by column.
+    """
+    count = 0
+    for _, table in s3_client.read_parquet_files(keys=keys, max_workers=workers):
+        count += len(_convert_table_types(table).to_pylist())
+    return count
+
+
+def run_benchmark(name: str, read_function, *args) -> float:
+    """
+    Run one read function and print its throughput.
+    Args:
+        name: Label printed in the results
+        read_function: Function returning the number of records read
+        args: Arguments passed to read_function
+    Returns:
+        float: Elapsed time in seconds
+    """
+    start_time = time.perf_counter()
+    count = read_function(*args)
+    elapsed = time.perf_counter() - start_time
+    print(f"{name:<34} {count:>12,} rows {elapsed:>9.2f}s {count / elapsed:>14,.0f} rows/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the UNLOAD Parquet readers")
+    parser.add_argument("--files", type=int, default=16, help="Number of Parquet files")
+    parser.add_argument("--rows-per-file", type=int, default=250_000, help="Rows per file")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent reader workers")
+    parser.add_argument(
+        "--latency-ms", type=int, default=0, help="Delay added to every row group read"
+    )
+    arguments = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="unload_benchmark_")
+    try:
+        keys = generate_parquet_files(directory, arguments.files, arguments.rows_per_file)
+        s3_client = create_local_s3_client(directory, arguments.latency_ms)
+
+        sequential_elapsed = run_benchmark(
+            "sequential, row conversion", read_sequentially, s3_client, keys
+        )
+        run_benchmark(
+            "sequential, columnar conversion", read_sequentially_columnar, s3_client, keys
+        )
+        concurrent_elapsed = run_benchmark(
+            f"concurrent ({arguments.workers}), columnar conversion",
+            read_concurrently,
+            s3_client,
+            keys,
+            arguments.workers,
+        )
+        print(f"speedup: {sequential_elapsed / concurrent_elapsed:.2f}x")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ import redshift_connector  # Redshift database connector
 from queue import Queue  # For managing connection pool
 import uuid  # For generating unique IDs
 import time  # For timestamp generation
+import re  # For recognising fixed UTC offset timezones
+import pyarrow as pa  # For column-wise type conversion of Parquet row groups
+import pyarrow.compute as pc  # For vectorised compute kernels
 
 # Import table specifications and constants
 from table_specs import (
@@ -44,6 +47,11 @@ __QUERY_ROW_COUNT = False  # Query STL_UNLOAD_LOG for row count after UNLOAD (ad
 # Variables for S3 bucket
 __DEFAULT_BUCKET_PREFIX = "fivetran-unload"
 
+# Variables for reading UNLOAD output
+__DEFAULT_PARQUET_READER_WORKERS = (
+    4  # Number of UNLOAD part files downloaded and decoded at the same time
+)
+
 
 @dataclass
 class TablePlan:
@@ -797,14 +805,18 @@ def sync_from_s3(
     plan: TablePlan,
     s3_prefix: str,
     state: dict,
+    reader_workers: int = 1,
 ) -> int:
     """
     Sync data from S3 files exported by UNLOAD.
+    UNLOAD writes one or more part files per slice, so the part files are read concurrently by up to
+    reader_workers reader threads, while the records are upserted from this thread in file order.
     Args:
         s3_client: S3Client instance
         plan: TablePlan instance
         s3_prefix: S3 prefix where files are located
         state: Current sync state
+        reader_workers: Number of Parquet files read at the same time
     Returns:
         Total number of rows processed
     """
@@ -820,16 +832,22 @@ def sync_from_s3(
         return 0
 
     seen = 0
+    current_file_key = None
+    processed_record = None
+
+    # Read the Parquet files concurrently, one row group at a time, in file order
+    for file_key, table in s3_client.read_parquet_files(keys=files, max_workers=reader_workers):
+        if file_key != current_file_key:
+            if processed_record is not None:
+                # Final checkpoint after each file
+                _checkpoint(state, plan.stream, replication_key, last_bookmark, processed_record)
+            log.info(f"{plan.stream}: Processing file {file_key}")
+            current_file_key = file_key
 
-    for file_key in files:
-        log.info(f"{plan.stream}: Processing file {file_key}")
-        processed_record = None
-
-        # Read Parquet file in batches
-        for record in s3_client.read_parquet_file(file_key):
-            # Convert any special types for proper serialization
-            processed_record = _process_record(record=record)
+        # Convert any special types for proper serialization, column by column, before materialising the rows
+        table = _convert_table_types(table)
 
+        for processed_record in table.to_pylist():
             # The 'upsert' operation is used to insert or update data in the destination table.
             # The op.upsert method is called with two arguments:
             # - The first argument is the name of the table to upsert the data into.
@@ -841,28 +859,105 @@ def sync_from_s3(
             if seen % CHECKPOINT_EVERY_ROWS == 0:
                 _checkpoint(state, plan.stream, replication_key, last_bookmark, processed_record)
 
-        # Final checkpoint after each file
+    if processed_record is not None:
+        # Final checkpoint after the last file
         _checkpoint(state, plan.stream, replication_key, last_bookmark, processed_record)
     return seen
 
 
-def _process_record(record) -> Dict[str, Any]:
+def _format_timestamp_column(column: pa.ChunkedArray, timestamp_type: pa.TimestampType):
+    """
+    Format a timestamp column as ISO 8601 strings in a few compute kernels.
+    The strings are identical to the isoformat() of the values returned by to_pylist(), which the connector
+    used before, because they are upserted and also checkpointed as the replication bookmark:
+    the fraction of the seconds is omitted when it is zero, and the UTC offset of timezone-aware columns
+    is written as +HH:MM. Nanosecond timestamps keep nine digits when the nanoseconds are not zero.
+    Args:
+        column: timestamp column of a row group
+        timestamp_type: PyArrow timestamp type of the column
+    Returns:
+        String column with ISO 8601 formatted timestamps
+    """
+    if timestamp_type.unit in ("s", "ms"):
+        # to_pylist() returns these as datetimes with microseconds, so format them with six digits as well
+        column = pc.cast(column, pa.timestamp("us", tz=timestamp_type.tz))
+
+    fixed_offset = timestamp_type.tz and re.fullmatch(r"([+-])(\d{2}):(\d{2})", timestamp_type.tz)
+    if fixed_offset:
+        # Parquet files without an Arrow schema are read with a fixed UTC offset such as +00:00, which
+        # strftime cannot look up in the timezone database, so format the local time and append the offset
+        sign, hours, minutes = fixed_offset.groups()
+        offset_seconds = (int(hours) * 3600 + int(minutes) * 60) * (-1 if sign == "-" else 1)
+        column = pc.cast(column, pa.timestamp(column.type.unit))
+        column = pc.add(column, pa.scalar(offset_seconds, pa.int64()).cast(pa.duration("s")))
+
+    # %S includes the fraction of the seconds, with as many digits as the unit of the column,
+    # and %z writes the UTC offset as +HHMM
+    if timestamp_type.tz and not fixed_offset:
+        timestamp_format = "%Y-%m-%dT%H:%M:%S%z"
+    else:
+        timestamp_format = "%Y-%m-%dT%H:%M:%S"
+    formatted = pc.strftime(column, format=timestamp_format)
+    if timestamp_type.unit == "ns":
+        # Show microseconds when the nanoseconds are zero
+        formatted = pc.replace_substring_regex(
+            formatted, pattern=r"\.(\d{6})000([+-]\d{4}|)$", replacement=r".\1\2"
+        )
+    formatted = pc.replace_substring_regex(
+        formatted, pattern=r"\.0+([+-]\d{4}|)$", replacement=r"\1"
+    )
+    if fixed_offset:
+        formatted = pc.binary_join_element_wise(formatted, timestamp_type.tz, "")
+    elif timestamp_type.tz:
+        formatted = pc.replace_substring_regex(
+            formatted, pattern=r"([+-]\d{2})(\d{2})$", replacement=r"\1:\2"
+        )
+    return formatted
+
+
+def _decode_binary_column(column: pa.ChunkedArray):
     """
-    Process a record to ensure proper serialization of special types.
+    Decode a binary column as UTF-8 strings.
+    The column is cast in a single compute kernel. If it contains invalid UTF-8, it is decoded value by value
+    and the invalid bytes are replaced, as the cast would fail.
     Args:
-        record: record from Parquet file
+        column: binary column of a row group
     Returns:
-        Processed record with serializable values
-    """
-    processed = {}
-    for key, value in record.items():
-        if isinstance(value, (datetime, date)):
-            processed[key] = value.isoformat()
-        elif isinstance(value, bytes):
-            processed[key] = value.decode("utf-8", errors="replace")
+        String column with the decoded values
+    """
+    try:
+        return pc.cast(column, pa.string())
+    except pa.ArrowInvalid:
+        decoded_values = [
+            value.decode("utf-8", errors="replace") if value is not None else None
+            for value in column.to_pylist()
+        ]
+        return pa.array(decoded_values, type=pa.string())
+
+
+def _convert_table_types(table: pa.Table) -> pa.Table:
+    """
+    Convert the columns of a row group that need special serialization, one column at a time.
+    Timestamp and date columns are formatted as ISO 8601 strings and binary columns are decoded as UTF-8,
+    using vectorised compute kernels before any rows are materialised. This way, the records produced by
+    to_pylist() can be upserted directly, without building a second dictionary per row.
+    Args:
+        table: PyArrow table holding one row group
+    Returns:
+        PyArrow table with serializable column types
+    """
+    for index, field in enumerate(table.schema):
+        column = table.column(index)
+        if pa.types.is_timestamp(field.type):
+            converted_column = _format_timestamp_column(column, field.type)
+        elif pa.types.is_date(field.type):
+            converted_column = pc.cast(column, pa.string())
+        elif pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type):
+            converted_column = _decode_binary_column(column)
         else:
-            processed[key] = value
-    return processed
+            continue
+        table = table.set_column(index, field.name, converted_column)
+    return table
 
 
 def sync_table_via_unload(
@@ -889,6 +984,11 @@ def sync_table_via_unload(
         state=state,
     )
 
+    # Number of UNLOAD part files read concurrently for this table
+    reader_workers = int(
+        configuration.get("parquet_reader_workers", __DEFAULT_PARQUET_READER_WORKERS)
+    )
+
     # Read data from S3 and sync
     try:
         seen = sync_from_s3(
@@ -896,6 +996,7 @@ def sync_table_via_unload(
             plan=plan,
             s3_prefix=s3_prefix,
             state=state,
+            reader_workers=reader_workers,
         )
         log.info(f"{plan.stream}: Sync complete, {seen} row(s) processed.")
     finally:
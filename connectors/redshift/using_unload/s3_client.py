@@ -11,9 +11,15 @@ import boto3
 from botocore.config import Config
 
 # Import for type hinting
-from typing import List, Iterator, Dict, Any
+from typing import List, Iterator, Tuple
+
+# For reading several Parquet files concurrently with bounded buffers
+import threading
+from queue import Queue, Full
+from concurrent.futures import ThreadPoolExecutor
 
 # Import for Parquet file handling with memory-efficient S3 streaming
+import pyarrow as pa
 import pyarrow.parquet as pq
 from pyarrow import fs as pa_fs
 
@@ -28,6 +34,11 @@ class S3Client:
     Uses PyArrow S3FileSystem for memory-efficient streaming reads.
     """
 
+    # Sentinel placed on a file's row group queue once the whole file has been read
+    _END_OF_FILE = object()
+    # Interval in seconds at which a blocked reader checks whether the consumer has stopped
+    _POLL_INTERVAL_SECONDS = 1
+
     def __init__(self, configuration: dict):
         """
         Initialize S3 client with configuration parameters.
@@ -92,15 +103,15 @@ class S3Client:
         log.info(f"Found {len(files)} Parquet file(s) at prefix: {prefix}")
         return files
 
-    def read_parquet_file(self, key: str) -> Iterator[Dict[str, Any]]:
+    def read_row_groups(self, key: str) -> Iterator[pa.Table]:
         """
-        Read a Parquet file from S3 and yield records using memory-efficient streaming.
+        Read a Parquet file from S3 one row group at a time.
         Uses PyArrow S3FileSystem to stream data row-group by row-group without loading
         the entire file into memory.
         Args:
             key: S3 key of the Parquet file
         Yields:
-            Dictionary records one at a time
+            PyArrow tables, one per row group
         """
         # Construct the S3 path for PyArrow (without s3:// prefix)
         s3_path = f"{self.bucket}/{key}"
@@ -116,14 +127,66 @@ class S3Client:
 
         for row_group_idx in range(num_row_groups):
             # Read only one row group at a time to minimize memory usage
-            table = parquet_file.read_row_group(row_group_idx)
-            records = table.to_pylist()
+            yield parquet_file.read_row_group(row_group_idx)
 
-            # Yield records one at a time
-            yield from records
-
-            # Clear reference to allow garbage collection
-            del table, records
+    def read_parquet_files(
+        self, keys: List[str], max_workers: int, buffered_row_groups: int = 1
+    ) -> Iterator[Tuple[str, pa.Table]]:
+        """
+        Read several Parquet files concurrently and yield their row groups as one ordered stream.
+        Up to max_workers files are downloaded and decoded at the same time, each by its own reader thread.
+        Every reader hands its row groups over through a bounded queue, so memory is capped at roughly
+        max_workers * (buffered_row_groups + 1) row groups regardless of the number or size of the files.
+        Row groups are yielded in file order and, within a file, in row group order.
+        Args:
+            keys: List of S3 keys of the Parquet files
+            max_workers: Maximum number of files read at the same time
+            buffered_row_groups: Maximum number of decoded row groups waiting per file
+        Yields:
+            Tuples of (key, table) with one PyArrow table per row group
+        """
+        stop_event = threading.Event()
+        row_group_queues = [Queue(maxsize=buffered_row_groups) for _ in keys]
+
+        def put(row_group_queue, item):
+            # Wait while the queue is full, unless the consumer has stopped
+            while not stop_event.is_set():
+                try:
+                    row_group_queue.put(item, timeout=self._POLL_INTERVAL_SECONDS)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def read_file(key, row_group_queue):
+            try:
+                for table in self.read_row_groups(key):
+                    if not put(row_group_queue, table):
+                        return
+                put(row_group_queue, self._END_OF_FILE)
+            except Exception as e:
+                # Hand the exception over to the consumer, which re-raises it
+                put(row_group_queue, e)
+
+        # Files are submitted in order and consumed in order, so the file being consumed is always
+        # either complete or being read by one of the workers
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for key, row_group_queue in zip(keys, row_group_queues):
+                executor.submit(read_file, key, row_group_queue)
+
+            for key, row_group_queue in zip(keys, row_group_queues):
+                while True:
+                    item = row_group_queue.get()
+                    if item is self._END_OF_FILE:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield key, item
+        finally:
+            # Stop any readers still running and discard files that have not been started
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def delete_files(self, keys: List[str]) -> int:
         """
@@ -8,21 +8,48 @@ and the Best Practices documentation
 for details.
 """
 
+# For storing row IDs as a packed array of 64-bit integers
+from array import array
+
+# For encoding packed row IDs as strings in the state
+import base64
+
 # For generating MD5 hashes of row IDs as primary keys
 import hashlib
 
+# For decoding delta-encoded row IDs
+from itertools import accumulate
+
 # For reading configuration from a JSON file
 import json
 
 # For normalizing column names and table names
 import re
 
+# For detecting the byte order of the platform
+import sys
+
 # For rate limiting and retry backoff delays
 import time
 
+# For sharing the rate limiter between worker threads
+import threading
+
+# For compressing packed row IDs
+import zlib
+
+# For tracking request times in the sliding rate limit window
+from collections import deque
+
 # For flattening nested dictionaries
 from collections.abc import MutableMapping
 
+# For fetching sheets and reports concurrently
+from concurrent.futures import ThreadPoolExecutor
+
+# For binding the arguments of the fetch tasks run by the worker threads
+from functools import partial
+
 # For creating configuration and state classes
 from dataclasses import dataclass
 
@@ -36,7 +63,7 @@ from decimal import Decimal
 from enum import Enum
 
 # For type hints and annotations
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
 
 # For making HTTP requests to the Smartsheet API
 import requests
@@ -61,9 +88,16 @@ _TEST_MODE = False  # Set to True to limit row processing during development
 _TEST_ROW_LIMIT = 10  # Number of rows to process in test mode
 _DEFAULT_PAGE_SIZE = 100  # Smartsheet API default page size
 _DEFAULT_REQUESTS_PER_MINUTE = 60  # Default rate limit for Smartsheet API
+_RATE_LIMIT_WINDOW_SECONDS = 60  # Length of the sliding rate limit window
+_DEFAULT_RETRY_AFTER_SECONDS = 60  # Wait after a 429 response without a Retry-After header
+_MAX_RATE_LIMIT_RETRIES = 5  # Maximum number of retries of a request after 429 responses
+_DEFAULT_MAX_WORKERS = 4  # Default number of sheets and reports fetched concurrently
+_IN_FLIGHT_PER_WORKER = 2  # Sheets and reports fetched ahead of the emitting thread, per worker
 _MAX_RETRIES = 3  # Maximum number of retry attempts for API requests
 _BACKOFF_FACTOR = 1  # Base delay factor for exponential backoff
-_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]  # HTTP status codes that trigger retry
+# HTTP status codes that trigger retry. 429 responses are handled by the rate limiter instead,
+# so that a rate limit pauses all worker threads and not only the one that received it.
+_RETRY_STATUS_CODES = [500, 502, 503, 504]
 
 
 class StateManager:
@@ -82,17 +116,23 @@ class StateManager:
                 "sheet_states": {
                     "sheet_id": {
                         "last_modified": "ISO8601 timestamp",
-                        "row_ids": ["row_1", "row_2", "row_3"]
+                        "sheet_modified_at": "ISO8601 timestamp",
+                        "row_count": 3,
+                        "packed_row_ids": "base64 encoded row IDs"
                     },
                     ...
                 },
                 "report_states": {
                     "report_id": {
-                        "row_ids": ["row_1", "row_2", "row_3"]
+                        "row_count": 3,
+                        "packed_row_ids": "base64 encoded row IDs"
                     },
                     ...
                 }
             }
+
+        Row IDs are stored packed (see _pack_row_ids). States written by earlier
+        versions hold a "row_ids" list of strings instead, which is still read.
         """
         self.state = initial_state
         self.sheet_states = self.state.get("sheet_states", {})
@@ -108,7 +148,8 @@ class StateManager:
         Returns:
             Dict[str, Any]: State information for the sheet containing:
                 - last_modified: ISO8601 timestamp of the last sync, or None for new sheets
-                - row_ids: List of row IDs from the previous sync
+                - sheet_modified_at: The sheet's modifiedAt timestamp at the last sync
+                - packed_row_ids: Packed row IDs from the previous sync
                 If no state exists for the sheet, returns a default state
                 with last_modified set to None to fetch all rows on first sync.
 
@@ -121,7 +162,9 @@ class StateManager:
             sheet_id,
             {
                 "last_modified": None,
-                "row_ids": [],
+                "sheet_modified_at": None,
+                "row_count": 0,
+                "packed_row_ids": "",
             },
         )
 
@@ -134,16 +177,38 @@ class StateManager:
 
         Returns:
             Dict[str, Any]: State information for the report containing:
-                - row_ids: List of row IDs from the previous sync
+                - packed_row_ids: Packed row IDs from the previous sync
                 If no state exists for the report, returns a default state
-                with empty row_ids list.
+                with no row IDs.
         """
         return self.report_states.get(
             report_id,
-            {"row_ids": []},
+            {"row_count": 0, "packed_row_ids": ""},
         )
 
-    def update_sheet_state(self, sheet_id: str, last_modified: str, row_ids: List[str]):
+    @staticmethod
+    def get_row_ids(resource_state: Dict[str, Any]) -> Set[int]:
+        """
+        Get the row IDs recorded in a sheet or report state.
+
+        Args:
+            resource_state (Dict[str, Any]): State of a sheet or report
+
+        Returns:
+            Set[int]: Row IDs from the previous sync. Both the packed format and
+                the "row_ids" list written by earlier versions are supported.
+        """
+        if "packed_row_ids" in resource_state:
+            return set(_unpack_row_ids(resource_state["packed_row_ids"]))
+        return {int(row_id) for row_id in resource_state.get("row_ids", [])}
+
+    def update_sheet_state(
+        self,
+        sheet_id: str,
+        last_modified: str,
+        row_ids: Iterable[int],
+        sheet_modified_at: Optional[str] = None,
+    ):
         """
         Update state for a specific sheet after successful sync.
 
@@ -151,29 +216,38 @@ class StateManager:
             sheet_id (str): The unique identifier of the sheet
             last_modified (str): ISO8601 timestamp of the latest modification
                 found during the current sync
-            row_ids (List[str]): List of current row IDs in the sheet
+            row_ids (Iterable[int]): Current row IDs in the sheet
+            sheet_modified_at (Optional[str]): The sheet's modifiedAt timestamp,
+                used to skip the sheet in the next sync if it has not changed
 
         This method is called after processing a sheet to record the latest
         modification timestamp and current row IDs, which will be used for
         the next incremental sync and deletion detection.
         """
+        row_ids = sorted(row_ids)
         self.sheet_states[sheet_id] = {
             "last_modified": last_modified,
-            "row_ids": row_ids,
+            "sheet_modified_at": sheet_modified_at,
+            "row_count": len(row_ids),
+            "packed_row_ids": _pack_row_ids(row_ids),
         }
 
-    def update_report_state(self, report_id: str, row_ids: List[str]):
+    def update_report_state(self, report_id: str, row_ids: Iterable[int]):
         """
         Update state for a specific report after successful sync.
 
         Args:
             report_id (str): The unique identifier of the report
-            row_ids (List[str]): List of current row IDs in the report
+            row_ids (Iterable[int]): Current row IDs in the report
 
         This method is called after processing a report to record the current
         row IDs, which will be used for deletion detection in the next sync.
         """
-        self.report_states[report_id] = {"row_ids": row_ids}
+        row_ids = sorted(row_ids)
+        self.report_states[report_id] = {
+            "row_count": len(row_ids),
+            "packed_row_ids": _pack_row_ids(row_ids),
+        }
 
     def get_latest_modified(self) -> str:
         """
@@ -239,6 +313,7 @@ class SmartsheetConfig:
     sheet_ids: Optional[List[str]] = None
     report_ids: Optional[List[str]] = None
     requests_per_minute: int = _DEFAULT_REQUESTS_PER_MINUTE
+    max_workers: int = _DEFAULT_MAX_WORKERS
 
 
 def hash_value(data):
@@ -257,6 +332,48 @@ def hash_value(data):
     return dhash.hexdigest()
 
 
+def _pack_row_ids(sorted_row_ids: List[int]) -> str:
+    """
+    Pack sorted row IDs into a compact string for the state.
+
+    Smartsheet row IDs are 64-bit integers. They are delta-encoded, so that
+    each value is the gap to the previous ID, stored as a little-endian int64
+    array, compressed with zlib, and encoded with base64. The small gaps
+    compress far better than the IDs themselves.
+
+    Args:
+        sorted_row_ids (List[int]): Row IDs in ascending order
+
+    Returns:
+        str: The packed row IDs
+    """
+    deltas = array(
+        "q", (row_id - previous for previous, row_id in zip([0] + sorted_row_ids, sorted_row_ids))
+    )
+    if sys.byteorder != "little":
+        deltas.byteswap()
+    return base64.b64encode(zlib.compress(deltas.tobytes())).decode("ascii")
+
+
+def _unpack_row_ids(packed_row_ids: str) -> List[int]:
+    """
+    Unpack row IDs packed by _pack_row_ids.
+
+    Args:
+        packed_row_ids (str): The packed row IDs
+
+    Returns:
+        List[int]: Row IDs in ascending order
+    """
+    if not packed_row_ids:
+        return []
+    deltas = array("q")
+    deltas.frombytes(zlib.decompress(base64.b64decode(packed_row_ids)))
+    if sys.byteorder != "little":
+        deltas.byteswap()
+    return list(accumulate(deltas))
+
+
 def normalize_key(key):
     """
     Normalize the key by replacing spaces and special characters with underscores and converting to lowercase.
@@ -290,6 +407,62 @@ def flatten(dictionary, parent_key=False, separator="_"):
     return dict(items)
 
 
+class SlidingWindowRateLimiter:
+    """Thread-safe sliding window rate limiter"""
+
+    def __init__(self, max_requests: int, window_seconds: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_requests (int): Maximum number of requests in any window
+            window_seconds (float): Length of the sliding window in seconds
+
+        The start times of the last max_requests requests are kept in a deque
+        with a fixed maximum length, so recording a request drops the oldest
+        one in constant time instead of rebuilding a list on every call.
+        """
+        self.window_seconds = window_seconds
+        self.request_times = deque(maxlen=max_requests)
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait until a request can be made without exceeding the rate limit, and record it.
+
+        The lock is only held while checking and recording the request times.
+        Threads that have to wait sleep without holding it, so other threads
+        can still take free slots in the window.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait_time = self.paused_until - now
+                elif len(self.request_times) < self.request_times.maxlen:
+                    self.request_times.append(now)
+                    return
+                else:
+                    # The oldest request leaves the window at request_times[0] + window_seconds
+                    wait_time = self.request_times[0] + self.window_seconds - now
+                    if wait_time <= 0:
+                        self.request_times.append(now)
+                        return
+            log.debug(f"Rate limit reached, sleeping for {wait_time:.1f} seconds")
+            time.sleep(wait_time)
+
+    def pause(self, seconds: float):
+        """
+        Stop all threads from making requests for the given number of seconds.
+
+        Args:
+            seconds (float): Duration of the pause, usually the Retry-After value of a 429 response
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
 class SmartsheetAPI:
     """Handles all Smartsheet API interactions"""
 
@@ -326,33 +499,48 @@ class SmartsheetAPI:
         # To obtain an API token, log in to your Smartsheet account at https://app.smartsheet.com/
         self.headers = {"Authorization": f"Bearer {self.config.access_token}"}
 
-        self.request_times = []
+        # Shared by all worker threads, so the rate limit applies to the connector as a whole
+        self.rate_limiter = SlidingWindowRateLimiter(
+            self.config.requests_per_minute, _RATE_LIMIT_WINDOW_SECONDS
+        )
 
     def _check_rate_limit(self):
         """
         Implement rate limiting to stay within Smartsheet's API limits.
 
-        This method tracks API request times and enforces a sliding window
-        rate limit. If the rate limit is exceeded, it sleeps until enough
-        time has passed to make another request.
+        This method enforces a sliding window rate limit shared by all threads
+        using this client. If the rate limit is exceeded, the calling thread
+        sleeps until enough time has passed to make another request.
 
         The rate limit is configured via config.requests_per_minute and
         defaults to 60 requests per minute.
 
         Side Effects:
             - May sleep the current thread if rate limit is exceeded
-            - Updates internal request_times tracking
+            - Records the request in the rate limiter
         """
-        current_time = time.time()
-        self.request_times = [t for t in self.request_times if current_time - t < 60]
+        self.rate_limiter.acquire()
 
-        if len(self.request_times) >= self.config.requests_per_minute:
-            sleep_time = 60 - (current_time - self.request_times[0])
-            if sleep_time > 0:
-                log.debug(f"Rate limit reached, sleeping for {sleep_time} seconds")
-                time.sleep(sleep_time)
+    def map_concurrently(self, function, items: List[Any]) -> List[Any]:
+        """
+        Call a fetch function for each item using a pool of worker threads.
 
-        self.request_times.append(current_time)
+        Args:
+            function: Function called with each item, usually making API requests
+            items (List[Any]): Items to call the function with
+
+        Returns:
+            List[Any]: Results of the function, in the same order as the items
+
+        Note:
+            All workers share the rate limiter of this client, so the number of
+            workers (config.max_workers) only hides network latency and never
+            increases the request rate beyond config.requests_per_minute.
+        """
+        if self.config.max_workers <= 1 or len(items) <= 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            return list(executor.map(function, items))
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
@@ -375,15 +563,23 @@ class SmartsheetAPI:
             - Automatic retry for 5xx server errors
             - Proper error handling and logging
         """
-        self._check_rate_limit()
         url = f"{self.BASE_URL}/{endpoint}"
-        response = self.session.get(url, headers=self.headers, params=params)
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            self._check_rate_limit()
+            response = self.session.get(url, headers=self.headers, params=params)
 
-        if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-            log.debug(f"Rate limited, retrying after {retry_after} seconds")
-            time.sleep(retry_after)
-            return self.get(endpoint, params)
+            if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                break
+
+            # Pause every worker thread, since they share the same API rate limit
+            try:
+                retry_after = float(
+                    response.headers.get("Retry-After", _DEFAULT_RETRY_AFTER_SECONDS)
+                )
+            except ValueError:
+                retry_after = _DEFAULT_RETRY_AFTER_SECONDS
+            log.warning(f"Rate limited, pausing requests for {retry_after} seconds")
+            self.rate_limiter.pause(retry_after)
 
         response.raise_for_status()
         return response
@@ -405,14 +601,10 @@ class SmartsheetAPI:
         Note:
             The returned sheets contain basic metadata. Use get_sheet_details()
             to fetch complete sheet data including rows and cell values.
+            Specific sheets are fetched concurrently by config.max_workers threads.
         """
         if self.config.sheet_ids:
-            sheets = []
-            for sheet_id in self.config.sheet_ids:
-                log.debug(f"Fetching specific sheet: {sheet_id}")
-                response = self.get(f"sheets/{sheet_id}")
-                sheets.append(response.json())
-            return sheets
+            return self.map_concurrently(self._get_sheet, self.config.sheet_ids)
         else:
             log.debug("Fetching all accessible sheets")
             response = self.get("sheets")
@@ -541,15 +733,42 @@ class SmartsheetAPI:
             configuration. There is no "get all reports" endpoint available.
         """
         if self.config.report_ids:
-            reports = []
-            for report_id in self.config.report_ids:
-                log.debug(f"Fetching specific report: {report_id}")
-                response = self.get(f"reports/{report_id}")
-                reports.append(response.json())
-            return reports
+            return self.map_concurrently(self._get_report, self.config.report_ids)
         else:
             return []
 
+    def _get_sheet(self, sheet_id: str) -> Dict[str, Any]:
+        """
+        Get a single configured sheet. Called concurrently by get_sheets().
+
+        Args:
+            sheet_id (str): The unique identifier of the sheet to fetch
+
+        Returns:
+            Dict[str, Any]: Sheet object from the Smartsheet API
+
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+        """
+        log.debug(f"Fetching specific sheet: {sheet_id}")
+        return self.get(f"sheets/{sheet_id}").json()
+
+    def _get_report(self, report_id: str) -> Dict[str, Any]:
+        """
+        Get a single configured report. Called concurrently by get_reports().
+
+        Args:
+            report_id (str): The unique identifier of the report to fetch
+
+        Returns:
+            Dict[str, Any]: Report object from the Smartsheet API
+
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+        """
+        log.debug(f"Fetching specific report: {report_id}")
+        return self.get(f"reports/{report_id}").json()
+
     def get_report_details(self, report_id: str) -> Dict[str, Any]:
         """
         Get detailed information for a specific report including rows and cell data.
@@ -683,18 +902,21 @@ def _make_table_name(prefix: str, configured_name: str) -> str:
 
 
 def _delete_removed_rows(
-    table_name: str, previous_row_ids: set, current_row_ids: set, resource_label: str
+    table_name: str, previous_row_ids: Set[int], current_row_ids: Set[int], resource_label: str
 ):
     """
     Detect and delete rows that existed previously but are no longer present.
 
+    The row IDs are compared as integers, and only the deleted IDs are hashed
+    to build the primary keys of the delete operations.
+
     Args:
         table_name: Destination table name
         previous_row_ids: Set of row IDs from the previous sync
         current_row_ids: Set of row IDs from the current sync
         resource_label: Label for logging (e.g., "sheet 'My Sheet'")
     """
-    deleted_row_ids = previous_row_ids - current_row_ids
+    deleted_row_ids = previous_row_ids.difference(current_row_ids)
     if deleted_row_ids:
         log.info(f"{resource_label}: Found {len(deleted_row_ids)} deleted rows")
         for deleted_row_id in deleted_row_ids:
@@ -706,15 +928,33 @@ def _delete_removed_rows(
             op.delete(table_name, {"id": deleted_record_id})
 
 
-def _process_sheet(
+@dataclass
+class FetchedResource:
+    """Rows of a sheet or report fetched and parsed by a worker thread, ready to be emitted"""
+
+    resource_type: str
+    resource_id: str
+    name: str
+    table_name: str
+    records: List[Dict[str, Any]]
+    current_row_ids: Set[int]
+    previous_row_ids: Set[int]
+    last_modified: Optional[str] = None
+    modified_at: Optional[str] = None
+
+
+def _fetch_sheet(
     sheet: Dict[str, Any],
     sheets_config: Dict[str, str],
     api: SmartsheetAPI,
     data_handler: DataTypeHandler,
     state_manager: StateManager,
-):
+) -> Optional[FetchedResource]:
     """
-    Process a single sheet: fetch data, detect deletions, upsert rows, and checkpoint state.
+    Fetch the rows of a single sheet and parse them into records. Runs in a worker thread.
+
+    The state is only read here. Deletions, upserts, and state updates are done by
+    _emit_resource on the main thread, so the state stays consistent with what was emitted.
 
     Args:
         sheet: Sheet metadata from the Smartsheet API
@@ -722,6 +962,9 @@ def _process_sheet(
         api: SmartsheetAPI client instance
         data_handler: DataTypeHandler for parsing cell values
         state_manager: StateManager for tracking sync state
+
+    Returns:
+        Optional[FetchedResource]: The parsed sheet, or None if the sheet is unchanged or could not be fetched
     """
     sheet_id = str(sheet["id"])
     sheet_name = sheet["name"]
@@ -731,8 +974,17 @@ def _process_sheet(
     try:
         sheet_state = state_manager.get_sheet_state(sheet_id)
         last_modified = sheet_state.get("last_modified")
+        sheet_modified_at = sheet.get("modifiedAt")
+
+        # Any change to a sheet, including deleted rows, updates its modifiedAt timestamp,
+        # so a sheet with the same timestamp as in the last sync is skipped without fetching its rows
+        if sheet_modified_at and sheet_modified_at == sheet_state.get("sheet_modified_at"):
+            log.info(f"Sheet '{sheet_name}': Unchanged since {sheet_modified_at}, skipping")
+            return None
+
+        previous_row_ids = state_manager.get_row_ids(sheet_state)
         log.info(
-            f"Sheet '{sheet_name}': State loaded - last_modified={last_modified or 'INITIAL_SYNC'}, row_count={len(sheet_state.get('row_ids', []))}"
+            f"Sheet '{sheet_name}': State loaded - last_modified={last_modified or 'INITIAL_SYNC'}, row_count={len(previous_row_ids)}"
         )
         sheet_data = api.get_sheet_details(sheet_id, last_modified)
 
@@ -752,12 +1004,8 @@ def _process_sheet(
             f"Sheet '{sheet_name}': Using modifiedSince={last_modified or 'None (fetching all rows)'}"
         )
 
-        current_row_ids = {str(row["id"]) for row in sheet_rows}
-        previous_row_ids = set(sheet_state.get("row_ids", []))
-
-        _delete_removed_rows(
-            table_name, previous_row_ids, current_row_ids, f"Sheet '{sheet_name}'"
-        )
+        current_row_ids = {int(row["id"]) for row in sheet_rows}
+        records = []
 
         for row in sheet_rows:
             try:
@@ -778,48 +1026,47 @@ def _process_sheet(
 
                 row_modified = row.get("modifiedAt", latest_sheet_modified)
                 latest_sheet_modified = max(latest_sheet_modified, row_modified)
-
-                log.debug(f"Upserting row for sheet '{sheet_name}', row {row['id']}")
-                # The 'upsert' operation is used to insert or update data in the destination table.
-                # The first argument is the name of the destination table.
-                # The second argument is a dictionary containing the record to be upserted.
-                op.upsert(table_name, row_record)
+                records.append(row_record)
             except Exception as e:
                 log.warning(
                     f"Error processing row {row.get('id', 'unknown')} in sheet '{sheet_name}': {str(e)}"
                 )
                 continue
 
-        current_row_id_list = list(current_row_ids)
-        log.info(
-            f"Sheet '{sheet_name}': Updating state - last_modified={latest_sheet_modified}, row_count={len(current_row_id_list)}"
+        return FetchedResource(
+            resource_type="sheet",
+            resource_id=sheet_id,
+            name=sheet_name,
+            table_name=table_name,
+            records=records,
+            current_row_ids=current_row_ids,
+            previous_row_ids=previous_row_ids,
+            last_modified=latest_sheet_modified,
+            modified_at=sheet_modified_at,
         )
-        state_manager.update_sheet_state(sheet_id, latest_sheet_modified, current_row_id_list)
-
-        # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
-        # from the correct position in case of next sync or interruptions.
-        # Learn more about how and where to checkpoint by reading our best practices documentation
-        # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
-        op.checkpoint(state_manager.get_state())
 
     except requests.exceptions.RequestException as e:
         log.warning(f"Error processing sheet {sheet_name} ({sheet_id}): {str(e)}")
+        return None
 
 
-def _process_report(
+def _fetch_report(
     report: Dict[str, Any],
     reports_config: Dict[str, str],
     api: SmartsheetAPI,
     state_manager: StateManager,
-):
+) -> Optional[FetchedResource]:
     """
-    Process a single report: fetch data, detect deletions, upsert rows, and checkpoint state.
+    Fetch the rows of a single report and build their records. Runs in a worker thread.
 
     Args:
         report: Report metadata from the Smartsheet API
         reports_config: Mapping of report IDs to configured display names
         api: SmartsheetAPI client instance
         state_manager: StateManager for tracking sync state
+
+    Returns:
+        Optional[FetchedResource]: The parsed report, or None if the report could not be fetched
     """
     report_id = str(report["id"])
     report_name = report["name"]
@@ -835,13 +1082,10 @@ def _process_report(
         log.info(f"Report '{report_name}': Found {len(report_data.get('rows', []))} total rows")
 
         report_rows = report_data.get("rows", [])
-        current_row_ids = {str(row["id"]) for row in report_rows}
+        current_row_ids = {int(row["id"]) for row in report_rows}
         report_state = state_manager.get_report_state(report_id)
-        previous_row_ids = set(report_state.get("row_ids", []))
-
-        _delete_removed_rows(
-            table_name, previous_row_ids, current_row_ids, f"Report '{report_name}'"
-        )
+        previous_row_ids = state_manager.get_row_ids(report_state)
+        records = []
 
         for row in report_rows:
             row_data = {
@@ -860,21 +1104,103 @@ def _process_report(
 
             row_record = flatten(row_data)
             row_record["id"] = hash_value(str(row["id"]))
+            records.append(row_record)
+
+        return FetchedResource(
+            resource_type="report",
+            resource_id=report_id,
+            name=report_name,
+            table_name=table_name,
+            records=records,
+            current_row_ids=current_row_ids,
+            previous_row_ids=previous_row_ids,
+        )
 
-            log.debug(f"Upserting row for report '{report_name}', row {row['id']}")
-            op.upsert(table_name, row_record)
+    except requests.exceptions.RequestException as e:
+        log.warning(f"Error processing report {report_name} ({report_id}): {str(e)}")
+        return None
 
-        current_row_id_list = list(current_row_ids)
-        state_manager.update_report_state(report_id, current_row_id_list)
 
-        # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
-        # from the correct position in case of next sync or interruptions.
-        # Learn more about how and where to checkpoint by reading our best practices documentation
-        # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
-        op.checkpoint(state_manager.get_state())
+def _emit_resource(resource: FetchedResource, state_manager: StateManager):
+    """
+    Emit a fetched sheet or report: delete removed rows, upsert rows, update and checkpoint state.
+    Always called on the main thread, one resource at a time.
 
-    except requests.exceptions.RequestException as e:
-        log.warning(f"Error processing report {report_name} ({report_id}): {str(e)}")
+    Args:
+        resource: Sheet or report fetched by _fetch_sheet or _fetch_report
+        state_manager: StateManager for tracking sync state
+    """
+    label = f"{resource.resource_type.title()} '{resource.name}'"
+
+    _delete_removed_rows(
+        resource.table_name, resource.previous_row_ids, resource.current_row_ids, label
+    )
+
+    for row_record in resource.records:
+        log.debug(f"Upserting row for {label}, row {row_record['row_id']}")
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The first argument is the name of the destination table.
+        # The second argument is a dictionary containing the record to be upserted.
+        op.upsert(resource.table_name, row_record)
+
+    if resource.resource_type == "sheet":
+        log.info(
+            f"{label}: Updating state - last_modified={resource.last_modified}, row_count={len(resource.current_row_ids)}"
+        )
+        state_manager.update_sheet_state(
+            resource.resource_id,
+            resource.last_modified,
+            resource.current_row_ids,
+            resource.modified_at,
+        )
+    else:
+        state_manager.update_report_state(resource.resource_id, resource.current_row_ids)
+
+    # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
+    # from the correct position in case of next sync or interruptions.
+    # Learn more about how and where to checkpoint by reading our best practices documentation
+    # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
+    op.checkpoint(state_manager.get_state())
+
+
+def _sync_resources(
+    fetch_tasks: List[Callable[[], Any]], max_workers: int, state_manager: StateManager
+):
+    """
+    Run fetch tasks in a bounded pool of worker threads and emit their results on the calling thread.
+
+    At most max_workers * _IN_FLIGHT_PER_WORKER tasks are submitted at a time, so only a
+    bounded number of parsed sheets are held in memory. Results are emitted in the order of
+    the tasks, and each emitted resource is checkpointed before the next one, so the
+    checkpointed state never refers to a resource whose rows have not been emitted.
+
+    Args:
+        fetch_tasks: Functions without arguments that return a FetchedResource or None
+        max_workers: Number of worker threads
+        state_manager: StateManager for tracking sync state
+    """
+    max_in_flight = max(1, max_workers) * _IN_FLIGHT_PER_WORKER
+    tasks = iter(fetch_tasks)
+    in_flight = deque()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        try:
+            for task in tasks:
+                in_flight.append(executor.submit(task))
+                if len(in_flight) >= max_in_flight:
+                    break
+
+            while in_flight:
+                resource = in_flight.popleft().result()
+                next_task = next(tasks, None)
+                if next_task is not None:
+                    in_flight.append(executor.submit(next_task))
+                if resource is not None:
+                    _emit_resource(resource, state_manager)
+        finally:
+            # Do not start the remaining fetches if emitting failed
+            for future in in_flight:
+                future.cancel()
 
 
 def update(configuration: dict, state: dict):
@@ -903,6 +1229,7 @@ def update(configuration: dict, state: dict):
     requests_per_minute = int(
         configuration.get("requests_per_minute", str(_DEFAULT_REQUESTS_PER_MINUTE))
     )
+    max_workers = int(configuration.get("max_workers", str(_DEFAULT_MAX_WORKERS)))
 
     # Initialize configuration
     config = SmartsheetConfig(
@@ -910,6 +1237,7 @@ def update(configuration: dict, state: dict):
         sheet_ids=list(sheets_config.keys()) if sheets_config else None,
         report_ids=list(reports_config.keys()) if reports_config else None,
         requests_per_minute=requests_per_minute,
+        max_workers=max_workers,
     )
 
     # Initialize components
@@ -918,15 +1246,17 @@ def update(configuration: dict, state: dict):
     state_manager = StateManager(state)
 
     try:
-        # Process sheets
+        # Fetch and parse sheets and reports in worker threads, and emit them from this thread
         sheets = api.get_sheets()
-        for sheet in sheets:
-            _process_sheet(sheet, sheets_config, api, data_handler, state_manager)
-
-        # Process reports
         reports = api.get_reports()
-        for report in reports:
-            _process_report(report, reports_config, api, state_manager)
+        fetch_tasks = [
+            partial(_fetch_sheet, sheet, sheets_config, api, data_handler, state_manager)
+            for sheet in sheets
+        ] + [
+            partial(_fetch_report, report, reports_config, api, state_manager)
+            for report in reports
+        ]
+        _sync_resources(fetch_tasks, config.max_workers, state_manager)
 
         # Final checkpoint
         current_sync_time = datetime.now(timezone.utc).isoformat()
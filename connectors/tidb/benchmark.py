@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+TiDB Embedding Decoding Benchmark
+Measures how many embeddings per second the connector decodes from the text format in which TiDB returns
+VECTOR columns, for example '[0.12573022,-0.13210486,...]'.
+
+Each decoder is measured on its own and together with json.dumps, which is how op.upsert serializes the
+decoded list for the JSON column of a vector table. No TiDB cluster or Fivetran environment is required.
+The batch decoders below, which decode a whole page at once, are included as references and are not used by
+the connector. The NumPy decoder, which parses a page into a contiguous float32 array, is only run if NumPy
+is installed. Measured results are listed in the README.
+
+Usage:
+    python benchmark.py --embeddings 20000 --dimensions 1536 --page-size 50
+"""
+
+# For parsing command line arguments
+import argparse
+
+# For serializing the decoded embeddings like op.upsert does
+import json
+
+# For generating the embeddings
+import random
+
+# For measuring the elapsed time
+import time
+
+# The connector module under benchmark
+import connector
+
+# The fivetran debug harness normally sets the log level, which the decoders need for their log messages
+from fivetran_connector_sdk import Logging
+
+try:
+    # For the float32 reference decoder
+    import numpy
+except ImportError:
+    numpy = None
+
+if Logging.LOG_LEVEL is None:
+    Logging.LOG_LEVEL = Logging.Level.WARNING
+
+
+def generate_embeddings(count: int, dimensions: int) -> list:
+    """
+    Generate embedding strings in the text format of TiDB VECTOR columns.
+    Args:
+        count: Number of embeddings
+        dimensions: Number of elements per embedding
+    Returns:
+        list: Embedding strings
+    """
+    generator = random.Random(0)
+    return [
+        "[" + ",".join(f"{generator.gauss(0, 1):.8g}" for _ in range(dimensions)) + "]"
+        for _ in range(count)
+    ]
+
+
+def decode_per_row(page: list) -> list:
+    return [connector.parse_embedding_string_to_list(value) for value in page]
+
+
+def decode_page_json(page: list) -> list:
+    # Join the page into a single JSON document and decode it with one json.loads call
+    return json.loads("[" + ",".join(page) + "]", parse_int=float)
+
+
+def decode_numpy_float32(page: list) -> list:
+    # Parse the whole page into one contiguous float32 array, then slice it per row
+    buffer = numpy.fromstring(
+        ",".join(value[1:-1] for value in page), dtype=numpy.float32, sep=","
+    )
+    dimensions = len(buffer) // len(page)
+    return [
+        buffer[index * dimensions : (index + 1) * dimensions].tolist()
+        for index in range(len(page))
+    ]
+
+
+def run_benchmark(name: str, decoder, pages: list, serialize: bool) -> float:
+    """
+    Decode all pages with a decoder and print its throughput.
+    Args:
+        name: Label printed in the results
+        decoder: Function decoding a page of embedding strings into lists of floats
+        pages: Pages of embedding strings
+        serialize: Whether to serialize each decoded embedding with json.dumps, as op.upsert does
+    Returns:
+        float: Embeddings per second
+    """
+    count = 0
+    start_time = time.perf_counter()
+    for page in pages:
+        for embedding in decoder(page):
+            if serialize:
+                json.dumps(embedding)
+            count += 1
+    elapsed = time.perf_counter() - start_time
+    embeddings_per_second = count / elapsed if elapsed else 0
+    print(f"{name:<45} {count:>9,} embeddings {elapsed:>8.2f}s {embeddings_per_second:>10,.0f}/s")
+    return embeddings_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the TiDB embedding decoders")
+    parser.add_argument("--embeddings", type=int, default=20_000, help="Number of embeddings")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Elements per embedding")
+    parser.add_argument("--page-size", type=int, default=50, help="Rows per query page")
+    arguments = parser.parse_args()
+
+    print(
+        f"Generating {arguments.embeddings:,} embeddings of {arguments.dimensions} dimensions..."
+    )
+    embeddings = generate_embeddings(arguments.embeddings, arguments.dimensions)
+    pages = [
+        embeddings[index : index + arguments.page_size]
+        for index in range(0, len(embeddings), arguments.page_size)
+    ]
+
+    decoders = [
+        ("per row (parse_embedding_string_to_list)", decode_per_row),
+        ("batch (decode_page_json)", decode_page_json),
+    ]
+    if numpy is not None:
+        decoders.append(("numpy float32 buffer (reference)", decode_numpy_float32))
+
+    for serialize in (False, True):
+        print("Decode and json.dumps:" if serialize else "Decode only:")
+        for name, decoder in decoders:
+            run_benchmark(name, decoder, pages, serialize)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,10 @@ from fivetran_connector_sdk import Logging as log
 from fivetran_connector_sdk import Operations as op
 
 # For type hints
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# For the prepared per-table sync plans
+from dataclasses import dataclass
 
 # For reading configuration from a JSON file
 import json
@@ -38,6 +41,27 @@ __REQUIRED_CONFIG_KEYS = __TIDB_CONNECTION_KEYS + ["TABLES_PRIMARY_KEY_COLUMNS"]
 __FALLBACK_TIMESTAMP = datetime(1990, 1, 1, tzinfo=timezone.utc)
 __BATCH_SIZE = 50
 __MAX_RETRIES = 3
+__CURSOR_COLUMN = "created_at"
+
+
+@dataclass
+class TablePlan:
+    """
+    Sync plan of a table, prepared once per sync from the configuration.
+
+    Attributes:
+        table_name: Name of the table
+        primary_key_column: Primary key column, used as the tie-breaker of the keyset cursor
+        vector_column: Column holding embeddings for vector tables, None for regular tables
+        initial_query: Query of the first page when only a created_at cursor is known
+        keyset_query: Query of the pages after a (created_at, primary key) cursor
+    """
+
+    table_name: str
+    primary_key_column: str
+    vector_column: Optional[str] = None
+    initial_query: str = ""
+    keyset_query: str = ""
 
 
 def validate_configuration(configuration: Dict[str, Any]):
@@ -109,7 +133,7 @@ def build_vector_schema_entry(
     vector_col = table_data.get("vector_column")
 
     if not pk or not vector_col:
-        log.info("Skipping vector table '%s' due to missing keys", table_name)
+        log.info(f"Skipping vector table '{table_name}' due to missing keys")
         return None
 
     return {"table": table_name, "primary_key": [pk], "columns": {vector_col: "JSON"}}
@@ -163,7 +187,7 @@ def parse_embedding_string_to_list(s: Optional[str]) -> Optional[List[float]]:
         if isinstance(parsed, list):
             return [float(x) for x in parsed]
     except Exception as e:
-        log.info("Failed to parse embedding string as JSON: '%s' (error: %s)", s, e)
+        log.info(f"Failed to parse embedding string as JSON: '{s}' (error: {e})")
 
     # Fallback parse for bracketed CSV format
     try:
@@ -182,7 +206,7 @@ def parse_embedding_string_to_list(s: Optional[str]) -> Optional[List[float]]:
             try:
                 out.append(float(p))
             except Exception:
-                log.info("Failed to parse embedding element '%s' in '%s'", p, s)
+                log.info(f"Failed to parse embedding element '{p}' in '{s}'")
                 return None
         return out
     except Exception:
@@ -208,7 +232,7 @@ def parse_state_timestamp(timestamp_str: Optional[str]) -> datetime:
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed
     except Exception:
-        log.info("Failed to parse state timestamp '%s', using fallback.", timestamp_str)
+        log.info(f"Failed to parse state timestamp '{timestamp_str}', using fallback.")
         return __FALLBACK_TIMESTAMP
 
 
@@ -236,61 +260,59 @@ def normalize_timestamp_field(row_data: Dict[str, Any], field_name: str, table_n
                     parsed = parsed.replace(tzinfo=timezone.utc)
                 row_data[field_name] = parsed
             except Exception:
-                log.debug("Could not parse %s value for table %s: %s", field_name, table_name, val)
+                log.debug(f"Could not parse {field_name} value for table {table_name}: {val}")
 
 
-def parse_vector_column(row_data: Dict[str, Any], table_name: str, configuration: Dict[str, Any]):
+def parse_vector_column(row_data: Dict[str, Any], vector_column: str):
     """
     Parse vector embedding column to list format.
 
     Args:
         row_data: Dictionary containing row data
-        table_name: Name of the table
-        configuration: Dictionary containing connector configuration
+        vector_column: Name of the column holding the embedding
     """
-    if not configuration.get("VECTOR_TABLES_DATA"):
-        return
+    emb_list = parse_embedding_string_to_list(row_data.get(vector_column))
+    if emb_list is not None:
+        row_data[vector_column] = emb_list
 
-    try:
-        vector_tables = json.loads(configuration["VECTOR_TABLES_DATA"])
-        if table_name in vector_tables:
-            embedding_column = vector_tables[table_name]["vector_column"]
-            raw_embeddings = row_data.get(embedding_column)
-            emb_list = parse_embedding_string_to_list(raw_embeddings)
-            if emb_list is not None:
-                row_data[embedding_column] = emb_list
-    except Exception:
-        log.debug(
-            "Skipping vector parse for table %s due to malformed VECTOR_TABLES_DATA", table_name
-        )
 
-
-def process_row(
-    row_data: Dict[str, Any], table_name: str, configuration: Dict[str, Any], is_vector_table: bool
-) -> Dict[str, Any]:
+def process_row(row_data: Dict[str, Any], plan: TablePlan) -> Dict[str, Any]:
     """
     Normalize row values before upsert.
 
     Args:
         row_data: Dictionary containing row data
-        table_name: Name of the table
-        configuration: Dictionary containing connector configuration
-        is_vector_table: Whether this is a vector table
+        plan: Sync plan of the table
 
     Returns:
         Processed row data dictionary
     """
     # Normalize timestamp fields
-    normalize_timestamp_field(row_data, "created_at", table_name)
-    normalize_timestamp_field(row_data, "updated_at", table_name)
+    normalize_timestamp_field(row_data, "created_at", plan.table_name)
+    normalize_timestamp_field(row_data, "updated_at", plan.table_name)
 
     # Parse vector columns if applicable
-    if is_vector_table:
-        parse_vector_column(row_data, table_name, configuration)
+    if plan.vector_column:
+        parse_vector_column(row_data, plan.vector_column)
 
     return row_data
 
 
+def escape_identifier(identifier: str) -> str:
+    """
+    Escape a table or column name for SQL query to prevent injection.
+
+    Args:
+        identifier: Raw table or column name
+
+    Returns:
+        Escaped identifier wrapped in backticks
+    """
+    # Remove any existing backticks and wrap in backticks
+    clean_name = identifier.replace("`", "")
+    return f"`{clean_name}`"
+
+
 def escape_table_name(table_name: str) -> str:
     """
     Escape table name for SQL query to prevent injection.
@@ -301,18 +323,71 @@ def escape_table_name(table_name: str) -> str:
     Returns:
         Escaped table name wrapped in backticks
     """
-    # Remove any existing backticks and wrap in backticks
-    clean_name = table_name.replace("`", "")
-    return f"`{clean_name}`"
+    return escape_identifier(table_name)
 
 
-def build_incremental_query(table_name: str, last_created: str) -> str:
+def build_table_plan(
+    table_name: str, primary_key_column: str, vector_column: Optional[str] = None
+) -> TablePlan:
+    """
+    Build the sync plan of a table, including its paging queries.
+
+    Rows are read in (created_at, primary key) order and each page starts after the last row
+    of the previous page, so every page is an index range scan of the same cost instead of
+    skipping an ever-growing OFFSET. The keyset condition is written as a range on created_at
+    followed by the tie-breaker, so that an index on (created_at, primary key) or created_at can be used.
+
+    Args:
+        table_name: Name of the table
+        primary_key_column: Primary key column name
+        vector_column: Column holding embeddings, for vector tables
+
+    Returns:
+        TablePlan with the prepared queries
+    """
+    escaped_table = escape_table_name(table_name)
+    cursor_column = escape_identifier(__CURSOR_COLUMN)
+    primary_key = escape_identifier(primary_key_column)
+    order_by = f"ORDER BY {cursor_column}, {primary_key} LIMIT :limit"
+    initial_query = (
+        f"SELECT * FROM {escaped_table} WHERE {cursor_column} > :last_created {order_by}"
+    )
+    keyset_query = (
+        f"SELECT * FROM {escaped_table} WHERE {cursor_column} >= :last_created "
+        f"AND ({cursor_column} > :last_created OR {primary_key} > :last_primary_key) {order_by}"
+    )
+    return TablePlan(
+        table_name=table_name,
+        primary_key_column=primary_key_column,
+        vector_column=vector_column,
+        initial_query=initial_query,
+        keyset_query=keyset_query,
+    )
+
+
+def format_tidb_timestamp(timestamp: datetime) -> str:
+    """
+    Format a timezone-aware timestamp as a TiDB DATETIME literal in UTC.
+
+    Args:
+        timestamp: Timestamp to format
+
+    Returns:
+        Timestamp string such as '2024-01-01 12:00:00.000000'
+    """
+    return timestamp.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def build_incremental_query(
+    plan: TablePlan, last_created: datetime, last_primary_key: Any = None
+) -> Tuple[str, Dict[str, Any]]:
     """
     Build SQL query for incremental data fetch.
 
     Args:
-        table_name: Name of the table to query
-        last_created: Last processed timestamp in ISO format
+        plan: Sync plan of the table to query
+        last_created: created_at of the last processed row
+        last_primary_key: Primary key of the last processed row, or None if unknown
 
     Returns:
         Tuple of (SQL query string, parameters dictionary)
@@ -321,14 +396,13 @@ def build_incremental_query(table_name: str, last_created: str) -> str:
         ValueError: If query building fails
     """
     try:
-        # Convert ISO timestamp to TiDB format
-        tidb_timestamp = last_created.replace("T", " ").replace("Z", "")
-        escaped_table = escape_table_name(table_name)
-        query = f"SELECT * FROM {escaped_table} WHERE created_at > :last_created ORDER BY created_at LIMIT :limit OFFSET :offset"
-        params = {"last_created": tidb_timestamp}
-        return query, params
+        params = {"last_created": format_tidb_timestamp(last_created), "limit": __BATCH_SIZE}
+        if last_primary_key is None:
+            return plan.initial_query, params
+        params["last_primary_key"] = last_primary_key
+        return plan.keyset_query, params
     except Exception as e:
-        raise ValueError(f"Failed to build query for table {table_name}") from e
+        raise ValueError(f"Failed to build query for table {plan.table_name}") from e
 
 
 def execute_query_with_retry(cursor, query, params=None):
@@ -349,23 +423,19 @@ def execute_query_with_retry(cursor, query, params=None):
     for attempt in range(__MAX_RETRIES):
         try:
             query_result = cursor.query(query, params)
-            return query_result
+            # Handle different result types
+            if hasattr(query_result, "to_list"):
+                return query_result.to_list()
+            return list(query_result)
         except Exception as e:
             if attempt == __MAX_RETRIES - 1:
                 raise
             sleep_time = min(60, 2**attempt)
             log.warning(
-                f"Query failed, retry {attempt + 1}/{__MAX_RETRIES} after {sleep_time}s: %s",
-                str(e),
+                f"Query failed, retry {attempt + 1}/{__MAX_RETRIES} after {sleep_time}s: {str(e)}"
             )
             time.sleep(sleep_time)
 
-    # Handle different result types
-    if hasattr(query_result, "to_list"):
-        return query_result.to_list()
-    else:
-        return list(query_result)
-
 
 def extract_row_timestamp(created_val: datetime) -> Optional[datetime]:
     """
@@ -396,40 +466,31 @@ def extract_row_timestamp(created_val: datetime) -> Optional[datetime]:
 
 def process_and_upsert_rows(
     rows: List[Dict[str, Any]],
-    table_name: str,
+    plan: TablePlan,
     state: Dict[str, Any],
-    configuration: Dict[str, Any],
-    is_vector_table: bool,
-    last_created_timestamp: datetime,
-) -> datetime:
+) -> Tuple[Optional[datetime], Any]:
     """
-    Process and upsert rows, tracking the maximum timestamp.
+    Process and upsert a page of rows, and return the keyset cursor of the page.
 
     Args:
-        rows: List of row dictionaries to process
-        table_name: Name of the table
+        rows: List of row dictionaries to process, in (created_at, primary key) order
+        plan: Sync plan of the table
         state: State dictionary for checkpointing
-        configuration: Dictionary containing connector configuration
-        is_vector_table: Whether this is a vector table
-        last_created_timestamp: Current last processed timestamp
 
     Returns:
-        Maximum timestamp seen across all rows
+        Tuple of the created_at timestamp and primary key of the last row of the page
     """
-    max_seen_timestamp = last_created_timestamp
+    table_name = plan.table_name
 
     for row in rows:
         try:
-            row_data = process_row(row, table_name, configuration, is_vector_table)
+            row_data = process_row(row, plan)
 
             # The 'upsert' operation is used to insert or update data in the destination table.
             # The first argument is the name of the destination table.
             # The second argument is a dictionary containing the record to be upserted.
             op.upsert(table=table_name, data=row_data)
 
-            # Update max timestamp once upsert succeeded
-            max_seen_timestamp = row_data.get("created_at")
-
         except Exception as row_err:
             # Log row-level errors and continue processing other rows
             log.error(f"Error processing row for table {table_name}: {row_err}")
@@ -451,73 +512,82 @@ def process_and_upsert_rows(
                 # If storing the error metadata fails (e.g., due to serialization issues), ignore the error.
                 # This is non-critical and should not interrupt processing of other rows.
                 log.debug(
-                    "Ignoring error while storing sample row for table %s: %s",
-                    table_name,
-                    sample_row_err,
+                    f"Ignoring error while storing sample row for table {table_name}: {sample_row_err}"
                 )
 
-    return extract_row_timestamp(max_seen_timestamp)
+    # The next page starts after the last row of this page, whether or not its upsert succeeded
+    last_row = rows[-1]
+    return extract_row_timestamp(last_row.get(__CURSOR_COLUMN)), last_row.get(
+        plan.primary_key_column
+    )
 
 
-def update_state_timestamp(state: Dict[str, Any], table_name: str, timestamp: datetime):
+def update_state_cursor(
+    state: Dict[str, Any], table_name: str, timestamp: datetime, primary_key: Any
+):
     """
-    Update state with the last processed timestamp.
+    Update state with the keyset cursor of the last processed row.
 
     Args:
         state: State dictionary
         table_name: Name of the table
-        timestamp: Datetime to store in state
+        timestamp: created_at of the last processed row
+        primary_key: Primary key of the last processed row
     """
     try:
         state[f"{table_name}_last_created"] = timestamp.isoformat()
     except Exception:
         # Fallback to string representation if isoformat fails
         state[f"{table_name}_last_created"] = str(timestamp)
+    # Keep numeric and string keys as they are, so they compare the same way in the next query
+    if primary_key is not None and not isinstance(primary_key, (int, float, str)):
+        primary_key = str(primary_key)
+    state[f"{table_name}_last_primary_key"] = primary_key
 
 
-def fetch_and_upsert_data(
-    cursor: TiDBClient,
-    table_name: str,
-    state: Dict[str, Any],
-    configuration: Dict[str, Any],
-    is_vector_table: bool = False,
-):
+def fetch_and_upsert_data(cursor: TiDBClient, plan: TablePlan, state: Dict[str, Any]):
     """
     Fetch incremental data and upsert to destination.
 
     Args:
         cursor: TiDB client connection
-        table_name: Name of the table to sync
+        plan: Sync plan of the table to sync
         state: State dictionary for checkpointing
-        configuration: Dictionary containing connector configuration
-        is_vector_table: Whether this is a vector table
     """
-    # Retrieve last processed timestamp from state
-    last_created = state.get(f"{table_name}_last_created", "1990-01-01T00:00:00Z")
-    last_created_timestamp = parse_state_timestamp(last_created)
+    table_name = plan.table_name
+
+    # Retrieve the keyset cursor from state. States written before keyset pagination
+    # only hold the created_at timestamp, so their first page uses created_at alone.
+    last_created_timestamp = parse_state_timestamp(state.get(f"{table_name}_last_created"))
+    last_primary_key = state.get(f"{table_name}_last_primary_key")
 
-    # Build and execute query
-    try:
-        page = 0
-        query, params = build_incremental_query(table_name, last_created)
-    except Exception as e:
-        log.error(f"Failed to build query for table {table_name}: {e}")
-        return
     try:
         while True:
-            params["limit"] = __BATCH_SIZE
-            params["offset"] = __BATCH_SIZE * page
+            try:
+                query, params = build_incremental_query(
+                    plan, last_created_timestamp, last_primary_key
+                )
+            except Exception as e:
+                log.error(f"Failed to build query for table {table_name}: {e}")
+                return
             rows = execute_query_with_retry(cursor, query, params)
             if not rows:
                 break
-            # Process rows and track maximum timestamp
-            max_seen_timestamp = process_and_upsert_rows(
-                rows, table_name, state, configuration, is_vector_table, last_created_timestamp
-            )
-            # Persist updated timestamp to state
-            update_state_timestamp(state, table_name, max_seen_timestamp)
+            # Process rows and move the cursor to the last row of the page
+            last_created_timestamp, last_primary_key = process_and_upsert_rows(rows, plan, state)
+            if last_created_timestamp is None:
+                log.warning(f"Stopping sync of table {table_name}: row without {__CURSOR_COLUMN}")
+                break
+            # Persist updated cursor to state
+            update_state_cursor(state, table_name, last_created_timestamp, last_primary_key)
+            # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
+            # from the correct position in case of next sync or interruptions.
+            # Learn more about how and where to checkpoint by reading our best practices documentation
+            # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
             op.checkpoint(state)
-            page += 1
+            # A short page is the last one
+            if len(rows) < __BATCH_SIZE:
+                break
     except Exception as e:
         # Query execution failed, likely due to missing column
         log.error(f"Failed to execute query for table {table_name}. {e}")
@@ -565,104 +635,74 @@ def create_tidb_connection(configuration: Dict[str, Any]) -> TiDBClient:
         raise
 
 
-def get_tables_to_sync(configuration: Dict[str, Any]) -> List[str]:
+def get_table_plans(configuration: Dict[str, Any]) -> List[TablePlan]:
     """
-    Extract list of table names from configuration.
+    Build the sync plans of the regular tables from configuration.
 
     Args:
         configuration: Dictionary containing connector configuration
 
     Returns:
-        List of table names to sync
+        List of table plans to sync
     """
     try:
         tables_config = json.loads(configuration.get("TABLES_PRIMARY_KEY_COLUMNS", "{}"))
-        return list(tables_config.keys())
     except Exception:
         log.error("Failed to parse TABLES_PRIMARY_KEY_COLUMNS; nothing to do.")
         return []
+    return [
+        build_table_plan(table_name, primary_key_column)
+        for table_name, primary_key_column in tables_config.items()
+    ]
 
 
-def get_vector_tables_to_sync(configuration: Dict[str, Any]) -> List[str]:
+def get_vector_table_plans(configuration: Dict[str, Any]) -> List[TablePlan]:
     """
-    Extract list of vector table names from configuration.
+    Build the sync plans of the vector tables from configuration.
 
     Args:
         configuration: Dictionary containing connector configuration
 
     Returns:
-        List of vector table names to sync
+        List of vector table plans to sync
     """
     if not configuration.get("VECTOR_TABLES_DATA"):
         return []
 
     try:
         vector_tables_config = json.loads(configuration["VECTOR_TABLES_DATA"])
-        return list(vector_tables_config.keys())
     except Exception:
         log.info("Failed to parse VECTOR_TABLES_DATA; skipping vector table processing.")
         return []
 
-
-def sync_regular_tables(
-    connection: TiDBClient, tables: List[str], state: Dict[str, Any], configuration: Dict[str, Any]
-):
-    """
-    Synchronize all regular tables.
-
-    Args:
-        connection: TiDB client connection
-        tables: List of table names to sync
-        state: State dictionary for checkpointing
-        configuration: Dictionary containing connector configuration
-    """
-    for table_name in tables:
-        try:
-            fetch_and_upsert_data(
-                cursor=connection, table_name=table_name, state=state, configuration=configuration
-            )
-        except Exception as t_err:
-            # Log table-level errors but continue with other tables
-            log.error(f"Unhandled error processing table: {table_name}. {t_err}")
-            state[f"{table_name}_last_error"] = str(t_err)
-            try:
-                # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
-                # from the correct position in case of next sync or interruptions.
-                # Learn more about how and where to checkpoint by reading our best practices documentation
-                # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
-                op.checkpoint(state)
-            except Exception:
-                log.error(f"Failed to checkpoint state after table-level error for {table_name}")
+    plans = []
+    for table_name, table_data in vector_tables_config.items():
+        primary_key_column = table_data.get("primary_key_column")
+        vector_column = table_data.get("vector_column")
+        if not primary_key_column or not vector_column:
+            log.info(f"Skipping vector table '{table_name}' due to missing keys")
+            continue
+        plans.append(build_table_plan(table_name, primary_key_column, vector_column))
+    return plans
 
 
-def sync_vector_tables(
-    connection: TiDBClient,
-    vector_tables: List[str],
-    state: Dict[str, Any],
-    configuration: Dict[str, Any],
-):
+def sync_tables(connection: TiDBClient, plans: List[TablePlan], state: Dict[str, Any]):
     """
-    Synchronize all vector tables.
+    Synchronize all tables of the given plans.
 
     Args:
         connection: TiDB client connection
-        vector_tables: List of vector table names to sync
+        plans: Sync plans of the tables to sync
         state: State dictionary for checkpointing
-        configuration: Dictionary containing connector configuration
     """
-    for table_name in vector_tables:
+    for plan in plans:
+        table_type = "vector table" if plan.vector_column else "table"
         try:
-            fetch_and_upsert_data(
-                cursor=connection,
-                table_name=table_name,
-                state=state,
-                configuration=configuration,
-                is_vector_table=True,
-            )
+            fetch_and_upsert_data(cursor=connection, plan=plan, state=state)
         except Exception as t_err:
-            # Log vector table errors but continue with other tables
-            log.error(f"Unhandled error processing vector table {table_name}: {t_err}")
-            state[f"{table_name}_last_error"] = str(t_err)
+            # Log table-level errors but continue with other tables
+            log.error(f"Unhandled error processing {table_type}: {plan.table_name}. {t_err}")
+            state[f"{plan.table_name}_last_error"] = str(t_err)
             try:
                 # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
                 # from the correct position in case of next sync or interruptions.
@@ -670,7 +710,9 @@ def sync_vector_tables(
                 # (https://fivetran.com/docs/connectors/connector-sdk/best-practices#largedatasetrecommendation).
                 op.checkpoint(state)
             except Exception:
-                log.error(f"Failed to checkpoint state after vector-table error for {table_name}")
+                log.error(
+                    f"Failed to checkpoint state after {table_type} error for {plan.table_name}"
+                )
 
 
 def close_connection(connection: TiDBClient):
@@ -717,15 +759,15 @@ def update(configuration: Dict[str, Any], state: Dict[str, Any]):
             log.error("Failed to checkpoint state after connection error.")
         raise
 
-    # Get tables to sync
-    tables = get_tables_to_sync(configuration)
-    vector_tables = get_vector_tables_to_sync(configuration)
+    # Parse the configuration once into per-table sync plans
+    table_plans = get_table_plans(configuration)
+    vector_table_plans = get_vector_table_plans(configuration)
 
     # Synchronize regular tables
-    sync_regular_tables(connection, tables, state, configuration)
+    sync_tables(connection, table_plans, state)
 
     # Synchronize vector tables
-    sync_vector_tables(connection, vector_tables, state, configuration)
+    sync_tables(connection, vector_table_plans, state)
 
     # Clean up connection
     close_connection(connection)
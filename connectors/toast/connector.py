@@ -13,6 +13,13 @@ import time
 import json
 import copy
 import hashlib
+import threading
+import array
+import base64
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 from cryptography.fernet import Fernet
 
 # Import required classes from fivetran_connector_sdk.
@@ -25,6 +32,258 @@ from fivetran_connector_sdk import Logging as log
 # For supporting Data operations like Upsert(), Update(), Delete() and checkpoint()
 from fivetran_connector_sdk import Operations as op
 
+# Number of restaurants synced concurrently, unless overridden by max_workers in the configuration
+__DEFAULT_MAX_WORKERS = 4
+# Toast allows 20 requests per second for each API client, across all restaurants
+__DEFAULT_REQUESTS_PER_SECOND = 20
+
+# config endpoint is a list of tuples ("endpoint", "destination_table_name")
+CONFIG_ENDPOINTS = [
+    ("/config/v2/alternatePaymentTypes", "alternate_payment_types"),
+    ("/config/v2/diningOptions", "dining_option"),
+    ("/config/v2/discounts", "discounts"),
+    ("/config/v2/menus", "menu"),
+    ("/config/v2/menuGroups", "menu_group"),
+    ("/config/v2/menuItems", "menu_item"),
+    ("/config/v2/restaurantServices", "restaurant_service"),
+    ("/config/v2/revenueCenters", "revenue_center"),
+    ("/config/v2/salesCategories", "sale_category"),
+    ("/config/v2/serviceAreas", "service_area"),
+    ("/config/v2/tables", "tables"),
+]
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all worker threads, so that concurrent restaurants stay within the
+    API client rate limit together. A 429 response pauses every thread, not only the one that received it.
+    """
+
+    def __init__(self, requests_per_second):
+        self._lock = threading.Lock()
+        self.set_rate(requests_per_second)
+
+    def set_rate(self, requests_per_second):
+        """
+        Reset the bucket to a new rate, with a burst of at most one second of requests
+        :param requests_per_second: number of requests allowed per second
+        """
+        with self._lock:
+            self._rate = float(requests_per_second)
+            self._capacity = float(requests_per_second)
+            self._tokens = self._capacity
+            self._updated_at = time.monotonic()
+            self._paused_until = 0.0
+
+    def acquire(self):
+        """
+        Block until a request may be sent
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait_time = self._paused_until - now
+                else:
+                    self._tokens = min(
+                        self._capacity, self._tokens + (now - self._updated_at) * self._rate
+                    )
+                    self._updated_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait_time = (1 - self._tokens) / self._rate
+            time.sleep(wait_time)
+
+    def pause(self, seconds):
+        """
+        Hold back all requests for the given number of seconds, e.g. after a 429 response
+        :param seconds: number of seconds to wait before sending the next request
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class EndpointStats:
+    """
+    Thread-safe per-endpoint counters of calls, records and request latency,
+    logged at the end of the sync to show which endpoints dominate the sync time
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def record(self, endpoint, elapsed, record_count):
+        """
+        Add one request to the counters of an endpoint
+        :param endpoint: endpoint path, without the domain or query string
+        :param elapsed: request latency in seconds
+        :param record_count: number of records in the response
+        """
+        with self._lock:
+            stats = self._stats.setdefault(
+                endpoint, {"calls": 0, "records": 0, "seconds": 0.0, "max_seconds": 0.0}
+            )
+            stats["calls"] += 1
+            stats["records"] += record_count
+            stats["seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def log_summary(self):
+        """
+        Log the counters of every endpoint, slowest endpoint first
+        """
+        with self._lock:
+            summary = sorted(
+                self._stats.items(), key=lambda item: item[1]["seconds"], reverse=True
+            )
+        for endpoint, stats in summary:
+            log.info(
+                f"{endpoint}: {stats['calls']} calls, {stats['records']} records, "
+                f"{stats['seconds']:.1f}s total, "
+                f"{1000 * stats['seconds'] / stats['calls']:.0f}ms avg, "
+                f"{1000 * stats['max_seconds']:.0f}ms max"
+            )
+
+
+class ConfigCache:
+    """
+    Content-addressed cache of config endpoint responses, keyed by restaurant and config table.
+    Each entry is a 64-bit digest of the records last upserted for that restaurant and table.
+    When a response has the same digest as the previous sync, its records are already in the destination
+    and the upserts are skipped. The digests are persisted in the state as one packed array, with one
+    slot per config table for each restaurant, so the state grows by 8 bytes per restaurant and table.
+    """
+
+    # Version of the encoded format stored in the connector state
+    FORMAT_VERSION = 1
+
+    # Digest slot of a restaurant and table that has no cached response
+    EMPTY_DIGEST = 0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._previous = {}
+        self._current = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, state):
+        """
+        Load the digests of the previous sync from the state
+        A cache written for a different list of config tables is discarded,
+        which makes this sync upsert every config record.
+        :param state: a dictionary that holds the state of the connector
+        """
+        table_names = [table_name for _, table_name in CONFIG_ENDPOINTS]
+        with self._lock:
+            self._previous = {}
+            self._current = {}
+            self.hits = 0
+            self.misses = 0
+            encoded = state.get("config_digests")
+            if not encoded:
+                return
+            if encoded.get("version") != self.FORMAT_VERSION:
+                log.info(f"ignoring config digests with unknown version {encoded.get('version')}")
+                return
+            if encoded.get("tables") != table_names:
+                log.info("config digests were written for other config tables, ignoring them")
+                return
+
+            restaurant_ids = json.loads(zlib.decompress(base64.b64decode(encoded["restaurants"])))
+            digests = array.array("Q")
+            digests.frombytes(base64.b64decode(encoded["digests"]))
+            if sys.byteorder != "little":
+                digests.byteswap()
+            if len(digests) != len(restaurant_ids) * len(table_names):
+                log.warning("config digests do not match the restaurant list, ignoring them")
+                return
+
+            for index, restaurant_id in enumerate(restaurant_ids):
+                offset = index * len(table_names)
+                for table_index, table_name in enumerate(table_names):
+                    digest = digests[offset + table_index]
+                    if digest != self.EMPTY_DIGEST:
+                        self._previous[(restaurant_id, table_name)] = digest
+            # carry the previous digests over, in case a restaurant is not synced this time
+            self._current = dict(self._previous)
+
+    def encode(self):
+        """
+        Encode the digests for the state
+        :return: dictionary holding the config table names, the compressed restaurant ids and the packed digests
+        """
+        table_names = [table_name for _, table_name in CONFIG_ENDPOINTS]
+        with self._lock:
+            restaurant_ids = sorted({restaurant_id for restaurant_id, _ in self._current})
+            digests = array.array(
+                "Q",
+                (
+                    self._current.get((restaurant_id, table_name), self.EMPTY_DIGEST)
+                    for restaurant_id in restaurant_ids
+                    for table_name in table_names
+                ),
+            )
+        if sys.byteorder != "little":
+            digests.byteswap()
+        restaurants = json.dumps(restaurant_ids, separators=(",", ":")).encode("utf-8")
+        return {
+            "version": self.FORMAT_VERSION,
+            "tables": table_names,
+            "restaurants": base64.b64encode(zlib.compress(restaurants)).decode("ascii"),
+            "digests": base64.b64encode(digests.tobytes()).decode("ascii"),
+        }
+
+    @staticmethod
+    def compute_digest(records):
+        """
+        Computes a 64-bit digest of a list of records that does not depend on the order of the records
+        :param records: records as they would be upserted
+        :return: the digest as an unsigned 64-bit integer
+        """
+        record_digests = sorted(
+            hashlib.blake2b(
+                json.dumps(record, sort_keys=True, default=str).encode("utf-8"), digest_size=8
+            ).digest()
+            for record in records
+        )
+        digest = int.from_bytes(
+            hashlib.blake2b(b"".join(record_digests), digest_size=8).digest(), "big"
+        )
+        # keep the empty slot marker free
+        return digest or 1
+
+    def is_unchanged(self, rst_id, table_name, digest):
+        """
+        Checks whether a response matches the one upserted by the previous sync, and records its digest
+        :param rst_id: id of the restaurant
+        :param table_name: config table of the response
+        :param digest: digest of the response records
+        :return: True if the records are already in the destination
+        """
+        key = (rst_id, table_name)
+        with self._lock:
+            unchanged = self._previous.get(key) == digest
+            if unchanged:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._current[key] = digest
+        return unchanged
+
+
+# Shared by all worker threads of a sync
+rate_limiter = RateLimiter(__DEFAULT_REQUESTS_PER_SECOND)
+endpoint_stats = EndpointStats()
+config_cache = ConfigCache()
+
 
 def update(configuration: dict, state: dict):
     """
@@ -40,6 +299,10 @@ def update(configuration: dict, state: dict):
         domain = configuration["domain"]
         base_url = f"https://{domain}"
         key = configuration["key"]
+        max_workers = get_positive_int(configuration, "max_workers", __DEFAULT_MAX_WORKERS)
+        rate_limiter.set_rate(
+            get_positive_int(configuration, "requests_per_second", __DEFAULT_REQUESTS_PER_SECOND)
+        )
         headers, state = make_headers(configuration, base_url, state, key)
 
         start_timestamp = (
@@ -48,7 +311,16 @@ def update(configuration: dict, state: dict):
         from_ts, to_ts = set_timeranges(state, configuration, start_timestamp)
 
         # start the sync
-        sync_items(base_url, headers, from_ts, to_ts, start_timestamp, state)
+        endpoint_stats.reset()
+        config_cache.load(state)
+        try:
+            sync_items(base_url, headers, from_ts, to_ts, start_timestamp, state, max_workers)
+        finally:
+            endpoint_stats.log_summary()
+            log.info(
+                f"config cache: {config_cache.hits} unchanged responses skipped, "
+                f"{config_cache.misses} responses upserted"
+            )
 
     except Exception as e:
         # Return error response
@@ -58,42 +330,48 @@ def update(configuration: dict, state: dict):
         raise RuntimeError(detailed_message)
 
 
-def sync_items(base_url, headers, ts_from, ts_to, start_timestamp, state):
+def get_positive_int(configuration, name, default):
+    """
+    Reads an optional positive integer from the configuration
+    :param configuration: a dictionary that holds the configuration settings for the connector
+    :param name: name of the configuration parameter
+    :param default: value to use when the parameter is not set
+    :return: the parameter value as an integer
+    """
+    value = configuration.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a positive integer, got {value!r}")
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer, got {value}")
+    return value
+
+
+def sync_items(base_url, headers, ts_from, ts_to, start_timestamp, state, max_workers=1):
     """
     This is the main generator function for the connector.
-    It calls other functions that are specific to the endpoint type.
+    Restaurants are synced concurrently by a bounded pool of worker threads, one time range at a time.
+    The state is only checkpointed once every restaurant has finished the current time range.
     :param base_url: Toast API URL
     :param headers: authentication headers
     :param ts_from: Timestamp to start the current iteration
     :param ts_to: Timestamp to end the current iteration
     :param start_timestamp: timestamp that the sync was started
+    :param state: a dictionary that holds the state of the connector
+    :param max_workers: number of restaurants to sync concurrently
     :return:
     """
     more_data = True
     first_pass = True  # indicates whether to call endpoints that don't have an end timestamp
 
-    # config endpoint is a list of tuples ("endpoint", "destination_table_name")
-    config_endpoints = [
-        ("/config/v2/alternatePaymentTypes", "alternate_payment_types"),
-        ("/config/v2/diningOptions", "dining_option"),
-        ("/config/v2/discounts", "discounts"),
-        ("/config/v2/menus", "menu"),
-        ("/config/v2/menuGroups", "menu_group"),
-        ("/config/v2/menuItems", "menu_item"),
-        ("/config/v2/restaurantServices", "restaurant_service"),
-        ("/config/v2/revenueCenters", "revenue_center"),
-        ("/config/v2/salesCategories", "sale_category"),
-        ("/config/v2/serviceAreas", "service_area"),
-        ("/config/v2/tables", "tables"),
-    ]
-
     while more_data:
         # set timerange dicts
         timerange_params = {"startDate": ts_from, "endDate": ts_to}
         modified_params = {"modifiedStartDate": ts_from, "modifiedEndDate": ts_to}
         config_params = {"lastModified": ts_from}
-        state["to_ts"] = ts_to
-        log.debug(f"state updated, new state: {repr(state)}")
 
         # Get response from API call.
         response_page, next_token = get_api_response(
@@ -104,66 +382,42 @@ def sync_items(base_url, headers, ts_from, ts_to, start_timestamp, state):
         if not response_page:
             break  # End pagination if there are no records in response.
 
-        # Iterate over each user in the 'items' list and perform an upsert operation.
-        # The 'upsert' operation inserts the data into the destination.
         restaurant_count = len(response_page)
         log.info(f"***** timerange is from {ts_from} to {ts_to} ***** ")
-        for index, r in enumerate(response_page):
-            id = r["restaurantGuid"]
-            # rename some fields in response
-            rename_fields = [("restaurantGuid", "id"), ("restaurantName", "name")]
-            for old_name, new_name in rename_fields:
-                r[new_name] = r.pop(old_name)
-            log.info(f"***** starting restaurant {id}, {index + 1} of {restaurant_count} ***** ")
-            op.upsert(table="restaurant", data=r)
-
-            if r.get("deleted") and "id" in r:
-                op.delete(table="restaurant", keys={"id": r["id"]})
-
-            # config endpoints
-            # only process these on the first pass since they don't have an end timestamp
-            if first_pass:
-                for endpoint, table_name in config_endpoints:
-                    process_config(base_url, headers, endpoint, table_name, id, config_params)
-
-                # no timerange_params, only sync during first pass
-                for endpoint, table_name in [
-                    ("/labor/v1/jobs", "job"),
-                    ("/labor/v1/employees", "employee"),
-                ]:
-                    process_labor(base_url, headers, endpoint, table_name, id)
-
-            # cash management endpoints
-            process_cash(
-                base_url, headers, "/cashmgmt/v1/entries", "cash_entry", id, timerange_params
-            )
-            process_cash(
-                base_url, headers, "/cashmgmt/v1/deposits", "cash_deposit", id, timerange_params
-            )
-
-            # orders
-            process_orders(
-                base_url, headers, "/orders/v2/ordersBulk", "orders", id, timerange_params
-            )
-
-            # labor endpoints
-            # these two endpoints can only retrieve 30 days at a time
-            process_labor(
-                base_url, headers, "/labor/v1/shifts", "shift", id, params=timerange_params
-            )
-            process_labor(
-                base_url,
-                headers,
-                "/labor/v1/timeEntries",
-                "time_entry",
-                id,
-                params=modified_params,
-            )
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, restaurant_count))
+        try:
+            futures = [
+                executor.submit(
+                    sync_restaurant,
+                    base_url,
+                    # each worker sets its own Toast-Restaurant-External-ID header
+                    dict(headers),
+                    r,
+                    f"{index + 1} of {restaurant_count}",
+                    first_pass,
+                    timerange_params,
+                    modified_params,
+                    config_params,
+                )
+                for index, r in enumerate(response_page)
+            ]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # stop the restaurants that have not started yet, the window is retried on the next sync
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
 
         # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
         # from the correct position in case of interruptions.
         # checkpointing every 30 days for convenience,
         # since we can only ask for 30 days of shifts and time entries at a time
+        # The window end is only saved here, after every restaurant has finished the window.
+        state["to_ts"] = ts_to
+        if first_pass:
+            state["config_digests"] = config_cache.encode()
+        log.debug(f"state updated, new state: {repr(state)}")
         op.checkpoint(state)
         first_pass = False
 
@@ -175,9 +429,80 @@ def sync_items(base_url, headers, ts_from, ts_to, start_timestamp, state):
             more_data = False
 
 
+def sync_restaurant(
+    base_url,
+    headers,
+    r,
+    progress,
+    first_pass,
+    timerange_params,
+    modified_params,
+    config_params,
+):
+    """
+    Syncs every endpoint of a single restaurant for the current time range.
+    Runs in a worker thread, so it must only modify its own copy of the headers.
+    :param base_url: Toast API URL
+    :param headers: authentication headers, owned by this worker
+    :param r: restaurant record from the partners endpoint
+    :param progress: position of the restaurant in the list, for logging
+    :param first_pass: whether to call endpoints that don't have an end timestamp
+    :param timerange_params: startDate and endDate parameters
+    :param modified_params: modifiedStartDate and modifiedEndDate parameters
+    :param config_params: lastModified parameter for config endpoints
+    :return:
+    """
+    id = r["restaurantGuid"]
+    # rename some fields in response
+    r = dict(r)
+    rename_fields = [("restaurantGuid", "id"), ("restaurantName", "name")]
+    for old_name, new_name in rename_fields:
+        r[new_name] = r.pop(old_name)
+    log.info(f"***** starting restaurant {id}, {progress} ***** ")
+    # The 'upsert' operation inserts the data into the destination.
+    op.upsert(table="restaurant", data=r)
+
+    if r.get("deleted") and "id" in r:
+        op.delete(table="restaurant", keys={"id": r["id"]})
+
+    # config endpoints
+    # only process these on the first pass since they don't have an end timestamp
+    if first_pass:
+        for endpoint, table_name in CONFIG_ENDPOINTS:
+            process_config(base_url, headers, endpoint, table_name, id, config_params)
+
+        # no timerange_params, only sync during first pass
+        for endpoint, table_name in [
+            ("/labor/v1/jobs", "job"),
+            ("/labor/v1/employees", "employee"),
+        ]:
+            process_labor(base_url, headers, endpoint, table_name, id)
+
+    # cash management endpoints
+    process_cash(base_url, headers, "/cashmgmt/v1/entries", "cash_entry", id, timerange_params)
+    process_cash(base_url, headers, "/cashmgmt/v1/deposits", "cash_deposit", id, timerange_params)
+
+    # orders
+    process_orders(base_url, headers, "/orders/v2/ordersBulk", "orders", id, timerange_params)
+
+    # labor endpoints
+    # these two endpoints can only retrieve 30 days at a time
+    process_labor(base_url, headers, "/labor/v1/shifts", "shift", id, params=timerange_params)
+    process_labor(
+        base_url,
+        headers,
+        "/labor/v1/timeEntries",
+        "time_entry",
+        id,
+        params=modified_params,
+    )
+
+
 def process_config(base_url, headers, endpoint, table_name, rst_id, timerange):
     """
     This is the generating function for configuration endpoints for a restaurant and timerange
+    All pages of the response are collected first, and the upserts are skipped
+    when config_cache has seen the same records for this restaurant in the previous sync.
     :param base_url: Toast API URL
     :param headers: authentication headers
     :param endpoint: Toast API endpoint
@@ -189,6 +514,7 @@ def process_config(base_url, headers, endpoint, table_name, rst_id, timerange):
     headers["Toast-Restaurant-External-ID"] = rst_id
     more_data = True
     pagination = {}
+    records = []
     # fields_to_extract is a mapping of fields to extract from source data.
     # Keys represent table names, and values are lists of tuples.
     # Each tuple defines a mapping for one or more fields in the table:
@@ -217,7 +543,7 @@ def process_config(base_url, headers, endpoint, table_name, rst_id, timerange):
                 o = stringify_lists(o)
                 o["restaurant_id"] = rst_id
                 o = replace_guid_with_id(o)
-                op.upsert(table=table_name, data=o)
+                records.append(o)
 
             if next_token:
                 pagination["pageToken"] = next_token
@@ -231,6 +557,17 @@ def process_config(base_url, headers, endpoint, table_name, rst_id, timerange):
             detailed_message = f"Error Message: {exception_message}\nStack Trace:\n{stack_trace}"
             raise RuntimeError(detailed_message)
 
+    # nothing was modified since lastModified, keep the digest of the last upserted response
+    if not records:
+        return
+
+    if config_cache.is_unchanged(rst_id, table_name, ConfigCache.compute_digest(records)):
+        log.debug(f"restaurant {rst_id}: {endpoint} is unchanged, skipping {len(records)} upserts")
+        return
+
+    for o in records:
+        op.upsert(table=table_name, data=o)
+
 
 def process_labor(base_url, headers, endpoint, table_name, rst_id, params=None):
     """
@@ -748,8 +1085,14 @@ def get_api_response(endpoint_path, headers, **kwargs):
     max_retries_401 = 3  # Limit retries for 401 errors
     retry_count_401 = 0
 
+    endpoint_name = urlparse(endpoint_path).path
+
     while True:
+        # wait for the limiter shared by all restaurants before each request, including retries
+        rate_limiter.acquire()
+        request_start = time.monotonic()
         response = rq.get(endpoint_path, headers=headers, data=timerange_data, params=params)
+        request_elapsed = time.monotonic() - request_start
 
         # Handle 401 Unauthorized (retry up to max retries)
         if response.status_code == 401:
@@ -787,7 +1130,8 @@ def get_api_response(endpoint_path, headers, **kwargs):
 
             if wait_time:
                 log.info(f"Rate limit exceeded. Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+                # pause every worker, since the limit applies to the API client as a whole
+                rate_limiter.pause(wait_time)
                 continue  # Retry request
 
         # Handle 409 Conflict: Retry without pageToken
@@ -806,6 +1150,11 @@ def get_api_response(endpoint_path, headers, **kwargs):
         response_page = response.json()
         response_headers = response.headers
         next_page_token = response_headers.get("Toast-Next-Page-Token")
+        endpoint_stats.record(
+            endpoint_name,
+            request_elapsed,
+            len(response_page) if isinstance(response_page, list) else 1,
+        )
 
         return response_page, next_page_token  # Return successful response
 
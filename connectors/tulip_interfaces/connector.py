@@ -46,6 +46,10 @@ __RATE_LIMIT_RETRY_BASE_SECONDS = 5
 __MAX_RETRY_ATTEMPTS = 3
 __CURSOR_OVERLAP_SECONDS = 60
 __RATE_LIMIT_REQUESTS_PER_SECOND = 50  # Tulip API rate limit
+__RATE_LIMIT_BURST = 5  # Requests sent back to back after an idle period
+__RATE_LIMIT_MIN_REQUESTS_PER_SECOND = 1  # Lowest rate after repeated 429 responses
+__RATE_LIMIT_RECOVERY_STEP = 0.5  # Requests per second regained per successful response
+__UNIX_TIMESTAMP_THRESHOLD = 1_000_000_000  # Reset header values above this are timestamps
 
 # System columns that are always present in Tulip tables
 __SYSTEM_COLUMNS = {
@@ -60,50 +64,220 @@ __SYSTEM_FIELD_NAMES = ["id", "_createdAt", "_updatedAt", "_sequenceNumber"]
 
 
 class RateLimiter:
-    """Token bucket rate limiter for API requests.
+    """Adaptive token bucket rate limiter for API requests.
 
-    Implements a token bucket algorithm to limit requests to a specified rate.
-    Tulip API allows 50 requests per second.
+    Tokens are refilled continuously at the current rate, up to the burst capacity, and each
+    request takes one token. Threads that have to wait sleep outside the lock, so waiting never
+    blocks other threads from taking tokens that are already available.
+
+    Tulip API allows 50 requests per second. The refill rate is capped so that the burst plus one
+    second of refill never exceeds that limit. The rate is halved on every 429 response and lowered
+    further when the rate-limit headers report that the remaining quota cannot sustain it. It then
+    recovers gradually with each successful response.
     """
 
-    def __init__(self, requests_per_second):
+    def __init__(self, requests_per_second, burst, min_requests_per_second, recovery_step):
         """Initialize rate limiter.
 
         Args:
-            requests_per_second (int): Maximum number of requests allowed per second.
+            requests_per_second (int): Maximum number of requests allowed in any one second.
+            burst (int): Number of requests that may be sent back to back after an idle period.
+            min_requests_per_second (float): Lowest rate the limiter adapts down to.
+            recovery_step (float): Requests per second added to the rate per successful response.
         """
-        self.rate = requests_per_second
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = None
+        self.capacity = burst
+        self.max_rate = float(requests_per_second - burst)
+        self.min_rate = min_requests_per_second
+        self.recovery_step = recovery_step
+        self.rate = self.max_rate
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
         self.lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.current_second = int(time.monotonic())
+        self.current_second_count = 0
+        self.busy_seconds = 0
+        self.total_requests = 0
+        self.peak_requests_per_second = 0
+        self.throttled_responses = 0
+        self.total_wait_seconds = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def _record_request(self, now):
+        # Count requests per wall-clock second to report utilisation against the limit.
+        # Returns the message of the second that was closed, if any, to be logged without the lock.
+        second = int(now)
+        message = None
+        if second != self.current_second:
+            message = self._close_second()
+            self.current_second = second
+        self.current_second_count += 1
+        self.total_requests += 1
+        return message
+
+    def _close_second(self):
+        # Called with the lock held. The message is returned instead of logged, so that callers
+        # write it after releasing the lock and other threads never wait on the log output.
+        if self.current_second_count == 0:
+            return None
+        self.busy_seconds += 1
+        self.peak_requests_per_second = max(
+            self.peak_requests_per_second, self.current_second_count
+        )
+        message = (
+            f"Rate limiter: {self.current_second_count} requests in one second, "
+            f"{self.current_second_count / (self.max_rate + self.capacity):.0%} of the limit, "
+            f"current rate {self.rate:.1f}/s"
+        )
+        self.current_second_count = 0
+        return message
 
     def acquire(self):
         """Acquire permission to make a request.
 
-        Blocks if necessary to maintain the rate limit using a fixed-window approach
-        to ensure we never exceed the specified requests per second.
+        Blocks until a token is available. The lock is only held to update the bucket, and
+        the thread sleeps without it until the next token is due or a pause has ended.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait_time = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        second_message = self._record_request(now)
+                        break
+                    wait_time = (1 - self.tokens) / self.rate
+                self.total_wait_seconds += wait_time
+            time.sleep(wait_time)
+        # Leaving the loop released the lock, so the message is logged without holding it
+        if second_message:
+            log.debug(second_message)
+
+    def pause(self, seconds):
+        """Stop handing out tokens to all threads for the given number of seconds.
+
+        Args:
+            seconds (float): Duration of the pause.
         """
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + seconds)
+            # Do not let a burst of queued requests hit the API the moment the pause ends
+            self.tokens = 0.0
+            self.last_refill = self.paused_until
+
+    def update_from_response(self, response):
+        """Adapt the rate to a response from the API.
+
+        A 429 response halves the rate. The standard rate-limit headers (X-RateLimit-Remaining
+        and X-RateLimit-Reset, or their RateLimit-* equivalents) lower the rate to what the
+        remaining quota can sustain until the reset, and an exhausted quota pauses all threads
+        until the reset. Any other response lets the rate recover towards the maximum.
+
+        Args:
+            response (requests.Response): Response of a request made after acquire().
+        """
+        remaining = _parse_header_number(
+            response.headers, "X-RateLimit-Remaining", "RateLimit-Remaining"
+        )
+        reset_seconds = _parse_reset_seconds(response.headers)
+
+        with self.lock:
+            if response.status_code == 429:
+                self.throttled_responses += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+                log.warning(f"Rate limited by the API, lowering request rate to {self.rate:.1f}/s")
+            else:
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+            if remaining is not None and reset_seconds is not None and reset_seconds > 0:
+                quota_rate = remaining / reset_seconds
+                if quota_rate < self.rate:
+                    self.rate = max(self.min_rate, quota_rate)
+                if remaining < 1:
+                    now = time.monotonic()
+                    self.paused_until = max(self.paused_until, now + reset_seconds)
+                    self.tokens = 0.0
+                    self.last_refill = self.paused_until
+
+    def log_summary(self):
+        """Log the request rate and utilisation of the limit since the last summary."""
+        summary = None
+        with self.lock:
+            second_message = self._close_second()
+            limit = self.max_rate + self.capacity
+            if self.busy_seconds:
+                average = self.total_requests / self.busy_seconds
+                summary = (
+                    f"Rate limiter: {self.total_requests} requests over {self.busy_seconds} active seconds, "
+                    f"average {average:.1f}/s ({average / limit:.0%} of the {limit:.0f}/s limit), "
+                    f"peak {self.peak_requests_per_second}/s, "
+                    f"{self.throttled_responses} rate-limited responses, "
+                    f"{self.total_wait_seconds:.1f}s spent waiting for tokens"
+                )
+            self._reset_stats()
+        if second_message:
+            log.debug(second_message)
+        if summary:
+            log.info(summary)
 
-            # Allow first request immediately
-            if self.last_request_time is None:
-                self.last_request_time = now
-                return
 
-            time_since_last = now - self.last_request_time
+def _parse_header_number(headers, *names):
+    """Return the first of the given headers that holds a number, or None.
+
+    Args:
+        headers (Mapping): Response headers.
+        *names (str): Header names to try, in order.
+
+    Returns:
+        float: The header value, or None if no header is present or numeric.
+    """
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
 
-            # If not enough time has passed, sleep
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                time.sleep(sleep_time)
 
-            # Update last request time
-            self.last_request_time = time.time()
+def _parse_reset_seconds(headers):
+    """Return the number of seconds until the rate-limit quota resets, or None.
+
+    The reset header is either a delay in seconds or, with large values, a Unix timestamp.
+
+    Args:
+        headers (Mapping): Response headers.
+
+    Returns:
+        float: Seconds until the reset, or None if the header is missing.
+    """
+    reset = _parse_header_number(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+    if reset is None:
+        return None
+    if reset > __UNIX_TIMESTAMP_THRESHOLD:
+        return max(0.0, reset - time.time())
+    return reset
 
 
 # Global rate limiter instance
-_rate_limiter = RateLimiter(__RATE_LIMIT_REQUESTS_PER_SECOND)
+_rate_limiter = RateLimiter(
+    __RATE_LIMIT_REQUESTS_PER_SECOND,
+    __RATE_LIMIT_BURST,
+    __RATE_LIMIT_MIN_REQUESTS_PER_SECOND,
+    __RATE_LIMIT_RECOVERY_STEP,
+)
 
 
 def generate_column_name(field_id, field_label=None):
@@ -355,13 +529,21 @@ def _fetch_with_retry(url, auth, params=None, max_retries=__MAX_RETRY_ATTEMPTS):
 
             response = requests.get(url, auth=auth, params=params)
 
-            # Handle 429 rate limiting with retry
+            # Adapt the request rate to the response and its rate-limit headers
+            _rate_limiter.update_from_response(response)
+
+            # Handle 429 rate limiting with retry, pausing all threads until the limit resets
             if response.status_code == 429:
-                wait_time = __RATE_LIMIT_RETRY_BASE_SECONDS * (2**attempt)
+                retry_after = _parse_header_number(response.headers, "Retry-After")
+                wait_time = (
+                    retry_after
+                    if retry_after is not None
+                    else __RATE_LIMIT_RETRY_BASE_SECONDS * (2**attempt)
+                )
                 log.warning(
                     f"Rate limited. Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
                 )
-                time.sleep(wait_time)
+                _rate_limiter.pause(wait_time)
                 continue
 
             # Success case
@@ -981,6 +1163,7 @@ def update(configuration: dict, state: dict):
         log.info(
             f"Sync completed in {cursor_mode} mode. Total records processed: {records_processed}"
         )
+        _rate_limiter.log_summary()
 
     except json.JSONDecodeError as e:
         log.error(f"Invalid custom_filter_json format: {e}")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+High Volume CSV Emission Benchmark
+Compares the row-by-row upsert loop against the columnar batch upsert path for Dask, Pandas with PyArrow, and Polars.
+
+The benchmark generates a local CSV file and replaces op.upsert with a counting sink, so the timings only include
+reading the CSV and building the records that would be passed to op.upsert. No network access or Fivetran
+environment is required.
+
+Usage:
+    python benchmark.py --rows 1000000
+"""
+
+# For parsing command line arguments
+import argparse
+
+# For generating the CSV file
+import csv
+import os
+import tempfile
+
+# For measuring the elapsed time
+import time
+
+# For processing high volume CSV files
+import dask.dataframe as dd
+import polars as pl
+import pandas as pd
+
+# The connector module under benchmark
+import connector
+
+
+class CountingOperations:
+    """
+    Stand-in for fivetran_connector_sdk.Operations that only counts the records it receives.
+    """
+
+    def __init__(self):
+        self.upsert_count = 0
+
+    def upsert(self, table, data):
+        self.upsert_count += 1
+
+    def checkpoint(self, state):
+        pass
+
+
+def generate_csv(row_count: int) -> str:
+    """
+    Generate a CSV file with the columns expected by the connector.
+    Args:
+        row_count: Number of rows to write
+    Returns:
+        str: Path to the generated CSV file
+    """
+    with tempfile.NamedTemporaryFile(
+        delete=False, suffix=".csv", mode="w", encoding="utf-8", newline=""
+    ) as temp_file:
+        writer = csv.writer(temp_file)
+        writer.writerow(["has_id", "name", "city", "created_at"])
+        for index in range(row_count):
+            writer.writerow(
+                [f"id_{index}", f"name_{index}", f"city_{index % 500}", "2024-01-01T00:00:00Z"]
+            )
+        return temp_file.name
+
+
+def row_loop_with_dask(csv_path: str, table_name: str, state):
+    """
+    Baseline: the row-by-row Dask loop using itertuples() and _asdict().
+    """
+    dataframe = dd.read_csv(
+        csv_path,
+        blocksize="128MB",
+        dtype={"has_id": "object", "name": "object", "city": "object", "created_at": "object"},
+        usecols=["has_id", "name", "city", "created_at"],
+        assume_missing=True,
+    )
+    for part_index in range(dataframe.npartitions):
+        part_df = dataframe.get_partition(part_index).compute()
+        for row in part_df.itertuples(index=False):
+            connector.op.upsert(table=table_name, data=row._asdict())
+    connector.op.checkpoint(state)
+
+
+def row_loop_with_pandas_pyarrow(csv_path: str, table_name: str, state):
+    """
+    Baseline: the row-by-row Pandas loop using itertuples() and a hand-built dictionary.
+    """
+    string_data_type = "string[pyarrow]"
+    dataframe = pd.read_csv(
+        csv_path,
+        engine="pyarrow",
+        usecols=["has_id", "name", "city", "created_at"],
+        dtype={
+            "has_id": string_data_type,
+            "name": string_data_type,
+            "city": string_data_type,
+            "created_at": string_data_type,
+        },
+    )
+    for row in dataframe.itertuples(index=False):
+        record = {
+            "has_id": row.has_id,
+            "name": row.name,
+            "city": row.city,
+            "created_at": row.created_at,
+        }
+        connector.op.upsert(table=table_name, data=record)
+    connector.op.checkpoint(state)
+
+
+def row_loop_with_polars(csv_path: str, table_name: str, state):
+    """
+    Baseline: the row-by-row Polars loop using iter_rows(named=True).
+    """
+    csv_reader = pl.read_csv_batched(
+        csv_path,
+        has_header=True,
+        columns=["has_id", "name", "city", "created_at"],
+        low_memory=True,
+    )
+    while True:
+        batches = csv_reader.next_batches(1)
+        if not batches:
+            break
+        for row in batches[0].iter_rows(named=True):
+            connector.op.upsert(table=table_name, data=row)
+    connector.op.checkpoint(state)
+
+
+def run_benchmark(name: str, upsert_function, csv_path: str) -> float:
+    """
+    Run one upsert function against the counting sink and print its throughput.
+    Args:
+        name: Label printed in the results
+        upsert_function: Function with the (csv_path, table_name, state) signature
+        csv_path: Path to the CSV file
+    Returns:
+        float: Elapsed time in seconds
+    """
+    operations = CountingOperations()
+    connector.op = operations
+    start_time = time.perf_counter()
+    upsert_function(csv_path, table_name="benchmark", state={})
+    elapsed = time.perf_counter() - start_time
+    rows_per_second = operations.upsert_count / elapsed if elapsed else 0
+    print(
+        f"{name:<28} {operations.upsert_count:>12,} rows {elapsed:>9.2f}s {rows_per_second:>14,.0f} rows/s"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row and batch emission paths")
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Number of CSV rows to generate"
+    )
+    arguments = parser.parse_args()
+
+    csv_path = generate_csv(arguments.rows)
+    try:
+        engines = [
+            ("dask", row_loop_with_dask, connector.upsert_with_dask),
+            ("pandas_pyarrow", row_loop_with_pandas_pyarrow, connector.upsert_with_pandas_pyarrow),
+            ("polars", row_loop_with_polars, connector.upsert_with_polars),
+        ]
+        for engine_name, row_function, batch_function in engines:
+            row_elapsed = run_benchmark(f"{engine_name} (row loop)", row_function, csv_path)
+            batch_elapsed = run_benchmark(f"{engine_name} (batch)", batch_function, csv_path)
+            print(f"{engine_name} speedup: {row_elapsed / batch_elapsed:.2f}x\n")
+    finally:
+        os.remove(csv_path)
+
+
+if __name__ == "__main__":
+    main()
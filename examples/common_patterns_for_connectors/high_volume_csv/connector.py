@@ -43,6 +43,7 @@ __INITIAL_RETRY_DELAY = 1  # Initial delay in seconds for retries
 __MAX_RETRY_DELAY = 16  # Maximum delay in seconds between retries
 __PYARROW_STRING_DATA_TYPE = "string[pyarrow]"
 __DASK_BLOCK_SIZE = "128MB"
+__EMIT_BATCH_SIZE = 100_000  # Number of rows converted from columnar to Python values at a time
 
 
 def validate_configuration(configuration: dict):
@@ -187,9 +188,43 @@ def delete_file(file_path: str):
         log.warning(f"Error deleting file {file_path}: {e}")
 
 
+def upsert_column_batch(table_name: str, column_names: list, columns: list):
+    """
+    Upsert a batch of rows that is held in columnar form.
+    Each column is converted to a list of Python values once for the whole batch, and the rows are then assembled by
+    zipping the columns together. This avoids the per-row namedtuple or named-row conversions done by itertuples() and
+    iter_rows(named=True), so the only per-row allocation left is the dictionary passed to op.upsert.
+    Args:
+        table_name: Name of the target table
+        column_names: List of column names, in the same order as columns
+        columns: List of column value lists, all of the same length
+    """
+    for values in zip(*columns):
+        # The 'upsert' operation is used to insert or update data in the destination table.
+        # The op.upsert method is called with two arguments:
+        # - The first argument is the name of the table to upsert the data into.
+        # - The second argument is a dictionary containing the data to be upserted
+        op.upsert(table=table_name, data=dict(zip(column_names, values)))
+
+
+def upsert_dataframe_in_batches(dataframe: pd.DataFrame, table_name: str):
+    """
+    Upsert a pandas DataFrame in slices of __EMIT_BATCH_SIZE rows using the columnar batch path.
+    Slicing bounds the number of Python objects created at a time, even when the DataFrame itself is large.
+    Args:
+        dataframe: Pandas DataFrame to upsert
+        table_name: Name of the target table
+    """
+    column_names = list(dataframe.columns)
+    for start in range(0, len(dataframe), __EMIT_BATCH_SIZE):
+        batch_dataframe = dataframe.iloc[start : start + __EMIT_BATCH_SIZE]
+        columns = [batch_dataframe[column].tolist() for column in column_names]
+        upsert_column_batch(table_name=table_name, column_names=column_names, columns=columns)
+
+
 def upsert_with_dask(csv_path: str, table_name: str, state):
     """
-    Upsert using Dask, one row at a time, in a scalable way.
+    Upsert using Dask, one partition at a time, in a scalable way.
     Args:
         csv_path: Path to the CSV file
         table_name: Name of the target table
@@ -215,14 +250,8 @@ def upsert_with_dask(csv_path: str, table_name: str, state):
         if part_df.empty:
             continue
 
-        # Upsert each row in the partition. Using itertuples for efficient row iteration.
-        for row in part_df.itertuples(index=False):
-            record = row._asdict()  # Convert namedtuple to dictionary for upserting
-            # The 'upsert' operation is used to insert or update data in the destination table.
-            # The op.upsert method is called with two arguments:
-            # - The first argument is the name of the table to upsert the data into.
-            # - The second argument is a dictionary containing the data to be upserted
-            op.upsert(table=table_name, data=record)
+        # Upsert the partition using the columnar batch path instead of iterating rows with itertuples()
+        upsert_dataframe_in_batches(dataframe=part_df, table_name=table_name)
 
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
     # from the correct position in case of next sync or interruptions.
@@ -234,7 +263,7 @@ def upsert_with_dask(csv_path: str, table_name: str, state):
 
 def upsert_with_polars(csv_path: str, table_name: str, state):
     """
-    Upsert using Polars, one row at a time, in a scalable way.
+    Upsert using Polars, one batch at a time, in a scalable way.
     It is recommended to use Polars for high-volume CSV processing due to its performance and low memory usage.
     Args:
         csv_path: Path to the CSV file
@@ -260,13 +289,11 @@ def upsert_with_polars(csv_path: str, table_name: str, state):
 
         batch_dataframe = batches[0]
 
-        # Upsert each row in the batch
-        for row in batch_dataframe.iter_rows(named=True):
-            # The 'upsert' operation is used to insert or update data in the destination table.
-            # The op.upsert method is called with two arguments:
-            # - The first argument is the name of the table to upsert the data into.
-            # - The second argument is a dictionary containing the data to be upserted
-            op.upsert(table=table_name, data=row)
+        # Convert each column of the batch to Python values once and upsert the rows from the columns.
+        # This is considerably cheaper than iter_rows(named=True), which builds a dictionary inside Polars for every row.
+        column_names = batch_dataframe.columns
+        columns = [series.to_list() for series in batch_dataframe.get_columns()]
+        upsert_column_batch(table_name=table_name, column_names=column_names, columns=columns)
 
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
     # from the correct position in case of next sync or interruptions.
@@ -278,7 +305,7 @@ def upsert_with_polars(csv_path: str, table_name: str, state):
 
 def upsert_with_pandas_pyarrow(csv_path: str, table_name: str, state):
     """
-    Upsert using Pandas with PyArrow engine, one row at a time.
+    Upsert using Pandas with PyArrow engine, one batch of rows at a time.
     Args:
         csv_path: Path to the CSV file
         table_name: Name of the target table
@@ -296,20 +323,8 @@ def upsert_with_pandas_pyarrow(csv_path: str, table_name: str, state):
         },
     )
 
-    # Upsert each row in the DataFrame. Using itertuples for efficient row iteration.
-    for row in dataframe.itertuples(index=False):
-        # Prepare the record for upserting
-        record = {
-            "has_id": row.has_id,
-            "name": row.name,
-            "city": row.city,
-            "created_at": row.created_at,
-        }
-        # The 'upsert' operation is used to insert or update data in the destination table.
-        # The op.upsert method is called with two arguments:
-        # - The first argument is the name of the table to upsert the data into.
-        # - The second argument is a dictionary containing the data to be upserted
-        op.upsert(table=table_name, data=record)
+    # Upsert the DataFrame in slices using the columnar batch path instead of iterating rows with itertuples()
+    upsert_dataframe_in_batches(dataframe=dataframe, table_name=table_name)
 
     # Save the progress by checkpointing the state. This is important for ensuring that the sync process can resume
     # from the correct position in case of next sync or interruptions.